@@ -5,9 +5,25 @@ import re
 from urllib import request as urlrequest, error as urlerror
 from urllib.parse import quote as url_quote, urlparse
 from functools import wraps
-from flask import Flask, jsonify, request, abort, send_from_directory, render_template_string, Response, send_file, redirect
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
+from flask import Flask, jsonify, request, abort, send_from_directory, render_template_string, Response, send_file, redirect, g, has_request_context, copy_current_request_context, stream_with_context
 import optimizer as dash_optimizer
-from runtime_stats import get_docker_stats
+from runtime_stats import add_stats_listener, get_docker_stats, start_docker_stats_sampler
+from metrics_store import HOST_KEY as METRICS_HOST_KEY, METRICS_STORE
+from container_index import CONTAINER_INDEX, LIFECYCLE_ACTIONS, start_container_index
+from inventory_cache import INVENTORY_CACHE
+from revision_log import INVENTORY_REVISIONS, payload_digest
+from event_bus import EVENT_BUS, format_sse
+from request_snapshot import RequestSnapshot
+from config_snapshot import CONFIG_FILES, parse_env_text, parse_json_text
+from auth_cache import FORWARD_AUTH_CACHE, token_digest
+from db_pool import SQLitePool
+from password_hashing import PASSWORD_HASHER, PasswordHasherBusy
+from session_cache import SESSION_TOKENS
+from job_scheduler import JOB_SCHEDULER, PRIORITY_INTERACTIVE, PRIORITY_MAINTENANCE, PRIORITY_NORMAL
+from job_logs import JOB_ID_RE, JobLogStore
+from job_leases import JobLeases
+from vm_readiness import ReadinessWaiter
 import hmac, hashlib, time, base64
 from branding import PRODUCT_NAME, DASHBOARD_TITLE, MANAGER_NAME, AUTH_REALM
 try:
@@ -110,9 +126,8 @@ def admin_auth_required(fn):
         user, password = _admin_credentials()
         if not user or not password or not _dashboard_secret():
             return jsonify({'ok': False, 'error': 'Dashboard authentication is not configured'}), 503
-        basic_ok = check_auth(request.headers.get('Authorization'))
-        token_ok = _verify_v2_token(request.cookies.get('Dashboard-Auth', ''))
-        if not (basic_ok or token_ok):
+        authorized = check_auth(request.headers.get('Authorization')) or _verify_v2_token(request.cookies.get('Dashboard-Auth', ''))
+        if not authorized:
             return Response('Auth required', 401, {'WWW-Authenticate': f'Basic realm="{AUTH_REALM}"'})
         if request.method not in ('GET', 'HEAD', 'OPTIONS') and not _same_origin_request():
             return jsonify({'ok': False, 'error': 'Cross-origin request rejected'}), 403
@@ -200,6 +215,55 @@ def _vm_host(host_id=None):
     return VM_HOST_REGISTRY.get(host_id)
 
 
+def _invalidate_inventory(host=None):
+    """Drop the cached inventory for a provider or host id (every host when None)."""
+    if host is not None and not isinstance(host, str):
+        host = getattr(host, 'host_id', None) or 'local'
+    INVENTORY_CACHE.invalidate(host)
+    snapshot = _request_snapshot()
+    if snapshot is not None:
+        snapshot.clear()
+
+
+def _request_snapshot():
+    """The current request's `RequestSnapshot`, or None outside a request."""
+    if not has_request_context():
+        return None
+    snapshot = getattr(g, 'snapshot', None)
+    if snapshot is None:
+        snapshot = g.snapshot = RequestSnapshot()
+    return snapshot
+
+
+def _snapshot_value(key, loader, private=False):
+    snapshot = _request_snapshot()
+    if snapshot is None:
+        return loader()
+    return snapshot.get(key, loader, private=private)
+
+
+def _optimizer_status():
+    """`dash_optimizer.status()`, gathered at most once per request."""
+    return _snapshot_value('optimizer-status', lambda: dash_optimizer.status())
+
+
+# Any lifecycle or health change of a local VM container (the index drops
+# exec/attach/resize noise before listeners run) changes the list.
+CONTAINER_INDEX.add_listener(lambda action, name, entry: INVENTORY_CACHE.invalidate('local'))
+
+# State and health events wake anyone waiting for that VM to come up.
+VM_READINESS = ReadinessWaiter()
+CONTAINER_INDEX.add_listener(
+    lambda action, name, entry: VM_READINESS.notify(name[len('blobevm_'):]) if name.startswith('blobevm_') else None
+)
+try:
+    VM_READY_TIMEOUT = max(0.0, float(os.environ.get('BLOBEVM_VM_READY_TIMEOUT', '45')))
+except ValueError:
+    VM_READY_TIMEOUT = 45.0
+# /dashboard/api/check waits on the request thread; keep it near the old ~8 s.
+CHECK_READY_TIMEOUT = 8.0
+
+
 def _vm_host_error_response(exc):
     """Normalize provider errors without turning remote 404/409 into 500s."""
     status = int(getattr(exc, 'status', 503) or 503)
@@ -1085,8 +1149,11 @@ def _sign_v2_token(payload: str) -> str:
 def _verify_v2_token(token_b64: str) -> bool:
     try:
         secret = _dashboard_secret()
-        if not secret:
+        if not secret or not token_b64:
             return False
+        if SESSION_TOKENS.get('dashboard', secret, token_b64):
+            return True
+        generation = SESSION_TOKENS.generation()
         raw = base64.urlsafe_b64decode(token_b64.encode('utf-8')).decode('utf-8')
         parts = raw.rsplit(':', 1)
         if len(parts) != 2:
@@ -1098,7 +1165,10 @@ def _verify_v2_token(token_b64: str) -> bool:
         # payload format: expiry:random
         exp_str = payload.split(':',1)[0]
         exp = int(exp_str)
-        return time.time() < exp
+        if time.time() >= exp:
+            return False
+        SESSION_TOKENS.put('dashboard', secret, token_b64, exp, True, generation)
+        return True
     except Exception:
         return False
 
@@ -1111,72 +1181,95 @@ def _portal_secret() -> str:
 def _users_db_path():
     return os.path.join(_state_dir(), 'dashboard_users.sqlite3')
 
+def _migrate_users_db(conn):
+    conn.executescript('''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL UNIQUE,
+        password_hash TEXT NOT NULL,
+        is_admin INTEGER NOT NULL DEFAULT 0,
+        disabled INTEGER NOT NULL DEFAULT 0,
+        created_at INTEGER NOT NULL DEFAULT (strftime('%s','now'))
+    );
+    CREATE TABLE IF NOT EXISTS user_vm_access (
+        user_id INTEGER NOT NULL,
+        vm_name TEXT NOT NULL,
+        PRIMARY KEY (user_id, vm_name),
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    );
+    CREATE TABLE IF NOT EXISTS access_requests (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL,
+        vm_name TEXT NOT NULL,
+        note TEXT NOT NULL DEFAULT '',
+        status TEXT NOT NULL DEFAULT 'pending',
+        created_at INTEGER NOT NULL DEFAULT (strftime('%s','now'))
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS one_pending_access_request
+    ON access_requests(username, vm_name) WHERE status = 'pending';
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        type TEXT NOT NULL,
+        targets TEXT NOT NULL DEFAULT '[]',
+        status TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        started_at INTEGER,
+        finished_at INTEGER,
+        progress TEXT NOT NULL DEFAULT '',
+        output TEXT NOT NULL DEFAULT '',
+        error TEXT NOT NULL DEFAULT '',
+        parent_id TEXT,
+        payload TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        lease_owner TEXT,
+        lease_expires_at INTEGER,
+        heartbeat_at INTEGER
+    );
+    CREATE INDEX IF NOT EXISTS jobs_created_at ON jobs(created_at);
+    CREATE INDEX IF NOT EXISTS user_vm_access_vm_name ON user_vm_access(vm_name);
+    CREATE INDEX IF NOT EXISTS access_requests_status ON access_requests(status);
+    ''')
+    # Older databases predate bulk sub-jobs and job leases.
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(jobs)')}
+    for column, ddl in JOB_COLUMNS_ADDED:
+        if column not in columns:
+            conn.execute(f'ALTER TABLE jobs ADD COLUMN {column} {ddl}')
+    conn.execute('CREATE INDEX IF NOT EXISTS jobs_parent_id ON jobs(parent_id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status)')
+
+
+JOB_COLUMNS_ADDED = (
+    ('parent_id', 'TEXT'),
+    ('payload', 'TEXT'),
+    ('attempts', 'INTEGER NOT NULL DEFAULT 0'),
+    ('lease_owner', 'TEXT'),
+    ('lease_expires_at', 'INTEGER'),
+    ('heartbeat_at', 'INTEGER'),
+)
+
+
+# WAL connections are reused across requests and job threads; the schema
+# script runs once per database file instead of on every helper call.
+USERS_DB = SQLitePool(migrate=_migrate_users_db)
+
+
 def _users_conn():
-    conn = sqlite3.connect(_users_db_path())
-    conn.row_factory = sqlite3.Row
-    return conn
+    return USERS_DB.connect(_users_db_path())
 
 def _init_users_db():
+    USERS_DB.ensure_schema(_users_db_path())
+
+def _hash_user_password(password: str, salt: str | None = None) -> str:
+    return PASSWORD_HASHER.hash(password, salt)
+
+def _rehash_user_password(user_id, new_hash: str):
     conn = _users_conn()
     try:
-        conn.executescript('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT NOT NULL UNIQUE,
-            password_hash TEXT NOT NULL,
-            is_admin INTEGER NOT NULL DEFAULT 0,
-            disabled INTEGER NOT NULL DEFAULT 0,
-            created_at INTEGER NOT NULL DEFAULT (strftime('%s','now'))
-        );
-        CREATE TABLE IF NOT EXISTS user_vm_access (
-            user_id INTEGER NOT NULL,
-            vm_name TEXT NOT NULL,
-            PRIMARY KEY (user_id, vm_name),
-            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-        );
-        CREATE TABLE IF NOT EXISTS access_requests (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT NOT NULL,
-            vm_name TEXT NOT NULL,
-            note TEXT NOT NULL DEFAULT '',
-            status TEXT NOT NULL DEFAULT 'pending',
-            created_at INTEGER NOT NULL DEFAULT (strftime('%s','now'))
-        );
-        CREATE UNIQUE INDEX IF NOT EXISTS one_pending_access_request
-        ON access_requests(username, vm_name) WHERE status = 'pending';
-        CREATE TABLE IF NOT EXISTS jobs (
-            id TEXT PRIMARY KEY,
-            type TEXT NOT NULL,
-            targets TEXT NOT NULL DEFAULT '[]',
-            status TEXT NOT NULL,
-            created_at INTEGER NOT NULL,
-            started_at INTEGER,
-            finished_at INTEGER,
-            progress TEXT NOT NULL DEFAULT '',
-            output TEXT NOT NULL DEFAULT '',
-            error TEXT NOT NULL DEFAULT ''
-        );
-        ''')
+        conn.execute('UPDATE users SET password_hash = ? WHERE id = ?', (new_hash, user_id))
         conn.commit()
     finally:
         conn.close()
 
-def _hash_user_password(password: str, salt: str | None = None) -> str:
-    if salt is None:
-        salt = secrets.token_hex(16)
-    dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 260000)
-    return f"pbkdf2_sha256${salt}${base64.b64encode(dk).decode('ascii')}"
-
-def _verify_user_password(password: str, stored: str) -> bool:
-    try:
-        algo, salt, digest = stored.split('$', 2)
-        if algo != 'pbkdf2_sha256':
-            return False
-        actual = _hash_user_password(password, salt).split('$', 2)[2]
-        return hmac.compare_digest(actual, digest)
-    except Exception:
-        return False
-
 def _normalize_vm_names(vms):
     out = []
     seen = set()
@@ -1203,20 +1296,27 @@ def _validate_known_vm_names(names):
     if missing:
         raise ValueError('Unknown VM: ' + ', '.join(missing))
 
-def _job_row_to_dict(row):
+def _job_row_to_dict(row, positions=None):
     result = dict(row)
     result['targets'] = json.loads(result.get('targets') or '[]')
+    result.pop('payload', None)
+    if result.get('status') == 'queued':
+        position = (positions if positions is not None else JOB_SCHEDULER.positions()).get(result['id'])
+        if position:
+            result['queuePosition'] = position
     return result
 
-def _create_job(job_type: str, targets=None):
+def _create_job(job_type: str, targets=None, parent_id=None, payload=None):
     _init_users_db()
     job_id = secrets.token_urlsafe(18)
     now = int(time.time())
     conn = _users_conn()
     try:
         conn.execute(
-            'INSERT INTO jobs (id, type, targets, status, created_at, progress) VALUES (?, ?, ?, ?, ?, ?)',
-            (job_id, job_type, json.dumps(_normalize_vm_names(targets)), 'queued', now, 'Queued'),
+            'INSERT INTO jobs (id, type, targets, status, created_at, progress, parent_id, payload, lease_owner, lease_expires_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (job_id, job_type, json.dumps(_normalize_vm_names(targets)), 'queued', now, 'Queued', parent_id,
+             None if payload is None else json.dumps(payload), JOB_LEASES.owner, JOB_LEASES.expires_at()),
         )
         conn.commit()
     finally:
@@ -1228,11 +1328,12 @@ def _update_job(job_id: str, *, status=None, progress=None, output=None, error=N
     for key, value in (('status', status), ('progress', progress), ('output', output), ('error', error)):
         if value is not None:
             fields.append(f'{key} = ?')
-            values.append(str(value)[:16000])
+            # The end of a build log is the useful part; the full text is in the job log.
+            values.append(str(value)[-16000:] if key in ('output', 'error') else str(value)[:16000])
     if status == 'running':
-        fields.append('started_at = ?')
-        values.append(int(time.time()))
-    if status in ('succeeded', 'failed'):
+        fields.extend(('started_at = ?', 'attempts = attempts + 1', 'lease_owner = ?', 'lease_expires_at = ?', 'heartbeat_at = ?'))
+        values.extend((int(time.time()), JOB_LEASES.owner, JOB_LEASES.expires_at(), int(time.time())))
+    if status in ('succeeded', 'failed', 'cancelled'):
         fields.append('finished_at = ?')
         values.append(int(time.time()))
     if not fields:
@@ -1244,23 +1345,364 @@ def _update_job(job_id: str, *, status=None, progress=None, output=None, error=N
         conn.commit()
     finally:
         conn.close()
+    EVENT_BUS.publish('job', {
+        key: value for key, value in (('id', job_id), ('status', status), ('progress', progress), ('error', error))
+        if value is not None
+    })
+
+JOB_LOGS = JobLogStore(lambda: os.path.join(_state_dir(), 'dashboard', 'job-logs'))
+# Which job (if any) the current worker thread is running, so manager calls
+# made from job code stream into that job's log.
+_JOB_CONTEXT = threading.local()
+# Queued and running rows carry this process's lease; see _recover_orphaned_jobs.
+JOB_LEASES = JobLeases()
+try:
+    JOB_MAX_ATTEMPTS = max(1, int(os.environ.get('BLOBEVM_JOB_MAX_ATTEMPTS', '3')))
+except ValueError:
+    JOB_MAX_ATTEMPTS = 3
+# job type -> handler(job_id, payload) for jobs that can be rebuilt from their
+# row and re-queued after a restart; see _enqueue_job.
+JOB_HANDLERS = {}
+# Transient per-VM flags a job may leave behind if its process dies.
+JOB_VM_FLAGS = ('rebuilding', 'updating')
+
+
+def _job_handler(*job_types):
+    def register(handler):
+        for job_type in job_types:
+            JOB_HANDLERS[job_type] = handler
+        return handler
+    return register
+
+
+def _job_run_manager(host, *args):
+    """`host.run_manager(*args, capture_output=True, text=True)` that streams into the current job's log."""
+    job_id = getattr(_JOB_CONTEXT, 'job_id', None)
+    stream = getattr(host, 'stream_manager', None)
+    if job_id and stream is not None:
+        return stream(*args, on_output=lambda line: JOB_LOGS.append(job_id, line))
+    result = host.run_manager(*args, capture_output=True, text=True)
+    if job_id:
+        JOB_LOGS.append(job_id, (result.stdout or '') + (result.stderr or ''))
+    return result
+
+
+def _job_progress(message):
+    """Report progress for the job running in this thread (no-op outside jobs)."""
+    job_id = getattr(_JOB_CONTEXT, 'job_id', None)
+    if job_id:
+        JOB_LOGS.append(job_id, message + '\n')
+        _update_job(job_id, progress=message)
+
+
+# Bulk maintenance yields to short per-VM jobs when both are waiting.
+JOB_PRIORITIES = {
+    'update-vm': PRIORITY_INTERACTIVE,
+    'recover-vm': PRIORITY_INTERACTIVE,
+    'escalate-vm': PRIORITY_INTERACTIVE,
+    'rebuild-vms': PRIORITY_MAINTENANCE,
+    'update-and-rebuild': PRIORITY_MAINTENANCE,
+    'delete-all-instances': PRIORITY_MAINTENANCE,
+    'reset-all-instances': PRIORITY_MAINTENANCE,
+    'prune-blobevm-resources': PRIORITY_MAINTENANCE,
+    'optimizer-clean-blobevm-resources': PRIORITY_MAINTENANCE,
+    'bulk-recreate': PRIORITY_MAINTENANCE,
+    'bulk-reset': PRIORITY_MAINTENANCE,
+    'vm-recreate': PRIORITY_MAINTENANCE,
+    'vm-reset': PRIORITY_MAINTENANCE,
+}
+
+
+def _run_job(job_id, work):
+    """Run `work` as job `job_id` in this thread, streaming into its log; return the final status."""
+    _update_job(job_id, status='running', progress='Running')
+    JOB_LOGS.open(job_id)
+    _JOB_CONTEXT.job_id = job_id
+    try:
+        result = work()
+        if isinstance(result, tuple):
+            ok, output = result
+        else:
+            ok, output = True, result or ''
+        if not JOB_LOGS.size(job_id):
+            # Work that did not stream (docker prune, remote hosts) still gets a log.
+            JOB_LOGS.append(job_id, output or '')
+        _update_job(job_id, status='succeeded' if ok else 'failed', progress='Completed' if ok else 'Failed', output=output or '', error='' if ok else output or 'Operation failed')
+        return 'succeeded' if ok else 'failed'
+    except Exception as exc:
+        JOB_LOGS.append(job_id, f'\n{exc}\n')
+        _update_job(job_id, status='failed', progress='Failed', error=str(exc))
+        return 'failed'
+    finally:
+        _JOB_CONTEXT.job_id = None
+        JOB_LOGS.close(job_id)
+        _invalidate_inventory()
+
 
-def _start_job(job_type: str, targets, work):
-    job_id = _create_job(job_type, targets)
-    def runner():
-        _update_job(job_id, status='running', progress='Running')
+def _job_host_id(host):
+    if host is None:
         try:
-            result = work()
-            if isinstance(result, tuple):
-                ok, output = result
-            else:
-                ok, output = True, result or ''
-            _update_job(job_id, status='succeeded' if ok else 'failed', progress='Completed' if ok else 'Failed', output=output or '', error='' if ok else output or 'Operation failed')
-        except Exception as exc:
-            _update_job(job_id, status='failed', progress='Failed', error=str(exc))
-    threading.Thread(target=runner, daemon=True).start()
+            host = _vm_host()
+        except Exception:
+            host = None
+    return host if isinstance(host, str) else (getattr(host, 'host_id', None) or 'local')
+
+
+def _submit_job(job_id, job_type: str, work, host=None, priority=None):
+    JOB_LEASES.start(_job_heartbeat)
+    if job_type in BULK_JOB_TYPES:
+        # A bulk parent only waits on sub-jobs the scheduler runs; holding a
+        # worker slot (and a host slot) while it waits would starve them.
+        threading.Thread(target=_run_job, args=(job_id, work), name=f'job-{job_type}', daemon=True).start()
+        return job_id
+    JOB_SCHEDULER.submit(job_id, lambda: _run_job(job_id, work), job_type=job_type, host_id=_job_host_id(host),
+                         priority=JOB_PRIORITIES.get(job_type, PRIORITY_NORMAL) if priority is None else priority)
     return job_id
 
+
+def _start_job(job_type: str, targets, work, host=None, priority=None):
+    """Queue `work` on the job scheduler and return the job id.
+
+    Jobs wait in the 'queued' state until a worker slot for their host and
+    type is free; `/dashboard/api/jobs` reports their queue position.
+    """
+    return _submit_job(_create_job(job_type, targets), job_type, work, host=host, priority=priority)
+
+
+def _enqueue_job(job_type: str, targets, payload, priority=None):
+    """Queue a restart-safe job run by `JOB_HANDLERS[job_type](job_id, payload)`.
+
+    Unlike `_start_job`, the work is rebuilt from the stored payload, so a job
+    interrupted by a dashboard restart is re-queued instead of failed.
+    """
+    handler = JOB_HANDLERS[job_type]
+    job_id = _create_job(job_type, targets, payload=payload)
+    return _submit_job(job_id, job_type, lambda: handler(job_id, payload), host=payload.get('host_id'), priority=priority)
+
+
+def _renew_job_leases():
+    now = int(time.time())
+    conn = _users_conn()
+    try:
+        conn.execute(
+            "UPDATE jobs SET lease_expires_at = ?, heartbeat_at = ? WHERE lease_owner = ? AND status IN ('queued', 'running')",
+            (JOB_LEASES.expires_at(), now, JOB_LEASES.owner),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _job_heartbeat():
+    _renew_job_leases()
+    _recover_orphaned_jobs()
+
+
+def _recover_orphaned_jobs():
+    """Claim queued/running jobs whose owner stopped renewing its lease, then re-queue or fail them.
+
+    Returns `{job_id: 'requeued' | 'failed'}`. The claim is a conditional
+    UPDATE, so when several dashboard processes sweep at once each orphan is
+    recovered by exactly one of them.
+    """
+    _init_users_db()
+    now = int(time.time())
+    conn = _users_conn()
+    claimed = []
+    try:
+        rows = conn.execute(
+            "SELECT * FROM jobs WHERE status IN ('queued', 'running') AND parent_id IS NULL "
+            "AND COALESCE(lease_owner, '') != ? AND COALESCE(lease_expires_at, 0) < ?",
+            (JOB_LEASES.owner, now),
+        ).fetchall()
+        for row in rows:
+            cur = conn.execute(
+                "UPDATE jobs SET lease_owner = ?, lease_expires_at = ? WHERE id = ? AND status = ? "
+                "AND COALESCE(lease_owner, '') != ? AND COALESCE(lease_expires_at, 0) < ?",
+                (JOB_LEASES.owner, JOB_LEASES.expires_at(), row['id'], row['status'], JOB_LEASES.owner, now),
+            )
+            if cur.rowcount == 1:
+                claimed.append(row)
+        conn.commit()
+    finally:
+        conn.close()
+    return {row['id']: _recover_job(row) for row in claimed}
+
+
+def _recover_job(row):
+    job_id, job_type = row['id'], row['type']
+    conn = _users_conn()
+    try:
+        children = conn.execute(
+            "SELECT id, targets FROM jobs WHERE parent_id = ? AND status IN ('queued', 'running')", (job_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+    names = set(json.loads(row['targets'] or '[]'))
+    for child in children:
+        names.update(json.loads(child['targets'] or '[]'))
+    for name in names:
+        for flag in JOB_VM_FLAGS:
+            _set_flag(name, flag, False)
+
+    handler = JOB_HANDLERS.get(job_type)
+    interrupted = row['status'] == 'running'
+    if handler is None or row['payload'] is None or (row['attempts'] or 0) >= JOB_MAX_ATTEMPTS:
+        reason = 'Interrupted by a dashboard restart' if interrupted else 'Dashboard restarted before the job ran'
+        if handler is not None and row['payload'] is not None:
+            reason += f" (gave up after {row['attempts']} attempts)"
+        JOB_LOGS.append(job_id, f'\n{reason}\n')
+        JOB_LOGS.close(job_id)
+        for child in children:
+            _update_job(child['id'], status='failed', progress='Failed', error=reason)
+        _update_job(job_id, status='failed', progress='Failed', error=reason)
+        return 'failed'
+
+    if interrupted:
+        JOB_LOGS.append(job_id, '\nInterrupted by a dashboard restart; re-queued.\n')
+        JOB_LOGS.close(job_id)
+    for child in children:
+        _update_job(child['id'], status='queued', progress='Queued')
+    _update_job(job_id, status='queued', progress='Re-queued after dashboard restart')
+    payload = json.loads(row['payload'])
+    _submit_job(job_id, job_type, lambda: handler(job_id, payload), host=payload.get('host_id'))
+    return 'requeued'
+
+
+def start_job_recovery():
+    """Recover jobs left behind by a previous dashboard process and start the lease heartbeat."""
+    recovered = _recover_orphaned_jobs()
+    JOB_LEASES.start(_job_heartbeat)
+    return recovered
+
+
+# Manager commands run, in order, for one VM of a bulk lifecycle action.
+BULK_ACTION_STEPS = {
+    'start': ('start',),
+    'stop': ('stop',),
+    'restart': ('restart',),
+    'recreate': ('recreate',),
+    'reset': ('delete', 'create', 'start'),
+}
+
+
+def _bulk_parallelism(value=None, action=None):
+    """Requested sub-job parallelism, clamped to what `JOB_SCHEDULER` can run for `action` on one host."""
+    raw = value if value not in (None, '') else os.environ.get('BLOBEVM_BULK_PARALLELISM', '4')
+    try:
+        parallelism = max(1, min(32, int(raw)))
+    except (TypeError, ValueError):
+        parallelism = 4
+    if action is not None:
+        parallelism = min(parallelism, JOB_SCHEDULER.capacity(f'vm-{action}'))
+    return parallelism
+
+
+def _bulk_vm_work(host, action, name):
+    rebuilding = action in ('recreate', 'reset')
+    if rebuilding:
+        _set_flag(name, 'rebuilding', True)
+    try:
+        output = []
+        for step in BULK_ACTION_STEPS[action]:
+            result = _job_run_manager(host, step, name)
+            output.append((result.stdout or '') + (result.stderr or ''))
+            if result.returncode != 0:
+                return False, ''.join(output) or f'{step} {name} failed'
+        return True, ''.join(output)
+    finally:
+        if rebuilding:
+            _set_flag(name, 'rebuilding', False)
+
+
+def _start_bulk_job(action, names, host, parallelism=None, max_failures=None, job_type=None):
+    """Queue one parent job that runs `action` on each VM as its own sub-job.
+
+    Sub-jobs go through `JOB_SCHEDULER` like any other job, so `parallelism`
+    is clamped to its worker, per-host and per-type caps
+    (`BLOBEVM_JOB_HOST_LIMIT` is usually the binding one); that many run at
+    once, unless other jobs on the host hold slots. Once more than
+    `max_failures` sub-jobs have failed, the ones not yet started are
+    cancelled. Returns `(parent_id, {name: sub_job_id})`.
+    """
+    names = _normalize_vm_names(names)
+    job_type = job_type or f'bulk-{action}'
+    payload = {
+        'action': action,
+        'host_id': _job_host_id(host),
+        'parallelism': _bulk_parallelism(parallelism, action),
+        'max_failures': max_failures,
+    }
+    parent_id = _create_job(job_type, names, payload=payload)
+    children = {name: _create_job(f'vm-{action}', [name], parent_id=parent_id) for name in names}
+    _update_job(parent_id, progress=f'0/{len(children)} done')
+    _submit_job(parent_id, job_type, lambda: _bulk_job(parent_id, payload), host=payload['host_id'])
+    return parent_id, children
+
+
+BULK_JOB_TYPES = (*(f'bulk-{action}' for action in BULK_ACTION_STEPS), 'reset-all-instances')
+
+
+@_job_handler(*BULK_JOB_TYPES)
+def _bulk_job(parent_id, payload):
+    action, max_failures = payload['action'], payload.get('max_failures')
+    host_id = payload.get('host_id') or 'local'
+    host = _vm_host(host_id)
+    parallelism = _bulk_parallelism(payload.get('parallelism'), action)
+    conn = _users_conn()
+    try:
+        rows = conn.execute('SELECT id, targets, status FROM jobs WHERE parent_id = ? ORDER BY rowid', (parent_id,)).fetchall()
+    finally:
+        conn.close()
+    # A run re-queued after a restart does not redo VMs that already finished.
+    pending = [(json.loads(row['targets'])[0], row['id']) for row in rows if row['status'] != 'succeeded']
+    cond = threading.Condition()
+    halted = threading.Event()
+    counts = {'succeeded': len(rows) - len(pending), 'failed': 0, 'cancelled': 0}
+    in_flight = [0]
+
+    def cancel(child_id):
+        _update_job(child_id, status='cancelled', progress='Cancelled: failure budget exhausted')
+        return 'cancelled'
+
+    def finish(name, outcome, submitted=True):
+        with cond:
+            counts[outcome] += 1
+            if submitted:
+                in_flight[0] -= 1
+            if outcome == 'failed' and max_failures is not None and counts['failed'] > max_failures:
+                halted.set()
+            progress = f"{sum(counts.values())}/{len(rows)} done, {counts['failed']} failed"
+            cond.notify_all()
+        JOB_LOGS.append(parent_id, f'{name}: {outcome}\n')
+        _update_job(parent_id, progress=progress)
+
+    def run_child(name, child_id):
+        outcome = 'failed'
+        try:
+            outcome = cancel(child_id) if halted.is_set() else _run_job(child_id, lambda: _bulk_vm_work(host, action, name))
+        finally:
+            finish(name, outcome)
+
+    child_type = f'vm-{action}'
+    for name, child_id in pending:
+        with cond:
+            cond.wait_for(lambda: in_flight[0] < parallelism)
+            skip = halted.is_set()
+            if not skip:
+                in_flight[0] += 1
+        if skip:
+            finish(name, cancel(child_id), submitted=False)
+            continue
+        JOB_LEASES.start(_job_heartbeat)
+        JOB_SCHEDULER.submit(child_id, lambda name=name, child_id=child_id: run_child(name, child_id),
+                             job_type=child_type, host_id=host_id,
+                             priority=JOB_PRIORITIES.get(child_type, PRIORITY_NORMAL))
+    with cond:
+        cond.wait_for(lambda: in_flight[0] == 0)
+    summary = ', '.join(f'{count} {state}' for state, count in counts.items() if count) or 'no VMs'
+    return counts['failed'] == 0 and counts['cancelled'] == 0, f'{action}: {summary}'
+
 def _user_row_to_dict(row, vm_names=None):
     return {
         'id': row['id'],
@@ -1310,6 +1752,7 @@ def _create_user(username: str, password: str, assigned_vms=None, is_admin: bool
         uid = cur.lastrowid
         conn.executemany('INSERT OR IGNORE INTO user_vm_access (user_id, vm_name) VALUES (?, ?)', [(uid, vm) for vm in assigned_vms])
         conn.commit()
+        FORWARD_AUTH_CACHE.invalidate()
     except sqlite3.IntegrityError:
         raise ValueError('Username already exists')
     finally:
@@ -1335,6 +1778,8 @@ def _update_user(username: str, assigned_vms=None, password=None, disabled=None)
             conn.execute('DELETE FROM user_vm_access WHERE user_id = ?', (row['id'],))
             conn.executemany('INSERT OR IGNORE INTO user_vm_access (user_id, vm_name) VALUES (?, ?)', [(row['id'], vm) for vm in assigned_vms])
         conn.commit()
+        FORWARD_AUTH_CACHE.invalidate()
+        SESSION_TOKENS.invalidate()
     finally:
         conn.close()
     return _get_user_by_username(username)
@@ -1349,6 +1794,8 @@ def _delete_user(username: str):
         conn.execute('DELETE FROM user_vm_access WHERE user_id = ?', (row['id'],))
         conn.execute('DELETE FROM users WHERE id = ?', (row['id'],))
         conn.commit()
+        FORWARD_AUTH_CACHE.invalidate()
+        SESSION_TOKENS.invalidate()
         return True
     finally:
         conn.close()
@@ -1365,8 +1812,12 @@ def _create_portal_token(username: str, is_admin: bool=False) -> str:
 def _verify_portal_token(token: str):
     try:
         secret = _portal_secret()
-        if not secret:
+        if not secret or not token:
             return None
+        cached = SESSION_TOKENS.get('portal', secret, token)
+        if cached is not None:
+            return cached
+        generation = SESSION_TOKENS.generation()
         raw = base64.urlsafe_b64decode(token.encode('utf-8')).decode('utf-8')
         payload, mac = raw.rsplit('.', 1)
         expected = hmac.new(secret.encode('utf-8'), payload.encode('utf-8'), hashlib.sha256).hexdigest()
@@ -1378,6 +1829,7 @@ def _verify_portal_token(token: str):
         user = _get_user_by_username(data.get('u') or '')
         if not user or user.get('disabled'):
             return None
+        SESSION_TOKENS.put('portal', secret, token, int(data.get('exp') or 0), user, generation)
         return user
     except Exception:
         return None
@@ -1475,15 +1927,8 @@ def _instance_meta_path(name: str):
 
 
 def _instance_meta(name: str):
-    path = _instance_meta_path(name)
-    try:
-        if os.path.isfile(path):
-            with open(path, 'r') as f:
-                data = json.load(f)
-                return data if isinstance(data, dict) else {}
-    except Exception:
-        pass
-    return {}
+    data = CONFIG_FILES.load(_instance_meta_path(name), parse_json_text, {})
+    return data if isinstance(data, dict) else {}
 
 
 def _set_instance_meta(name: str, key: str, value):
@@ -1496,6 +1941,9 @@ def _set_instance_meta(name: str, key: str, value):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, 'w') as f:
         json.dump(data, f, indent=2)
+    CONFIG_FILES.invalidate(path)
+    if key == 'access_mode':
+        FORWARD_AUTH_CACHE.invalidate()
     return data
 
 
@@ -1562,27 +2010,33 @@ def _run_manager(*args):
     """
     host = _vm_host()
     try:
-        r = host.run_manager(*args, capture_output=True, text=True)
-    except VmHostUnavailable:
-        r = subprocess.CompletedProcess(host.command(*args), 127, '', 'not found')
-    ok = (r.returncode == 0)
-    errtxt = (r.stderr or '') + ('' if ok else ('\n' + (r.stdout or '')))
-    # Heuristic: if command not recognized or prints usage, try fallback
-    need_fallback = (
-        (not ok) and (
-            'Usage: blobe-vm-manager' in errtxt or
-            'unknown' in errtxt.lower() or
-            'not found' in errtxt.lower()
+        try:
+            r = _job_run_manager(host, *args)
+        except VmHostUnavailable:
+            r = subprocess.CompletedProcess(host.command(*args), 127, '', 'not found')
+        ok = (r.returncode == 0)
+        errtxt = (r.stderr or '') + ('' if ok else ('\n' + (r.stdout or '')))
+        # Heuristic: if command not recognized or prints usage, try fallback
+        need_fallback = (
+            (not ok) and (
+                'Usage: blobe-vm-manager' in errtxt or
+                'unknown' in errtxt.lower() or
+                'not found' in errtxt.lower()
+            )
         )
-    )
-    if need_fallback:
-        alt = _repo_manager_path()
-        if os.path.isfile(alt):
-            # If not executable, try invoking via bash
-            cmd = [alt, *args] if os.access(alt, os.X_OK) else ['bash', alt, *args]
-            r2 = subprocess.run(cmd, capture_output=True, text=True)
-            return (r2.returncode == 0, (r2.stdout or '').strip(), (r2.stderr or '').strip(), r2.returncode)
-    return (ok, (r.stdout or '').strip(), (r.stderr or '').strip(), r.returncode)
+        if need_fallback:
+            alt = _repo_manager_path()
+            if os.path.isfile(alt):
+                # If not executable, try invoking via bash
+                cmd = [alt, *args] if os.access(alt, os.X_OK) else ['bash', alt, *args]
+                r2 = subprocess.run(cmd, capture_output=True, text=True)
+                return (r2.returncode == 0, (r2.stdout or '').strip(), (r2.stderr or '').strip(), r2.returncode)
+        return (ok, (r.stdout or '').strip(), (r.stderr or '').strip(), r.returncode)
+    finally:
+        # Only once the last (possibly fallback) command has finished, so a
+        # list racing the mutation cannot re-cache the old inventory.
+        if args and args[0] not in ('app-status', 'status', 'url', 'port', 'list', 'list-ports'):
+            _invalidate_inventory(host)
 
 def _is_direct_mode():
     env = _read_env()
@@ -1607,6 +2061,8 @@ def _external_base_url():
     return ''
 
 def _vm_host_port(cname: str) -> str:
+    if CONTAINER_INDEX.live:
+        return CONTAINER_INDEX.host_port(cname, '3000/tcp')
     try:
         r = _docker('port', cname, '3000/tcp')
         if r.returncode == 0 and r.stdout:
@@ -1618,6 +2074,54 @@ def _vm_host_port(cname: str) -> str:
         pass
     return ''
 
+def _docker_ps_vm_snapshot():
+    """Status and published 3000/tcp port of every VM container from one `docker ps`."""
+    return _snapshot_value('docker-ps', _load_docker_ps_vm_snapshot)
+
+
+def _load_docker_ps_vm_snapshot():
+    snapshot = {}
+    try:
+        r = _docker('ps', '-a', '--filter', 'name=blobevm_', '--format', '{{.Names}}\t{{.Status}}\t{{.Ports}}')
+        if r.returncode == 0:
+            for line in r.stdout.splitlines():
+                parts = line.split('\t')
+                if not parts or not parts[0].strip():
+                    continue
+                ports = parts[2] if len(parts) > 2 else ''
+                m = re.search(r':(\d+)->3000/tcp', ports)
+                snapshot[parts[0].strip()] = {
+                    'status': parts[1].strip() if len(parts) > 1 else '',
+                    'port': m.group(1) if m else '',
+                }
+    except Exception:
+        pass
+    return snapshot
+
+
+def _vm_port_map():
+    """Container name -> published host port for all VMs, resolved once per request.
+
+    Reads the live container index when available, otherwise a single
+    `docker ps` call instead of one `docker port` per VM.
+    """
+    return _snapshot_value('port-map', _load_vm_port_map)
+
+
+def _load_vm_port_map():
+    if CONTAINER_INDEX.live:
+        return {cname: CONTAINER_INDEX.host_port(cname, '3000/tcp') for cname in CONTAINER_INDEX.names()}
+    return {cname: item.get('port') or '' for cname, item in _docker_ps_vm_snapshot().items()}
+
+
+def _direct_mode_port(name: str, port_map) -> str:
+    """Published port for a VM, falling back to the manager's recorded host_port."""
+    hp = port_map.get(f'blobevm_{name}') or ''
+    if not hp:
+        hp = str(_instance_meta(name).get('host_port') or '').strip()
+    return hp if hp.isdigit() else ''
+
+
 def _vm_backend_url(name: str, subpath: str = '') -> str:
     prefix = _vm_path_prefix(name)
     suffix = '/' + (subpath or '').lstrip('/') if subpath else '/'
@@ -1631,10 +2135,8 @@ def _vm_path_prefix(name: str) -> str:
     inst_dir = os.path.join(_state_dir(), 'instances', name)
     override = ''
     try:
-        meta = os.path.join(inst_dir, '.meta.json')
-        if os.path.isfile(meta):
-            data = json.load(open(meta, 'r'))
-            override = (data.get('path_override') or '').strip()
+        data = CONFIG_FILES.load(os.path.join(inst_dir, '.meta.json'), parse_json_text, {})
+        override = (data.get('path_override') or '').strip()
     except Exception:
         override = ''
     prefix = override or f'{base_path}/{name}'
@@ -1662,8 +2164,7 @@ def _build_vm_url(name: str, host_id: str | None = None) -> str:
         host = _request_host()
         if not host:
             return ''
-        cname = f'blobevm_{name}'
-        hp = _vm_host_port(cname)
+        hp = _vm_port_map().get(f'blobevm_{name}') or ''
         if hp:
             return f'http://{host}:{hp}/'
     prefix = _vm_path_prefix(name)
@@ -1676,13 +2177,19 @@ def manager_json_list(host_id=None):
     """Return a list of instances with best-effort status and URL.
     Tries the selected provider's manager list first. Falls back to scanning
     the instances directory and asking the provider for each URL individually.
+    Built once per request; callers get their own copy.
     """
+    return _snapshot_value(('inventory', host_id), lambda: _load_manager_json_list(host_id), private=True)
+
+
+def _load_manager_json_list(host_id=None):
     host_provider = _vm_host(host_id)
     instances = []
     try:
         # Fast path: let the provider parse its inventory while preserving the
-        # existing manager command and output format.
-        instances = host_provider.list_vms()
+        # existing manager command and output format. The raw listing is
+        # cached per host for a few seconds; mutations invalidate it.
+        instances = INVENTORY_CACHE.get(getattr(host_provider, 'host_id', None) or host_id or 'local', host_provider.list_vms)
         if host_id and host_id != 'local':
             # A remote provider owns its inventory; never fall back to the
             # dashboard server's local instance directory for an empty result.
@@ -1700,16 +2207,11 @@ def manager_json_list(host_id=None):
             # In direct mode, override URL with host:published-port (or manager port) to avoid container IPs
             if _is_direct_mode():
                 host = _request_host()
+                port_map = _vm_port_map()
                 for it in instances:
-                    cname = f"blobevm_{it['name']}"
-                    hp = _vm_host_port(cname)
-                    if not hp:
-                        try:
-                            hp = host_provider.check_output('port', it['name'], text=True).strip()
-                        except Exception:
-                            hp = ''
+                    hp = _direct_mode_port(it['name'], port_map)
                     # Record explicit port for frontend
-                    if hp and hp.isdigit():
+                    if hp:
                         it['port'] = hp
                     if hp and host:
                         it['url'] = f"http://{host}:{hp}/"
@@ -1754,19 +2256,10 @@ def manager_json_list(host_id=None):
         names = [n for n in os.listdir(inst_root) if os.path.isdir(os.path.join(inst_root, n))]
     except Exception:
         names = []
-    # Cache docker ps output if docker exists
-    docker_status = {}
-    try:
-        out = _docker('ps', '-a', '--format', '{{.Names}} {{.Status}}')
-        if out.returncode == 0:
-            for line in out.stdout.splitlines():
-                if not line.strip():
-                    continue
-                parts = line.split(None, 1)
-                if parts:
-                    docker_status[parts[0]] = parts[1] if len(parts) > 1 else ''
-    except Exception:
-        pass
+    # One `docker ps` (shared with the port map) covers every VM's status
+    docker_status = {cname: item.get('status') or '' for cname, item in _docker_ps_vm_snapshot().items()}
+    direct_mode = _is_direct_mode()
+    port_map = _vm_port_map() if direct_mode else {}
     for name in sorted(names):
         url = ''
         cname = f'blobevm_{name}'
@@ -1775,14 +2268,9 @@ def manager_json_list(host_id=None):
             status = '(unknown)'
         port = ''
         # In direct mode, compute URL using host published port
-        if _is_direct_mode():
+        if direct_mode:
             host = _request_host()
-            hp = _vm_host_port(cname)
-            if not hp:
-                try:
-                    hp = host_provider.check_output('port', name, text=True).strip()
-                except Exception:
-                    hp = ''
+            hp = _direct_mode_port(name, port_map)
             if hp and host:
                 url = f"http://{host}:{hp}/"
             else:
@@ -1791,8 +2279,7 @@ def manager_json_list(host_id=None):
                     url = host_provider.check_output('url', name, text=True).strip()
                 except Exception:
                     url = ''
-            if hp and hp.isdigit():
-                port = hp
+            port = hp
         else:
             url = _build_vm_url(name)
         # Transient status override
@@ -1807,20 +2294,8 @@ def manager_json_list(host_id=None):
     return host_provider.normalize_inventory(instances)
 
 def _read_env():
-    env_path = os.path.join(_state_dir(), '.env')
-    data = {}
-    try:
-        with open(env_path, 'r') as f:
-            for line in f:
-                if not line.strip() or line.strip().startswith('#'):
-                    continue
-                if '=' in line:
-                    k, v = line.split('=', 1)
-                    v = v.strip().strip('\n').strip().strip("'\"")
-                    data[k.strip()] = v
-    except Exception:
-        pass
-    return data
+    # Parsed once per change of the file; the CLI's edits show up on the next call.
+    return CONFIG_FILES.load(os.path.join(_state_dir(), '.env'), parse_env_text, {})
 
 def _write_env_kv(updates: dict):
     env_path = os.path.join(_state_dir(), '.env')
@@ -1840,32 +2315,64 @@ def _write_env_kv(updates: dict):
         return True
     except Exception:
         return False
+    finally:
+        CONFIG_FILES.invalidate(env_path)
 
 def _docker(*args):
     return subprocess.run(['docker', *args], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
 
 
 def _docker_inspect_vm(name: str):
-    cname = f'blobevm_{name}'
-    r = _docker('inspect', cname)
-    if r.returncode != 0:
-        return None, r.stderr.strip() or 'inspect failed'
+    return _docker_inspect_vms([name]).get(name, (None, 'not-found'))
+
+
+def _docker_inspect_vms(names):
+    """`{name: (inspect, error)}` for many VMs from one `docker inspect` (or the live index)."""
+    names = _normalize_vm_names(names)
+    if not names:
+        return {}
+    if CONTAINER_INDEX.live:
+        result = {}
+        for name in names:
+            info = CONTAINER_INDEX.inspect(f'blobevm_{name}')
+            result[name] = (info, None) if info else (None, 'not-found')
+        return result
+    # Missing containers make `docker inspect` exit 1 but it still prints the
+    # ones it found, one stderr line per missing name.
+    r = _docker('inspect', *[f'blobevm_{name}' for name in names])
     try:
-        data = json.loads(r.stdout or '[]')
-        if not data:
-            return None, 'not-found'
-        return data[0], None
+        docs = json.loads(r.stdout or '[]')
     except Exception as e:
-        return None, str(e)
+        return {name: (None, str(e)) for name in names}
+    found = {str(doc.get('Name') or '').lstrip('/'): doc for doc in docs if isinstance(doc, dict)}
+    errors = (r.stderr or '').strip().splitlines()
+    result = {}
+    for name in names:
+        cname = f'blobevm_{name}'
+        if cname in found:
+            result[name] = (found[cname], None)
+        elif r.returncode != 0:
+            line = next((e for e in errors if cname in e), '')
+            result[name] = (None, line.strip() or (r.stderr or '').strip() or 'inspect failed')
+        else:
+            result[name] = (None, 'not-found')
+    return result
 
 
-def _vm_status_payload(name: str):
-    info, err = _docker_inspect_vm(name)
-    url = _build_vm_url(name) or ''
+def _inspect_host_port(info, port='3000/tcp') -> str:
+    bindings = (((info or {}).get('NetworkSettings') or {}).get('Ports') or {}).get(port) or []
+    for binding in bindings:
+        host_port = str((binding or {}).get('HostPort') or '')
+        if host_port.isdigit():
+            return host_port
+    return ''
+
+
+def _vm_status_from_inspect(name: str, info, err):
     payload = {
         'ok': True,
         'name': name,
-        'url': url,
+        'url': _build_vm_url(name) or '',
         'exists': False,
         'running': False,
         'healthy': False,
@@ -1877,7 +2384,7 @@ def _vm_status_payload(name: str):
         'finishedAt': None,
         'exitCode': None,
         'error': '',
-        'port': _vm_host_port(f'blobevm_{name}') or ''
+        'port': _inspect_host_port(info)
     }
     if not info:
         return payload
@@ -1903,10 +2410,29 @@ def _vm_status_payload(name: str):
         restarting or
         payload['status'] == 'dead'
     )
+    return payload
+
+
+def _vm_status_payloads(names):
+    """Status payloads keyed by VM name.
+
+    One `docker inspect` for every container (ports come from the same
+    documents) and one optimizer snapshot for the whole batch.
+    """
+    payloads = {name: _vm_status_from_inspect(name, info, err) for name, (info, err) in _docker_inspect_vms(names).items()}
+    if not any(payload['exists'] for payload in payloads.values()):
+        return payloads
     try:
-        opt = dash_optimizer.status()
+        opt = _optimizer_status()
         vm_states = ((opt.get('stats') or {}).get('vmStates') or []) if isinstance(opt, dict) else []
-        vm_meta = next((v for v in vm_states if v.get('name') == name), None)
+        by_name = {v.get('name'): v for v in vm_states if isinstance(v, dict)}
+    except Exception:
+        return payloads
+    for name, payload in payloads.items():
+        if not payload['exists']:
+            continue
+        payload['lastBoot'] = VM_READINESS.boot_time(name)
+        vm_meta = by_name.get(name)
         if vm_meta:
             payload['optimizer'] = vm_meta
             payload['recoveryState'] = vm_meta.get('recoveryState')
@@ -1918,9 +2444,11 @@ def _vm_status_payload(name: str):
             payload['notifications'] = dash_optimizer.get_vm_notifications(name)
         except Exception:
             payload['notifications'] = []
-    except Exception:
-        pass
-    return payload
+    return payloads
+
+
+def _vm_status_payload(name: str):
+    return _vm_status_payloads([name]).get(name) or _vm_status_from_inspect(name, None, 'not-found')
 
 
 def _tail_vm_logs(name: str, lines: int = 160) -> str:
@@ -1934,7 +2462,79 @@ def _tail_vm_logs(name: str, lines: int = 160) -> str:
         return str(e)
 
 
-def _recover_vm(name: str, source: str = 'manual', aggressive: bool = True, mode: str = 'standard'):
+def _vm_probe_url(name: str) -> str:
+    """The VM's web UI as seen from the dashboard (both sit on the proxy network)."""
+    return f'http://blobevm_{name}:3000{_vm_path_prefix(name)}/'
+
+
+def _vm_serving(code: int) -> bool:
+    # 401/403 still mean the VM's web UI is up behind its own auth; a 404 is
+    # a router or path-prefix miss, not a VM that is serving.
+    return 200 <= code < 400 or code in (401, 403)
+
+
+def _vm_ready_probe(name: str, url: str = ''):
+    """`(ready, status)`: the container runs and its web UI answers HTTP.
+
+    When the VM's container name does not resolve (the dashboard is not on
+    the VM network), Docker's running/health state is the best signal. With
+    `url`, that URL (as users reach it) must also answer 2xx/3xx.
+    """
+    info, err = _docker_inspect_vms([name]).get(name, (None, 'not-found'))
+    status = _vm_status_from_inspect(name, info, err)
+    if not status['running'] or status.get('restarting'):
+        return False, status
+    try:
+        socket.getaddrinfo(f'blobevm_{name}', 3000)
+    except OSError:
+        ready = bool(status['healthy'])
+    else:
+        status['httpCode'] = _http_check(_vm_probe_url(name), timeout=2.0)
+        ready = _vm_serving(status['httpCode'])
+    if ready and url:
+        status['urlCode'] = _http_check(url, timeout=2.0)
+        ready = 200 <= status['urlCode'] < 400
+    return ready, status
+
+
+def _wait_vm_ready(name: str, started_at=None, source: str = '', timeout=None, url: str = ''):
+    """Wait up to `timeout` (BLOBEVM_VM_READY_TIMEOUT) for `name` to serve; record and announce its boot time."""
+    probe = (lambda: _vm_ready_probe(name, url=url)) if url else (lambda: _vm_ready_probe(name))
+    result = VM_READINESS.wait(name, probe, VM_READY_TIMEOUT if timeout is None else timeout,
+                               started_at=started_at, source=source)
+    if result['ready']:
+        EVENT_BUS.publish('vm', {
+            'name': name, 'action': 'ready', 'exists': True, 'running': True, 'state': 'running',
+            'health': '', 'bootSeconds': result['seconds'],
+        })
+    return result
+
+
+_BOOT_WATCHES = set()
+_BOOT_WATCH_LOCK = threading.Lock()
+
+
+def _watch_vm_boot(name: str, started_at, source: str):
+    """Wait for a just-started VM in the background so its boot time is recorded and announced."""
+    with _BOOT_WATCH_LOCK:
+        if name in _BOOT_WATCHES:
+            return False
+        _BOOT_WATCHES.add(name)
+
+    def run():
+        try:
+            _wait_vm_ready(name, started_at=started_at, source=source)
+        except Exception:
+            pass
+        finally:
+            with _BOOT_WATCH_LOCK:
+                _BOOT_WATCHES.discard(name)
+
+    threading.Thread(target=run, name=f'vm-boot-{name}', daemon=True).start()
+    return True
+
+
+def _recover_vm(name: str, source: str = 'manual', aggressive: bool = True, mode: str = 'standard', host=None):
     attempts = []
     before = _vm_status_payload(name)
     recovery_state = str(before.get('recoveryState') or '').lower()
@@ -1953,9 +2553,12 @@ def _recover_vm(name: str, source: str = 'manual', aggressive: bool = True, mode
             sequence.append('restart')
         if aggressive:
             sequence.append('recreate')
+    host = host or _vm_host()
     for action in sequence:
+        _job_progress(f'Recovering {name}: {action}')
+        started = VM_READINESS.now()
         try:
-            proc = _vm_host().run_manager(action, name, capture_output=True, text=True, timeout=90)
+            proc = host.run_manager(action, name, capture_output=True, text=True, timeout=90)
             attempt = {
                 'action': action,
                 'ok': proc.returncode == 0,
@@ -1966,10 +2569,13 @@ def _recover_vm(name: str, source: str = 'manual', aggressive: bool = True, mode
         except Exception as e:
             attempt = {'action': action, 'ok': False, 'stdout': '', 'stderr': str(e), 'returncode': None}
         attempts.append(attempt)
-        time.sleep(2.5)
+        _invalidate_inventory(host)
+        # A failed action gets one look rather than a full wait.
+        ready = _wait_vm_ready(name, started_at=started, source=f'recover:{action}', timeout=None if attempt['ok'] else 0)
         current = _vm_status_payload(name)
-        if current.get('running') and (current.get('healthy') or current.get('state') == 'running'):
-            return {'ok': True, 'recovered': True, 'attempts': attempts, 'status': current, 'message': f'VM recovered via {action}', 'source': source, 'mode': mode}
+        if ready['ready'] or (current.get('running') and (current.get('healthy') or current.get('state') == 'running')):
+            return {'ok': True, 'recovered': True, 'attempts': attempts, 'status': current, 'message': f'VM recovered via {action}', 'source': source, 'mode': mode,
+                    'bootSeconds': ready['seconds'] if ready['ready'] else None}
     final = _vm_status_payload(name)
     return {'ok': False, 'recovered': False, 'attempts': attempts, 'status': final, 'message': 'VM recovery failed', 'source': source, 'mode': mode}
 
@@ -2013,6 +2619,62 @@ def _escalate_vm_to_hermes(name: str, reason: str, extra=None):
         cli_error = str(e)
     return {'ok': True, 'queued': delivered, 'path': esc_path, 'cliError': cli_error, 'payload': payload}
 
+
+# Serializes the duplicate check and insert in _enqueue_vm_job.
+_VM_JOB_LOCK = threading.Lock()
+
+
+def _active_vm_job(name, job_types):
+    conn = _users_conn()
+    try:
+        row = conn.execute(
+            f"SELECT id FROM jobs WHERE type IN ({', '.join('?' * len(job_types))}) AND targets = ? "
+            "AND status IN ('queued', 'running') ORDER BY created_at DESC LIMIT 1",
+            (*job_types, json.dumps([name])),
+        ).fetchone()
+        return row['id'] if row else None
+    finally:
+        conn.close()
+
+
+def _enqueue_vm_job(job_type, name, payload, dedup_types=None):
+    """Queue a per-VM job unless one is already queued or running; return `(job_id, deduplicated)`."""
+    _init_users_db()
+    with _VM_JOB_LOCK:
+        existing = _active_vm_job(name, tuple(dedup_types or (job_type,)))
+        if existing:
+            return existing, True
+        return _enqueue_job(job_type, [name], payload), False
+
+
+def _recovery_summary(result):
+    """`_recover_vm` output small enough for the jobs table (status trimmed to its headline fields)."""
+    summary = {key: value for key, value in (result or {}).items() if key != 'status'}
+    status = (result or {}).get('status') or {}
+    summary['status'] = {key: status.get(key) for key in ('running', 'state', 'healthy', 'crashed') if key in status}
+    return summary
+
+
+@_job_handler('recover-vm')
+def _recover_vm_job(job_id, payload):
+    result = _recover_vm(payload['name'], source=payload.get('source') or 'dashboard',
+                         aggressive=payload.get('aggressive', True), mode=payload.get('mode') or 'standard',
+                         host=_vm_host(payload.get('host_id') or 'local'))
+    return bool(result.get('ok')), json.dumps(_recovery_summary(result), default=str)
+
+
+@_job_handler('escalate-vm')
+def _escalate_vm_job(job_id, payload):
+    name = payload['name']
+    rec = _recover_vm(name, source='hermes-escalation', aggressive=True, host=_vm_host(payload.get('host_id') or 'local'))
+    _job_progress(f'Handing {name} off to Hermes')
+    esc = _escalate_vm_to_hermes(name, payload['reason'], {'recovery': rec, 'request': payload.get('request')})
+    escalation = {key: esc.get(key) for key in ('ok', 'queued', 'path', 'cliError')}
+    recovery = _recovery_summary(rec)
+    # Recover requests deduplicated onto this job read the recovery fields
+    # (recovered, attempts, message, status) from the top level.
+    return True, json.dumps({**recovery, 'ok': True, 'recovery': recovery, 'escalation': escalation}, default=str)
+
 @app.get('/dashboard/api/modeinfo')
 @auth_required
 def api_modeinfo():
@@ -2031,13 +2693,9 @@ def _settings_path():
 
 
 def _load_dashboard_settings():
-    p = _settings_path()
-    try:
-        if os.path.isfile(p):
-            with open(p, 'r') as f:
-                return json.load(f)
-    except Exception:
-        pass
+    cfg = CONFIG_FILES.load(_settings_path(), parse_json_text)
+    if cfg is not None:
+        return cfg
     # defaults
     return {'title': DASHBOARD_TITLE, 'favicon': ''}
 
@@ -2051,6 +2709,9 @@ def _save_dashboard_settings(cfg: dict):
         return True
     except Exception:
         return False
+    finally:
+        CONFIG_FILES.invalidate(p)
+        FORWARD_AUTH_CACHE.invalidate()
 
 
 @app.get('/dashboard/favicon.ico')
@@ -2207,22 +2868,40 @@ def api_upload_vm_favicon(name):
         return 'Not found', 404
 
 
+def _forward_auth_decision(name: str) -> str:
+    """'allow', 'login' or 'denied' for the sessions on the current request."""
+    if _admin_vm_sso_authenticated():
+        return 'allow'
+    user = _current_portal_user()
+    if not user:
+        return 'login'
+    if not _user_can_access_vm(user, name):
+        return 'denied'
+    return 'allow'
+
+
 @app.get('/dashboard/auth/vm/<name>')
 def dashboard_vm_forward_auth(name):
-    if _admin_vm_sso_authenticated():
+    # Decisions are cached per (session cookies, VM) for a few seconds so the
+    # burst of asset/websocket checks behind one page load skips HMAC, SQLite
+    # and metadata reads; user, ACL and access-mode changes invalidate them.
+    key = (token_digest(request.cookies.get('Dashboard-Auth')), token_digest(request.cookies.get('Portal-Auth')), name)
+    decision = FORWARD_AUTH_CACHE.get(key)
+    if decision is None:
+        generation = FORWARD_AUTH_CACHE.generation()
+        decision = _forward_auth_decision(name)
+        FORWARD_AUTH_CACHE.put(key, decision, generation)
+    if decision == 'allow':
         return Response('OK', 200)
-    user = _current_portal_user()
     next_url = request.headers.get('X-Forwarded-Uri') or request.args.get('next') or f'/dashboard/vm/{name}/'
     ext_base = _external_base_url()
-    if not user:
+    if decision == 'login':
         login_path = '/portal/login?next=' + urlrequest.quote(next_url, safe='/:?=&%')
         login_url = f'{ext_base}{login_path}' if ext_base else login_path
         return Response('', 302, {'Location': login_url})
-    if not _user_can_access_vm(user, name):
-        denied_path = '/dashboard/vm/' + urlrequest.quote(name, safe='') + '/'
-        denied_url = f'{ext_base}{denied_path}' if ext_base else denied_path
-        return Response('', 302, {'Location': denied_url})
-    return Response('OK', 200)
+    denied_path = '/dashboard/vm/' + urlrequest.quote(name, safe='') + '/'
+    denied_url = f'{ext_base}{denied_path}' if ext_base else denied_path
+    return Response('', 302, {'Location': denied_url})
 
 
 @app.post('/portal/api/auth/login')
@@ -2233,8 +2912,21 @@ def portal_login_api():
     if not _same_origin_request():
         return jsonify({'ok': False, 'error': 'Cross-origin request rejected'}), 403
     user = _get_user_by_username(username)
-    if not user or user.get('disabled') or not _verify_user_password(password, user.get('password_hash') or ''):
+    if not user or user.get('disabled'):
+        return jsonify({'ok': False, 'error': 'invalid'}), 401
+    try:
+        ok, upgraded = PASSWORD_HASHER.verify(password, user.get('password_hash') or '')
+    except PasswordHasherBusy as exc:
+        return jsonify({'ok': False, 'error': str(exc)}), 429, {'Retry-After': '1'}
+    if not ok:
         return jsonify({'ok': False, 'error': 'invalid'}), 401
+    if upgraded:
+        # Iteration count changed (or a legacy hash): store the new hash now
+        # that the plaintext is known to be right.
+        try:
+            _rehash_user_password(user['id'], upgraded)
+        except Exception:
+            pass
     try:
         token = _create_portal_token(user['username'], bool(user.get('isAdmin')))
     except ValueError as exc:
@@ -2266,15 +2958,16 @@ def portal_vms_api():
     for name in all_vms:
         if _vm_access_mode(name) == 'public' or name in assigned:
             visible.append(name)
+    try:
+        statuses = _vm_status_payloads(visible)
+    except Exception:
+        statuses = {}
     vms = []
     for name in visible:
-        try:
-            status = _vm_status_payload(name)
-        except Exception:
-            status = {'ok': False, 'name': name, 'status': 'unknown', 'state': 'unknown', 'running': False, 'healthy': False, 'crashed': False, 'exists': False}
+        status = statuses.get(name) or {'ok': False, 'name': name, 'status': 'unknown', 'state': 'unknown', 'running': False, 'healthy': False, 'crashed': False, 'exists': False}
         item = {
             'name': name,
-            'url': _build_vm_url(name),
+            'url': status.get('url') or _build_vm_url(name),
             'accessMode': _vm_access_mode(name),
             'allowed': True,
             'status': status.get('status') or status.get('state') or 'Unknown',
@@ -2295,7 +2988,11 @@ def portal_start_vm(name):
     if not _user_can_access_vm(request.portal_user, name):
         return jsonify({'ok': False, 'error': 'Forbidden'}), 403
     try:
-        _vm_host().check_call('start', name)
+        host = _vm_host()
+        try:
+            host.check_call('start', name)
+        finally:
+            _invalidate_inventory(host)
         try:
             dash_optimizer.note_vm_activity(name, 'portal-start')
         except Exception:
@@ -2310,7 +3007,11 @@ def portal_stop_vm(name):
     if not _user_can_access_vm(request.portal_user, name):
         return jsonify({'ok': False, 'error': 'Forbidden'}), 403
     try:
-        _vm_host().check_call('stop', name)
+        host = _vm_host()
+        try:
+            host.check_call('stop', name)
+        finally:
+            _invalidate_inventory(host)
         return jsonify({'ok': True})
     except subprocess.CalledProcessError as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -2888,6 +3589,15 @@ except Exception:
     pass
 
 
+# Every shared stats refresh also feeds the in-process metrics history.
+add_stats_listener(METRICS_STORE.ingest)
+# A removed container's rings would otherwise live as long as the process.
+CONTAINER_INDEX.add_listener(
+    lambda action, name, entry: METRICS_STORE.forget(name[len('blobevm_'):])
+    if action == 'destroy' and name.startswith('blobevm_') else None
+)
+
+
 def python_gather_stats():
     out = {'mem': {}, 'swap': {}, 'containers': []}
     try:
@@ -2908,17 +3618,7 @@ def python_gather_stats():
     # Docker stats are shared with the VM endpoint and optimizer.
     try:
         for record in get_docker_stats():
-            memusage = str(record['mem_usage'])
-            m = re.search(r'([0-9.]+)\s*([KMG]i?)B', memusage)
-            memBytes = 0
-            if m:
-                n = float(m.group(1)); u = m.group(2).upper()
-                mul = 1024
-                if u.startswith('M'):
-                    mul = 1024*1024
-                elif u.startswith('G'):
-                    mul = 1024*1024*1024
-                memBytes = int(n * mul)
+            memBytes = record['mem_bytes']
             out['containers'].append({'name': record['name'], 'cpu': record['cpu_percent'],
                                       'memperc': record['mem_percent'], 'memBytes': memBytes})
     except Exception:
@@ -3180,24 +3880,130 @@ def root():
     return render_template_string(TEMPLATE, title=title, manager_name=MANAGER_NAME, favicon_url=fav, dashboard_v2_url=dashboard_v2_url)
 
 
-def manager_json_fleet_list():
-    """Return VM inventory from every configured host, omitting unavailable hosts."""
+# Remote agents are queried in parallel; the fleet response waits at most this
+# long for them and serves the last remembered inventory for the rest.
+try:
+    FLEET_DEADLINE_SECONDS = max(0.1, float(os.environ.get('BLOBEVM_FLEET_DEADLINE', '2.5')))
+except ValueError:
+    FLEET_DEADLINE_SECONDS = 2.5
+# Shared so a late host keeps running in the background (and warms the
+# inventory cache) instead of holding the request open. Only remote hosts go
+# here, and each has at most one listing in flight: a request that finds one
+# still running waits on it (or serves stale) rather than queueing another.
+_FLEET_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='fleet-list')
+_FLEET_INFLIGHT = {}
+_FLEET_INFLIGHT_LOCK = threading.Lock()
+
+
+def _fleet_listing(host_id):
+    """Return the in-flight listing future for remote ``host_id``, starting one if none is running."""
+    with _FLEET_INFLIGHT_LOCK:
+        future = _FLEET_INFLIGHT.get(host_id)
+        if future is not None and not future.done():
+            return future
+
+        def call():
+            began = time.monotonic()
+            return manager_json_list(host_id), time.monotonic() - began
+
+        if has_request_context():
+            call = copy_current_request_context(call)
+        future = _FLEET_INFLIGHT[host_id] = _FLEET_POOL.submit(call)
+        return future
+
+
+def manager_json_fleet_inventory(deadline=None):
+    """Return ``(instances, timings)`` for every configured host.
+
+    Remote hosts are listed concurrently while the local host is listed in
+    the request thread (it has no offline copy, so it is always awaited). A
+    remote host that misses ``deadline`` is served from
+    ``VM_HOST_REGISTRY.cached_inventory`` with ``stale: true``. ``timings`` has
+    one entry per host with its elapsed milliseconds and outcome.
+    """
     VM_HOST_REGISTRY.refresh()
-    instances = []
-    for host_id in VM_HOST_REGISTRY.providers:
+    deadline = FLEET_DEADLINE_SECONDS if deadline is None else float(deadline)
+    host_ids = list(VM_HOST_REGISTRY.providers)
+    started = time.monotonic()
+
+    futures = {host_id: _fleet_listing(host_id) for host_id in host_ids if host_id != 'local'}
+    if 'local' in host_ids:
+        local = Future()
         try:
             # Keep the no-argument local call as a compatibility seam for
-            # existing overview tests and integrations; remote providers need
-            # an explicit host id.
-            listed = manager_json_list() if host_id == 'local' else manager_json_list(host_id)
+            # existing overview tests and integrations.
+            local.set_result((manager_json_list(), time.monotonic() - started))
+        except Exception as exc:
+            local.set_exception(exc)
+        futures['local'] = local
+    futures_wait(list(futures.values()), timeout=max(0.0, deadline - (time.monotonic() - started)))
+
+    instances, timings = [], []
+    for host_id in host_ids:
+        future = futures[host_id]
+        timing = {'host_id': host_id, 'stale': False}
+        if host_id == 'local' or future.done():
+            try:
+                listed, elapsed = future.result()
+            except VmHostUnavailable as exc:
+                timing.update({'elapsed_ms': round((time.monotonic() - started) * 1000, 1), 'error': str(exc)})
+                timings.append(timing)
+                continue
+            except Exception as exc:
+                # A single remote host must not make local inventory disappear.
+                if host_id == 'local':
+                    raise
+                timing.update({'elapsed_ms': round((time.monotonic() - started) * 1000, 1), 'error': str(exc)})
+                timings.append(timing)
+                continue
             instances.extend(listed)
-        except VmHostUnavailable:
-            continue
-        except Exception:
-            # A single remote host must not make local inventory disappear.
-            if host_id == 'local':
-                raise
-    return instances
+            timing.update({'elapsed_ms': round(elapsed * 1000, 1), 'count': len(listed)})
+        else:
+            cached = VM_HOST_REGISTRY.cached_inventory(host_id) if hasattr(VM_HOST_REGISTRY, 'cached_inventory') else []
+            for item in cached:
+                item['stale'] = True
+                if item.get('name'):
+                    item['url'] = _build_vm_url(item['name'], host_id=host_id)
+            instances.extend(cached)
+            timing.update({'elapsed_ms': round(deadline * 1000, 1), 'stale': True, 'count': len(cached)})
+        timings.append(timing)
+    return instances, timings
+
+
+def manager_json_fleet_list():
+    """Return VM inventory from every configured host, omitting unavailable hosts."""
+    return manager_json_fleet_inventory()[0]
+
+
+def _revisioned_response(stream, payload):
+    """JSON response with a strong ETag, a revision and optional ``?since=`` delta.
+
+    ``If-None-Match`` matching the current payload returns 304. ``since`` at
+    or after the stream's first revision swaps ``instances`` for
+    ``changed``/``removed`` lists. ``hostTimings`` is diagnostic and excluded
+    from the ETag.
+    """
+    stream = f'{stream}@{request.host}'
+    instances = payload.get('instances')
+    if isinstance(instances, list):
+        payload['revision'] = INVENTORY_REVISIONS.observe(stream, instances)
+    etag = payload_digest({k: v for k, v in payload.items() if k != 'hostTimings'})
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    else:
+        since = request.args.get('since', '')
+        delta = None
+        if isinstance(instances, list) and since.isdigit():
+            delta = INVENTORY_REVISIONS.delta(stream, int(since), instances)
+        if delta is not None:
+            payload = {k: v for k, v in payload.items() if k != 'instances'}
+            payload.update(delta)
+        resp = jsonify(payload)
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'no-cache'
+    if 'revision' in payload:
+        resp.headers['X-Inventory-Revision'] = str(payload['revision'])
+    return resp
 
 
 @app.get('/dashboard/api/list')
@@ -3207,8 +4013,9 @@ def api_list():
     # before.  The modern placement-aware dashboard opts into fleet mode so
     # legacy action URLs cannot accidentally act on a remote card as local.
     if request.args.get('fleet', '').lower() in {'1', 'true', 'yes'}:
-        return jsonify({'instances': manager_json_fleet_list()})
-    return jsonify({'instances': manager_json_list()})
+        instances, timings = manager_json_fleet_inventory()
+        return _revisioned_response('list:fleet', {'instances': instances, 'hostTimings': timings})
+    return _revisioned_response('list:local', {'instances': manager_json_list()})
 
 
 @app.get('/dashboard/api/hosts')
@@ -3274,13 +4081,13 @@ def api_overview():
     parts = {p.strip() for p in (request.args.get('parts') or '').split(',') if p.strip()}
     try:
         if not parts or parts == {'all'}:
-            return jsonify({'ok': True, **_dashboard_overview_payload()})
+            return _revisioned_response('overview', {'ok': True, **_dashboard_overview_payload()})
         payload = {'ok': True, 'partial': True, 'parts': sorted(parts)}
         if 'host' in parts:
             payload.update(_dashboard_overview_host_payload())
         if 'instances' in parts:
-            payload['instances'] = manager_json_fleet_list()
-        return jsonify(payload)
+            payload['instances'], payload['hostTimings'] = manager_json_fleet_inventory()
+        return _revisioned_response('overview:' + ','.join(sorted(parts)), payload)
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
 
@@ -3319,8 +4126,10 @@ def api_create():
         return jsonify({'ok': False, 'error': 'placement must be local or remote'}), 400
     if (requested_placement == 'local') != (requested_host_id == 'local'):
         return jsonify({'ok': False, 'error': 'placement and host_id do not agree'}), 400
+    ready = None
     try:
         host = _vm_host(requested_host_id)
+        started = VM_READINESS.now()
         if getattr(host, 'kind', 'local') == 'remote':
             host_record = next(
                 (item for item in VM_HOST_REGISTRY.public_records() if item.get('id') == requested_host_id),
@@ -3338,6 +4147,7 @@ def api_create():
             result = host.create(name, spec)
         else:
             result = host.run_manager('create', name, capture_output=True, text=True)
+        _invalidate_inventory(host)
         if result.returncode == 125:
             # Docker exit 125: container name conflict or similar
             msg = result.stderr.strip() or 'VM already exists or container conflict.'
@@ -3348,13 +4158,23 @@ def api_create():
             return jsonify({'ok': False, 'error': result.stderr.strip() or 'Error creating VM.'}), 500
         # Preserve the local manager's auto-start behavior for remote agents.
         host.run_manager('start', name, capture_output=True)
+        _invalidate_inventory(host)
+        if getattr(host, 'kind', 'local') != 'remote':
+            # `wait` holds the response until the VM serves; otherwise the boot is watched in the background.
+            if str(payload.get('wait') or '').lower() in ('1', 'true', 'yes', 'on'):
+                ready = _wait_vm_ready(name, started_at=started, source='create')
+            else:
+                _watch_vm_boot(name, started, 'create')
     except VmHostUnavailable as exc:
         return _vm_host_error_response(exc)
     except FileNotFoundError:
         return jsonify({'ok': False, 'error': 'blobe-vm-manager not found in container. Make sure it is installed and mounted.'}), 500
     except Exception as e:
         return jsonify({'ok': False, 'error': f'Error creating VM: {e}'}), 500
-    return jsonify({'ok': True, 'host_id': getattr(host, 'host_id', 'local'), 'placement': getattr(host, 'kind', 'local')})
+    response = {'ok': True, 'host_id': getattr(host, 'host_id', 'local'), 'placement': getattr(host, 'kind', 'local')}
+    if ready is not None:
+        response.update({'ready': ready['ready'], 'bootSeconds': ready['seconds'] if ready['ready'] else None})
+    return jsonify(response)
 
 @app.post('/dashboard/api/start/<name>')
 @auth_required
@@ -3369,13 +4189,18 @@ def api_start(name):
     if not is_remote:
         try:
             cname = f'blobevm_{name}'
-            r = _docker('ps', '-q', '-f', f'name=^{cname}$')
-            if r.returncode == 0 and r.stdout.strip():
-                return jsonify({'ok': False, 'error': 'VM already running'})
+            if CONTAINER_INDEX.live:
+                entry = CONTAINER_INDEX.get(cname)
+                if entry and entry.get('running'):
+                    return jsonify({'ok': False, 'error': 'VM already running'})
+            else:
+                r = _docker('ps', '-q', '-f', f'name=^{cname}$')
+                if r.returncode == 0 and r.stdout.strip():
+                    return jsonify({'ok': False, 'error': 'VM already running'})
         except Exception:
             pass
         try:
-            opt_status = dash_optimizer.status()
+            opt_status = _optimizer_status()
             stats = opt_status.get('stats') or {}
             profiles = (stats.get('profiles') or {}) if isinstance(stats, dict) else {}
             profile = profiles.get(name, 'desktop')
@@ -3386,9 +4211,13 @@ def api_start(name):
             pass
     try:
         _ensure_remote_vm_exists(host, name)
+        started = VM_READINESS.now()
         result = host.run_manager('start', name, capture_output=True, text=True)
+        _invalidate_inventory(host)
         if result.returncode != 0:
             return jsonify({'ok': False, 'error': result.stderr.strip() or 'Failed to start VM'}), 500
+        if not is_remote:
+            _watch_vm_boot(name, started, 'start')
         try:
             dash_optimizer.note_vm_activity(name, 'api-start')
         except Exception:
@@ -3402,6 +4231,27 @@ def api_start(name):
         return jsonify({'ok': False, 'error': str(e)}), 500
 
 
+@app.get('/dashboard/api/vms/status')
+@auth_required
+def api_vms_status():
+    """Return status for several VMs at once, keyed by name (`?names=a,b`, default all)."""
+    try:
+        names = _normalize_vm_names((request.args.get('names') or '').split(','))
+        host = _vm_host()
+        if getattr(host, 'kind', 'local') == 'remote':
+            if not names:
+                names = _normalize_vm_names(item.get('name') for item in manager_json_list(host_id=host.host_id))
+            vms = {name: {'ok': True, **host.status(name), 'placement': 'remote', 'host_id': host.host_id, 'host_name': host.host_name} for name in names}
+            return jsonify({'ok': True, 'vms': vms})
+        if not names:
+            names = sorted(_known_vm_names())
+        return jsonify({'ok': True, 'vms': _vm_status_payloads(names)})
+    except VmHostUnavailable as exc:
+        return _vm_host_error_response(exc)
+    except Exception as e:
+        return jsonify({'ok': False, 'error': str(e)}), 500
+
+
 @app.get('/dashboard/api/vm/<name>/status')
 @auth_required
 def api_vm_status(name):
@@ -3421,12 +4271,24 @@ def api_vm_status(name):
 @app.post('/dashboard/api/vm/<name>/recover')
 @auth_required
 def api_vm_recover(name):
+    """Queue a recovery job (or return the one already running for this VM).
+
+    The job's output is the `_recover_vm` result as JSON; follow it through
+    `/dashboard/api/jobs/<jobId>`.
+    """
+    if not re.fullmatch(r'[a-z0-9][a-z0-9._-]{0,62}', name or ''):
+        return jsonify({'ok': False, 'error': 'Invalid VM name'}), 400
     try:
         data = request.get_json(silent=True) or {}
         aggressive = bool(data.get('aggressive', True)) if isinstance(data, dict) else True
         mode = (data.get('mode') if isinstance(data, dict) else None) or 'standard'
-        result = _recover_vm(name, source='dashboard', aggressive=aggressive, mode=mode)
-        return jsonify(result), (200 if result.get('ok') else 500)
+        host = _vm_host()
+        payload = {'name': name, 'host_id': host.host_id, 'aggressive': aggressive, 'mode': mode, 'source': 'dashboard'}
+        # A queued escalation recovers the VM first, so it covers this request too.
+        job_id, deduplicated = _enqueue_vm_job('recover-vm', name, payload, dedup_types=('recover-vm', 'escalate-vm'))
+        return jsonify({'ok': True, 'jobId': job_id, 'deduplicated': deduplicated}), 202
+    except VmHostUnavailable as exc:
+        return _vm_host_error_response(exc)
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
 
@@ -3448,9 +4310,11 @@ def api_vm_escalate(name):
         reason = data.get('reason') if isinstance(data, dict) else None
         if not reason:
             reason = 'Dashboard recovery help requested by user'
-        rec = _recover_vm(name, source='hermes-escalation', aggressive=True)
-        esc = _escalate_vm_to_hermes(name, reason, {'recovery': rec, 'request': data})
-        return jsonify({'ok': True, 'recovery': rec, 'escalation': esc})
+        payload = {'name': name, 'host_id': _vm_host().host_id, 'reason': reason, 'request': data}
+        job_id, deduplicated = _enqueue_vm_job('escalate-vm', name, payload)
+        return jsonify({'ok': True, 'jobId': job_id, 'deduplicated': deduplicated}), 202
+    except VmHostUnavailable as exc:
+        return _vm_host_error_response(exc)
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
 
@@ -3460,7 +4324,10 @@ def api_stop(name):
     try:
         host = _vm_host()
         _ensure_remote_vm_exists(host, name)
-        host.check_call('stop', name)
+        try:
+            host.check_call('stop', name)
+        finally:
+            _invalidate_inventory(host)
         return jsonify({'ok': True})
     except VmHostUnavailable as exc:
         return _vm_host_error_response(exc)
@@ -3473,7 +4340,10 @@ def api_delete(name):
     try:
         host = _vm_host()
         _ensure_remote_vm_exists(host, name)
-        host.check_call('delete', name)
+        try:
+            host.check_call('delete', name)
+        finally:
+            _invalidate_inventory(host)
         return jsonify({'ok': True})
     except VmHostUnavailable as exc:
         return _vm_host_error_response(exc)
@@ -3687,7 +4557,7 @@ def _dashboard_overview_host_payload():
 
 def _dashboard_overview_payload():
     payload = _dashboard_overview_host_payload()
-    payload['instances'] = manager_json_fleet_list()
+    payload['instances'], payload['hostTimings'] = manager_json_fleet_inventory()
     return payload
 
 
@@ -3746,8 +4616,9 @@ def dashboard_v2_vm_logs_alias(name):
 @app.get('/Dashboard/api/vm/stats')
 @v2_auth_required
 def dashboard_v2_vm_stats():
-    """Return per-VM CPU and memory percentages by calling `docker stats --no-stream`.
-    The result maps VM name (without the `blobevm_` prefix) to {'cpu_percent': float, 'mem_percent': float}.
+    """Return per-VM CPU, memory and I/O counters from the shared stats cache.
+    The result maps VM name (without the `blobevm_` prefix) to {'cpu_percent': float, 'mem_percent': float}
+    plus the byte counters (`mem_bytes`, `mem_limit`, `net_rx`, `net_tx`, `block_read`, `block_write`) and `pids`.
     """
     stats = {}
     try:
@@ -3760,6 +4631,8 @@ def dashboard_v2_vm_stats():
             if vmname.startswith('blobevm_'):
                 vmname = vmname[len('blobevm_'):]
             stats[vmname] = {'cpu_percent': round(cpu,2), 'mem_percent': round(mem,2), 'container_name': cname}
+            for key in ('mem_bytes', 'mem_limit', 'net_rx', 'net_tx', 'block_read', 'block_write', 'pids'):
+                stats[vmname][key] = record.get(key, 0)
         return jsonify({'ok': True, 'vms': stats})
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -3771,6 +4644,151 @@ def dashboard_v2_vm_stats_alias():
     return dashboard_v2_vm_stats()
 
 
+def _metrics_query(key):
+    """Shared handler for the metrics history routes.
+
+    Accepts `start`/`end` (epoch seconds) or `range` (seconds back from now)
+    and an optional `step` (2, 60 or 900) to force a rollup tier.
+    """
+    try:
+        end = request.args.get('end', type=float)
+        start = request.args.get('start', type=float)
+        span = request.args.get('range', type=float)
+        step = request.args.get('step', type=int)
+        if start is None and span:
+            start = (end if end is not None else time.time()) - max(0.0, span)
+        result = METRICS_STORE.query(key, start=start, end=end, step=step)
+        return jsonify({'ok': True, **result})
+    except Exception as e:
+        return jsonify({'ok': False, 'error': str(e)}), 500
+
+
+@app.get('/dashboard/api/metrics/host')
+@v2_auth_required
+def dashboard_metrics_host():
+    return _metrics_query(METRICS_HOST_KEY)
+
+
+@app.get('/dashboard/api/metrics/vm/<name>')
+@v2_auth_required
+def dashboard_metrics_vm(name):
+    return _metrics_query(name)
+
+
+# --- Live events (SSE) ---------------------------------------------------
+# One watcher feeds EVENT_BUS; every /dashboard/api/events subscriber reads
+# from its own queue, so server work tracks changes rather than clients.
+try:
+    EVENTS_POLL_SECONDS = max(1.0, float(os.environ.get('BLOBEVM_EVENTS_POLL', '3')))
+except ValueError:
+    EVENTS_POLL_SECONDS = 3.0
+try:
+    EVENTS_HEARTBEAT_SECONDS = max(0.05, float(os.environ.get('BLOBEVM_EVENTS_HEARTBEAT', '15')))
+except ValueError:
+    EVENTS_HEARTBEAT_SECONDS = 15.0
+_event_watcher_lock = threading.Lock()
+_event_watcher_thread = None
+_last_pressure_level = None
+
+
+# Index resyncs ('sync') and `docker ps` diffs ('status') carry state too.
+VM_EVENT_ACTIONS = LIFECYCLE_ACTIONS | {'sync', 'status'}
+
+
+def _publish_vm_event(action, cname, entry):
+    if action not in VM_EVENT_ACTIONS or not str(cname or '').startswith('blobevm_'):
+        return
+    entry = entry or {}
+    EVENT_BUS.publish('vm', {
+        'name': cname[len('blobevm_'):],
+        'action': action,
+        'exists': bool(entry),
+        'running': bool(entry.get('running')),
+        'state': entry.get('state') or ('missing' if not entry else ''),
+        'health': entry.get('health') or '',
+    })
+
+
+def _publish_optimizer_event(kind, payload):
+    global _last_pressure_level
+    if kind == 'notification':
+        EVENT_BUS.publish('notification', payload)
+        return
+    if kind != 'run':
+        return
+    pressure = payload.get('hostPressure') or {}
+    level = pressure.get('level')
+    if level and level != _last_pressure_level:
+        EVENT_BUS.publish('pressure', {'level': level, 'previous': _last_pressure_level, 'score': pressure.get('score')})
+        _last_pressure_level = level
+    if payload.get('events'):
+        EVENT_BUS.publish('optimizer', {'ts': payload.get('ts'), 'events': payload['events']})
+
+
+def _event_watcher_loop():
+    """Diff one `docker ps` per tick while the container index is not live.
+
+    Exits when the last subscriber disconnects; EVENT_BUS restarts it on the
+    next subscription.
+    """
+    previous = None
+    while EVENT_BUS.subscriber_count():
+        if CONTAINER_INDEX.live:
+            previous = None
+        else:
+            current = {cname: item.get('status') or '' for cname, item in _docker_ps_vm_snapshot().items()}
+            if previous is not None:
+                for cname in sorted(set(previous) | set(current)):
+                    if previous.get(cname) == current.get(cname):
+                        continue
+                    status = current.get(cname)
+                    running = (status or '').startswith('Up')
+                    entry = None if status is None else {'running': running, 'state': 'running' if running else 'exited'}
+                    _publish_vm_event('status', cname, entry)
+            previous = current
+        time.sleep(EVENTS_POLL_SECONDS)
+
+
+def _start_event_watcher():
+    global _event_watcher_thread
+    with _event_watcher_lock:
+        if _event_watcher_thread is not None and _event_watcher_thread.is_alive():
+            return
+        _event_watcher_thread = threading.Thread(target=_event_watcher_loop, name='events-watcher', daemon=True)
+        _event_watcher_thread.start()
+
+
+CONTAINER_INDEX.add_listener(_publish_vm_event)
+dash_optimizer.add_event_listener(_publish_optimizer_event)
+EVENT_BUS.on_first_subscriber(_start_event_watcher)
+JOB_SCHEDULER.add_queue_listener(lambda: EVENT_BUS.publish('job-queue', {'positions': JOB_SCHEDULER.positions()}))
+
+
+@app.get('/dashboard/api/events')
+@auth_required
+def api_events():
+    """Server-Sent Events: `vm`, `job`, `pressure`, `optimizer`, `notification`.
+
+    `?vm=<name>` limits the stream to one VM (VM wrapper pages). A `resync`
+    event means events were missed and the client should refetch state.
+    """
+    vm = (request.args.get('vm') or '').strip() or None
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('lastEventId')
+    subscription = EVENT_BUS.subscribe(vm=vm, last_event_id=last_event_id)
+
+    def generate():
+        try:
+            yield 'retry: 3000\n\n'
+            yield from EVENT_BUS.stream(subscription, heartbeat=EVENTS_HEARTBEAT_SECONDS)
+        finally:
+            EVENT_BUS.unsubscribe(subscription)
+
+    resp = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    resp.headers['Cache-Control'] = 'no-cache'
+    resp.headers['X-Accel-Buffering'] = 'no'
+    return resp
+
+
 @app.get('/dashboard/api/v2/info')
 @auth_required
 def dashboard_v2_info():
@@ -3877,6 +4895,7 @@ def api_reset(name):
                 host.run_manager('start', vm_name, capture_output=True, text=True)
             except Exception:
                 pass
+            _invalidate_inventory(host)
         threading.Thread(target=worker, args=(name,), daemon=True).start()
         return jsonify({'ok': True, 'started': True})
     except Exception as e:
@@ -3889,6 +4908,7 @@ def api_restart(name):
         host = _vm_host()
         _ensure_remote_vm_exists(host, name)
         r = host.run_manager('restart', name, capture_output=True, text=True)
+        _invalidate_inventory(host)
         ok = (r.returncode == 0)
         return jsonify({'ok': ok, 'output': r.stdout.strip(), 'error': r.stderr.strip()})
     except VmHostUnavailable as exc:
@@ -3900,13 +4920,61 @@ def api_restart(name):
 @app.post('/dashboard/api/recreate')
 @auth_required
 def api_recreate():
-    names = request.json.get('names', [])
+    """Recreate the named VMs as a background bulk job (one sub-job per VM)."""
+    data = request.get_json(silent=True) or {}
+    names = _normalize_vm_names(data.get('names') or [])
     if not names:
         return jsonify({'error': 'No VM names provided'}), 400
     try:
-        result = _vm_host().run_manager('recreate', *names, capture_output=True, text=True)
-        ok = (result.returncode == 0)
-        return jsonify({'ok': ok, 'output': result.stdout.strip(), 'error': result.stderr.strip()})
+        host = _vm_host()
+        job_id, children = _start_bulk_job('recreate', names, host, parallelism=data.get('parallelism'))
+        return jsonify({'ok': True, 'jobId': job_id, 'count': len(names), 'jobs': children}), 202
+    except VmHostUnavailable as exc:
+        return _vm_host_error_response(exc)
+    except Exception as e:
+        return jsonify({'ok': False, 'error': str(e)}), 500
+
+@app.post('/dashboard/api/vms/bulk')
+@auth_required
+def api_vms_bulk():
+    """Run start/stop/restart/recreate/reset across VMs as parallel per-VM sub-jobs.
+
+    Body: `{action, names | all, parallelism?, maxFailures?, confirm?}`; reset
+    needs `confirm: "DELETE"`. Poll `/dashboard/api/jobs/<jobId>` for the
+    aggregate summary and each VM's sub-job.
+    """
+    data = request.get_json(silent=True) or {}
+    action = str(data.get('action') or '').strip().lower()
+    if action not in BULK_ACTION_STEPS:
+        return jsonify({'ok': False, 'error': 'action must be one of: ' + ', '.join(BULK_ACTION_STEPS)}), 400
+    if action == 'reset' and data.get('confirm') != 'DELETE':
+        return jsonify({'ok': False, 'error': 'Type DELETE to confirm resetting these VMs'}), 400
+    max_failures = data.get('maxFailures')
+    try:
+        max_failures = None if max_failures in (None, '') else max(0, int(max_failures))
+    except (TypeError, ValueError):
+        return jsonify({'ok': False, 'error': 'maxFailures must be an integer'}), 400
+    try:
+        host = _vm_host()
+        if data.get('all'):
+            names = [item.get('name') for item in manager_json_list(host_id=getattr(host, 'host_id', None))]
+        else:
+            names = data.get('names') or []
+            if not isinstance(names, list):
+                return jsonify({'ok': False, 'error': 'names must be a list'}), 400
+        names = _normalize_vm_names(names)
+        if not names:
+            return jsonify({'ok': False, 'error': 'No VM names provided'}), 400
+        invalid = [name for name in names if not re.fullmatch(r'[a-z0-9][a-z0-9._-]{0,62}', name)]
+        if invalid:
+            return jsonify({'ok': False, 'error': 'Invalid VM name: ' + ', '.join(invalid)}), 400
+        # The echoed parallelism is the effective one, after the scheduler's caps.
+        parallelism = _bulk_parallelism(data.get('parallelism'), action)
+        job_id, children = _start_bulk_job(action, names, host, parallelism=parallelism, max_failures=max_failures)
+        return jsonify({'ok': True, 'jobId': job_id, 'count': len(names), 'parallelism': parallelism,
+                        'requestedParallelism': _bulk_parallelism(data.get('parallelism')), 'jobs': children}), 202
+    except VmHostUnavailable as exc:
+        return _vm_host_error_response(exc)
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
 
@@ -3919,16 +4987,23 @@ def api_rebuild_vms():
     for n in names:
         _set_flag(n, 'rebuilding', True)
     host = _vm_host()
-    def worker(targets):
-        try:
-            result = host.run_manager('rebuild-vms', *targets, capture_output=True, text=True)
-            return result.returncode == 0, (result.stdout or '') + (result.stderr or '')
-        finally:
-            for n in targets:
-                _set_flag(n, 'rebuilding', False)
-    job_id = _start_job('rebuild-vms', names, lambda: worker(names))
+    job_id = _enqueue_job('rebuild-vms', names, {'host_id': host.host_id, 'command': 'rebuild-vms', 'args': names, 'flagged': names})
     return jsonify({'ok': True, 'jobId': job_id}), 202
 
+
+@_job_handler('rebuild-vms', 'update-and-rebuild', 'delete-all-instances')
+def _manager_command_job(job_id, payload):
+    flagged = payload.get('flagged') or []
+    for n in flagged:
+        _set_flag(n, 'rebuilding', True)
+    try:
+        host = _vm_host(payload.get('host_id') or 'local')
+        result = _job_run_manager(host, payload['command'], *(payload.get('args') or []))
+        return result.returncode == 0, (result.stdout or '') + (result.stderr or '')
+    finally:
+        for n in flagged:
+            _set_flag(n, 'rebuilding', False)
+
 @app.post('/dashboard/api/update-and-rebuild')
 @auth_required
 def api_update_and_rebuild():
@@ -3944,14 +5019,8 @@ def api_update_and_rebuild():
     for n in targets:
         _set_flag(n, 'rebuilding', True)
     host = _vm_host()
-    def worker(tgts):
-        try:
-            result = host.run_manager('update-and-rebuild', *names, capture_output=True, text=True)
-            return result.returncode == 0, (result.stdout or '') + (result.stderr or '')
-        finally:
-            for n in tgts:
-                _set_flag(n, 'rebuilding', False)
-    job_id = _start_job('update-and-rebuild', targets, lambda: worker(targets))
+    payload = {'host_id': host.host_id, 'command': 'update-and-rebuild', 'args': names, 'flagged': targets}
+    job_id = _enqueue_job('update-and-rebuild', targets, payload)
     return jsonify({'ok': True, 'jobId': job_id}), 202
 
 @app.post('/dashboard/api/delete-all-instances')
@@ -3962,10 +5031,7 @@ def api_delete_all_instances():
         return jsonify({'ok': False, 'error': 'Type DELETE to confirm deleting every VM'}), 400
     try:
         host = _vm_host()
-        def worker():
-            result = host.run_manager('delete-all-instances', '--yes', capture_output=True, text=True)
-            return result.returncode == 0, (result.stdout or '') + (result.stderr or '')
-        job_id = _start_job('delete-all-instances', [], worker)
+        job_id = _enqueue_job('delete-all-instances', [], {'host_id': host.host_id, 'command': 'delete-all-instances', 'args': ['--yes']})
         return jsonify({'ok': True, 'jobId': job_id}), 202
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -3991,17 +5057,7 @@ def api_reset_all_instances():
                 names = []
 
         host = _vm_host()
-        def worker(all_names):
-            output = []
-            ok = True
-            for n in all_names:
-                for action in ('delete', 'create', 'start'):
-                    result = host.run_manager(action, n, capture_output=True, text=True)
-                    output.append((result.stdout or '') + (result.stderr or ''))
-                    ok = ok and result.returncode == 0
-            return ok, '\n'.join(output)
-
-        job_id = _start_job('reset-all-instances', names, lambda: worker(names))
+        job_id, _ = _start_bulk_job('reset', names, host, parallelism=data.get('parallelism'), job_type='reset-all-instances')
         return jsonify({'ok': True, 'jobId': job_id, 'count': len(names)}), 202
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -4010,28 +5066,33 @@ def api_reset_all_instances():
 @auth_required
 def api_prune_docker():
     """Prune only Docker resources explicitly owned by EpicVM."""
-    def worker():
-        results = [
-            _docker('container', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
-            _docker('volume', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
-            _docker('network', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
-        ]
-        output = '\n'.join((r.stdout or '') + (r.stderr or '') for r in results)
-        return all(r.returncode == 0 for r in results), output
     try:
-        job_id = _start_job('prune-blobevm-resources', [], worker)
+        job_id = _enqueue_job('prune-blobevm-resources', [], {})
         return jsonify({'ok': True, 'jobId': job_id}), 202
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
 
+
+@_job_handler('prune-blobevm-resources', 'optimizer-clean-blobevm-resources')
+def _prune_managed_resources_job(job_id, payload):
+    results = [
+        _docker('container', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
+        _docker('volume', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
+        _docker('network', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
+    ]
+    output = '\n'.join((r.stdout or '') + (r.stderr or '') for r in results)
+    return all(r.returncode == 0 for r in results), output
+
 @app.get('/dashboard/api/jobs')
 @admin_auth_required
 def dashboard_jobs_list():
     _init_users_db()
     conn = _users_conn()
     try:
-        rows = conn.execute('SELECT * FROM jobs ORDER BY created_at DESC LIMIT 100').fetchall()
-        return jsonify({'ok': True, 'jobs': [_job_row_to_dict(row) for row in rows]})
+        # Bulk sub-jobs are listed under their parent (`/dashboard/api/jobs/<id>`).
+        rows = conn.execute('SELECT * FROM jobs WHERE parent_id IS NULL ORDER BY created_at DESC LIMIT 100').fetchall()
+        positions = JOB_SCHEDULER.positions()
+        return jsonify({'ok': True, 'jobs': [_job_row_to_dict(row, positions) for row in rows], 'queued': len(positions), 'running': JOB_SCHEDULER.running_count()})
     finally:
         conn.close()
 
@@ -4044,27 +5105,98 @@ def dashboard_job_get(job_id):
         row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
         if not row:
             return jsonify({'ok': False, 'error': 'Job not found'}), 404
-        return jsonify({'ok': True, 'job': _job_row_to_dict(row)})
+        job = _job_row_to_dict(row)
+        children = conn.execute('SELECT * FROM jobs WHERE parent_id = ? ORDER BY rowid', (job_id,)).fetchall()
+        if children:
+            positions = JOB_SCHEDULER.positions()
+            job['children'] = [_job_row_to_dict(child, positions) for child in children]
+            summary = {'total': len(children)}
+            for child in job['children']:
+                summary[child['status']] = summary.get(child['status'], 0) + 1
+            job['summary'] = summary
+        return jsonify({'ok': True, 'job': job})
     finally:
         conn.close()
 
+def _job_status(job_id):
+    conn = _users_conn()
+    try:
+        row = conn.execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return row['status'] if row else None
+    finally:
+        conn.close()
+
+@app.get('/dashboard/api/jobs/<job_id>/log')
+@admin_auth_required
+def dashboard_job_log(job_id):
+    """Job output from byte `offset`; `?follow=1` (or an SSE Accept) streams it.
+
+    Polling clients pass the returned `nextOffset` back as `offset`. Followers
+    get `log` events with `{offset, data}` and one `end` event once the job
+    has finished and its log is drained.
+    """
+    if not JOB_ID_RE.match(job_id or ''):
+        return jsonify({'ok': False, 'error': 'Invalid job id'}), 400
+    _init_users_db()
+    status = _job_status(job_id)
+    if status is None:
+        return jsonify({'ok': False, 'error': 'Job not found'}), 404
+    try:
+        offset = max(0, int(request.args.get('offset') or 0))
+        limit = min(1 << 20, max(1024, int(request.args.get('limit') or 65536)))
+    except ValueError:
+        return jsonify({'ok': False, 'error': 'offset and limit must be integers'}), 400
+    follow = (request.args.get('follow') or '').lower() in ('1', 'true', 'yes') or \
+        'text/event-stream' in (request.headers.get('Accept') or '')
+    if not follow:
+        data, next_offset, size = JOB_LOGS.read(job_id, offset, limit)
+        done = status not in ('queued', 'running') and next_offset >= size
+        return jsonify({'ok': True, 'jobId': job_id, 'status': status, 'offset': offset, 'nextOffset': next_offset, 'size': size, 'data': data, 'done': done})
+
+    def generate():
+        position = offset
+        yield 'retry: 3000\n\n'
+        while True:
+            start = position
+            data, position, size = JOB_LOGS.read(job_id, position, limit)
+            if data:
+                yield format_sse(None, 'log', {'offset': start, 'data': data})
+                continue
+            # The runner writes the whole log before marking the job finished.
+            current = _job_status(job_id)
+            if current not in ('queued', 'running') and position >= JOB_LOGS.size(job_id):
+                yield format_sse(None, 'end', {'status': current, 'offset': position})
+                return
+            if not JOB_LOGS.wait(job_id, position, EVENTS_HEARTBEAT_SECONDS):
+                yield ': keep-alive\n\n'
+
+    resp = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    resp.headers['Cache-Control'] = 'no-cache'
+    resp.headers['X-Accel-Buffering'] = 'no'
+    return resp
+
 @app.post('/dashboard/api/update-vm/<name>')
 @auth_required
 def api_update_vm(name):
     # Set transient updating flag and run in background to avoid blocking and to show status
     try:
         _set_flag(name, 'updating', True)
-        def worker(vm_name):
-            try:
-                ok, out, err, _ = _run_manager('update-vm', vm_name)
-                return ok, out or err
-            finally:
-                _set_flag(vm_name, 'updating', False)
-        job_id = _start_job('update-vm', [name], lambda: worker(name))
+        job_id = _enqueue_job('update-vm', [name], {'name': name})
         return jsonify({'ok': True, 'jobId': job_id}), 202
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
 
+
+@_job_handler('update-vm')
+def _update_vm_job(job_id, payload):
+    vm_name = payload['name']
+    _set_flag(vm_name, 'updating', True)
+    try:
+        ok, out, err, _ = _run_manager('update-vm', vm_name)
+        return ok, out or err
+    finally:
+        _set_flag(vm_name, 'updating', False)
+
 @app.post('/dashboard/api/app-install/<name>/<app>')
 @auth_required
 def api_app_install(name, app):
@@ -4168,22 +5300,25 @@ def api_check(name):
         return jsonify({'ok': True, 'code': code, 'url': url, 'fixed': False})
     if nofix:
         return jsonify({'ok': False, 'code': code, 'url': url, 'output': 'no-fix mode'}), 400
-    # Attempt auto-resolve: recreate container and retry briefly
+    # Attempt auto-resolve: recreate the container and wait for it to serve
     fixed = False
+    boot_seconds = None
     try:
         cname = f'blobevm_{name}'
-        subprocess.run(['docker', 'rm', '-f', cname], capture_output=True)
+        started = VM_READINESS.now()
+        _docker('rm', '-f', cname)
         _vm_host().run_manager('start', name, capture_output=True)
-        for _ in range(8):
-            time.sleep(1)
-            url = _build_vm_url(name)
-            code = _http_check(url)
-            if code and 200 <= code < 400:
-                fixed = True
-                break
+        url = _build_vm_url(name)
+        # This runs on a request thread, so it gets a short budget rather than
+        # BLOBEVM_VM_READY_TIMEOUT; the probe itself checks the external URL.
+        ready = _wait_vm_ready(name, started_at=started, source='check', timeout=CHECK_READY_TIMEOUT, url=url)
+        code = (ready['detail'] or {}).get('urlCode') or 0
+        fixed = bool(ready['ready'])
+        if fixed:
+            boot_seconds = ready['seconds']
     except Exception:
         pass
-    return jsonify({'ok': (code and 200 <= code < 400), 'code': code or 0, 'url': url, 'fixed': fixed})
+    return jsonify({'ok': (code and 200 <= code < 400), 'code': code or 0, 'url': url, 'fixed': fixed, 'bootSeconds': boot_seconds})
 
 @app.post('/dashboard/api/enable-single-port')
 @auth_required
@@ -4233,7 +5368,7 @@ def api_disable_single_port():
 def api_optimizer_status():
     """Return optimizer status and stats via embedded optimizer module."""
     try:
-        s = dash_optimizer.status()
+        s = _optimizer_status()
         return jsonify({'ok': True, 'cfg': s.get('cfg'), 'stats': s.get('stats'), 'lastRestart': s.get('lastRestart'), 'lastRun': s.get('lastRun')})
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -4243,7 +5378,7 @@ def api_optimizer_status():
 @auth_required
 def api_optimizer_v2_summary():
     try:
-        s = dash_optimizer.status()
+        s = _optimizer_status()
         stats = s.get('stats') or {}
         return jsonify({
             'ok': True,
@@ -4341,7 +5476,7 @@ def api_optimizer_activity(name):
 def api_optimizer_admission(name):
     try:
         force = request.args.get('force') in ('1', 'true', 'yes', 'on')
-        s = dash_optimizer.status()
+        s = _optimizer_status()
         stats = s.get('stats') or {}
         profiles = stats.get('profiles') or {}
         profile = profiles.get(name, 'desktop')
@@ -4393,16 +5528,8 @@ def api_optimizer_logs():
 @auth_required
 def api_optimizer_clean_system():
     """Clean only explicitly labelled EpicVM Docker resources."""
-    def worker():
-        results = [
-            _docker('container', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
-            _docker('volume', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
-            _docker('network', 'prune', '-f', '--filter', 'label=com.blobevm.managed=1'),
-        ]
-        output = '\n'.join((r.stdout or '') + (r.stderr or '') for r in results)
-        return all(r.returncode == 0 for r in results), output
     try:
-        job_id = _start_job('optimizer-clean-blobevm-resources', [], worker)
+        job_id = _enqueue_job('optimizer-clean-blobevm-resources', [], {})
         return jsonify({'ok': True, 'jobId': job_id}), 202
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -4417,4 +5544,16 @@ if __name__ == '__main__':
         dash_optimizer.start_background_loop()
     except Exception:
         pass
+    try:
+        start_docker_stats_sampler()
+    except Exception:
+        pass
+    try:
+        start_container_index()
+    except Exception:
+        pass
+    try:
+        start_job_recovery()
+    except Exception:
+        pass
     app.run(host='0.0.0.0', port=5000)
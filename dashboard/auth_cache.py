@@ -0,0 +1,96 @@
+"""Short-lived cache of per-VM forward-auth decisions.
+
+Traefik calls ``/dashboard/auth/vm/<name>`` for every proxied request of a VM
+page (noVNC assets, websocket upgrades), so a page load turns into bursts of
+identical checks.  Each check verifies session HMACs, looks the user up in
+SQLite and reads the VM's access mode.  The decision for a given pair of
+session cookies and VM is kept for a few seconds; anything that changes
+users, VM assignments, access modes or the SSO setting drops every entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 5.0
+
+
+def _env_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get("BLOBEVM_FORWARD_AUTH_TTL", DEFAULT_TTL_SECONDS)))
+    except ValueError:
+        return DEFAULT_TTL_SECONDS
+
+
+def token_digest(token: Optional[str]) -> str:
+    """Hash a session cookie so raw tokens never sit in the cache."""
+    if not token:
+        return ""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class AuthDecisionCache:
+    """Thread-safe LRU of ``key -> decision`` with a TTL and a generation.
+
+    A decision computed while an invalidation happened is returned to its
+    caller but not stored, so a revoked assignment is never re-cached.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: int = 4096,
+                 clock: Optional[Callable[[], float]] = None):
+        self.ttl = _env_ttl() if ttl is None else float(ttl)
+        self.max_entries = max_entries
+        self.clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+        self._generation = 0
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.clock() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Tuple, decision: str, generation: int) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (self.clock() + self.ttl, decision)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+FORWARD_AUTH_CACHE = AuthDecisionCache()
+
+
+__all__ = [
+    "AuthDecisionCache",
+    "FORWARD_AUTH_CACHE",
+    "token_digest",
+]
@@ -0,0 +1,264 @@
+"""Daemon-free per-VM CPU and memory statistics from cgroup v2 files.
+
+Container names are resolved from Docker's on-disk ``config.v2.json`` records
+and sampled from the unified cgroup hierarchy, so a refresh costs a handful of
+small file reads per VM instead of a ``docker stats`` round-trip.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_CGROUP_ROOT = "/sys/fs/cgroup"
+DEFAULT_CONTAINERS_ROOT = "/var/lib/docker/containers"
+DEFAULT_MEMINFO = "/proc/meminfo"
+DEFAULT_PROC_ROOT = "/proc"
+VM_CONTAINER_PREFIX = "blobevm_"
+_PRIME_INTERVAL = 0.1
+
+
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as handle:
+        return handle.read()
+
+
+def _read_int(path: str) -> Optional[int]:
+    """Return an integer cgroup value, ``None`` for ``max`` or missing files."""
+    try:
+        value = _read_text(path).strip()
+    except OSError:
+        return None
+    if not value or value == "max":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _read_io_stat(path: str) -> Tuple[int, int]:
+    """Sum ``rbytes``/``wbytes`` across devices in a cgroup ``io.stat``."""
+    read = write = 0
+    try:
+        text = _read_text(path)
+    except OSError:
+        return 0, 0
+    for line in text.splitlines():
+        for field in line.split()[1:]:
+            key, _, value = field.partition("=")
+            if key == "rbytes" and value.isdigit():
+                read += int(value)
+            elif key == "wbytes" and value.isdigit():
+                write += int(value)
+    return read, write
+
+
+def _read_net_dev(path: str) -> Tuple[int, int]:
+    """Sum rx/tx bytes over non-loopback interfaces in ``/proc/<pid>/net/dev``."""
+    rx = tx = 0
+    try:
+        text = _read_text(path)
+    except OSError:
+        return 0, 0
+    for line in text.splitlines()[2:]:
+        iface, _, counters = line.partition(":")
+        fields = counters.split()
+        if iface.strip() == "lo" or len(fields) < 9:
+            continue
+        try:
+            rx += int(fields[0])
+            tx += int(fields[8])
+        except ValueError:
+            continue
+    return rx, tx
+
+
+def _read_keyed(path: str) -> Dict[str, int]:
+    values: Dict[str, int] = {}
+    try:
+        text = _read_text(path)
+    except OSError:
+        return values
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            try:
+                values[parts[0]] = int(parts[1])
+            except ValueError:
+                continue
+    return values
+
+
+class CgroupStatsReader:
+    """Sample ``blobevm_*`` containers straight from ``/sys/fs/cgroup``.
+
+    CPU percentages are computed from ``usage_usec`` deltas between reads and
+    use the same scale as ``docker stats`` (100% per fully busy core).  Network
+    counters come from the network namespace of the container's first process.
+    """
+
+    def __init__(self, cgroup_root: Optional[str] = None,
+                 containers_root: Optional[str] = None,
+                 meminfo_path: Optional[str] = None,
+                 proc_root: Optional[str] = None,
+                 clock: Optional[Callable[[], float]] = None,
+                 prime_interval: float = _PRIME_INTERVAL,
+                 prefix: str = VM_CONTAINER_PREFIX):
+        self.cgroup_root = cgroup_root or os.environ.get("BLOBEVM_CGROUP_ROOT", DEFAULT_CGROUP_ROOT)
+        self.containers_root = containers_root or os.environ.get(
+            "BLOBEVM_DOCKER_CONTAINERS_ROOT", DEFAULT_CONTAINERS_ROOT)
+        self.meminfo_path = meminfo_path or DEFAULT_MEMINFO
+        self.proc_root = proc_root or DEFAULT_PROC_ROOT
+        self.clock = clock or time.monotonic
+        self.prime_interval = max(0.0, float(prime_interval))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._configs: Dict[str, Tuple[Tuple[int, int], Tuple[Optional[str], bool]]] = {}
+        self._previous: Dict[str, Tuple[float, int]] = {}
+
+    def available(self) -> bool:
+        return (os.path.isfile(os.path.join(self.cgroup_root, "cgroup.controllers"))
+                and os.path.isdir(self.containers_root))
+
+    def _container_info(self, container_id: str) -> Tuple[Optional[str], bool]:
+        """Return ``(name, running)`` from a container's ``config.v2.json``."""
+        path = os.path.join(self.containers_root, container_id, "config.v2.json")
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, False
+        signature = (int(st.st_mtime_ns), int(st.st_size))
+        cached = self._configs.get(container_id)
+        if cached and cached[0] == signature:
+            return cached[1]
+        info: Tuple[Optional[str], bool] = (None, False)
+        try:
+            config = json.loads(_read_text(path))
+            name = str(config.get("Name") or "").lstrip("/") or None
+            info = (name, bool((config.get("State") or {}).get("Running")))
+        except (OSError, ValueError, AttributeError):
+            pass
+        self._configs[container_id] = (signature, info)
+        return info
+
+    def containers(self) -> List[Tuple[str, str, str]]:
+        """Return ``(name, container_id, cgroup_dir)`` for running VM containers.
+
+        Raises ``OSError`` when Docker reports running VM containers but none
+        of them has a cgroup in a known layout (private cgroup namespace,
+        custom cgroup parent, rootless Docker), so callers fall back to the
+        engine API instead of showing no stats.
+        """
+        try:
+            entries = os.listdir(self.containers_root)
+        except OSError as exc:
+            raise OSError(f"cannot list docker containers: {exc}") from exc
+        found = []
+        unresolved = []
+        for container_id in entries:
+            name, running = self._container_info(container_id)
+            if not name or not name.startswith(self.prefix):
+                continue
+            cgroup_dir = self._cgroup_dir(container_id)
+            if cgroup_dir:
+                found.append((name, container_id, cgroup_dir))
+            elif running:
+                unresolved.append(name)
+        self._configs = {key: value for key, value in self._configs.items() if key in entries}
+        if unresolved and not found:
+            raise OSError(f"no cgroup found under {self.cgroup_root} for running containers: {', '.join(sorted(unresolved))}")
+        return sorted(found)
+
+    def _cgroup_dir(self, container_id: str) -> Optional[str]:
+        # systemd cgroup driver first, then the cgroupfs driver layout.
+        for candidate in (
+            os.path.join(self.cgroup_root, "system.slice", f"docker-{container_id}.scope"),
+            os.path.join(self.cgroup_root, "docker", container_id),
+        ):
+            if os.path.isfile(os.path.join(candidate, "cpu.stat")):
+                return candidate
+        return None
+
+    def _host_mem_total(self) -> int:
+        try:
+            text = _read_text(self.meminfo_path)
+        except OSError:
+            return 0
+        for line in text.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[0] == "MemTotal:" and parts[1].isdigit():
+                return int(parts[1]) * 1024
+        return 0
+
+    def _net_io(self, cgroup_dir: str) -> Tuple[int, int]:
+        try:
+            pid = _read_text(os.path.join(cgroup_dir, "cgroup.procs")).split()[0]
+        except (OSError, IndexError):
+            return 0, 0
+        return _read_net_dev(os.path.join(self.proc_root, pid, "net", "dev"))
+
+    def read(self) -> List[Dict[str, object]]:
+        if not self.available():
+            raise OSError(f"cgroup v2 hierarchy unavailable at {self.cgroup_root}")
+        with self._lock:
+            containers = self.containers()
+            if containers and not self._previous and self.prime_interval:
+                # The very first read has no CPU baseline; take one so callers
+                # do not see every VM at 0% right after startup.
+                now = self.clock()
+                for _name, container_id, cgroup_dir in containers:
+                    usage = _read_keyed(os.path.join(cgroup_dir, "cpu.stat")).get("usage_usec")
+                    if usage is not None:
+                        self._previous[container_id] = (now, usage)
+                time.sleep(self.prime_interval)
+            host_total = None
+            records: List[Dict[str, object]] = []
+            previous: Dict[str, Tuple[float, int]] = {}
+            now = self.clock()
+            for name, container_id, cgroup_dir in containers:
+                usage = _read_keyed(os.path.join(cgroup_dir, "cpu.stat")).get("usage_usec")
+                current = _read_int(os.path.join(cgroup_dir, "memory.current"))
+                if usage is None or current is None:
+                    continue
+                cpu = 0.0
+                last = self._previous.get(container_id)
+                if last and now > last[0] and usage >= last[1]:
+                    cpu = (usage - last[1]) / ((now - last[0]) * 1_000_000) * 100.0
+                previous[container_id] = (now, usage)
+                inactive = _read_keyed(os.path.join(cgroup_dir, "memory.stat")).get("inactive_file", 0)
+                used = max(0, current - inactive)
+                limit = _read_int(os.path.join(cgroup_dir, "memory.max"))
+                if limit is None:
+                    if host_total is None:
+                        host_total = self._host_mem_total()
+                    limit = host_total
+                swap = _read_int(os.path.join(cgroup_dir, "memory.swap.current")) or 0
+                net_rx, net_tx = self._net_io(cgroup_dir)
+                block_read, block_write = _read_io_stat(os.path.join(cgroup_dir, "io.stat"))
+                records.append({
+                    "name": name,
+                    "cpu_percent": round(cpu, 2),
+                    "mem_percent": round(used / limit * 100.0, 2) if limit else 0.0,
+                    "mem_bytes": used,
+                    "mem_limit": int(limit or 0),
+                    "swap_bytes": swap,
+                    "net_rx": net_rx,
+                    "net_tx": net_tx,
+                    "block_read": block_read,
+                    "block_write": block_write,
+                    "pids": _read_int(os.path.join(cgroup_dir, "pids.current")) or 0,
+                })
+            self._previous = previous
+            return records
+
+
+__all__ = [
+    "CgroupStatsReader",
+    "DEFAULT_CGROUP_ROOT",
+    "DEFAULT_CONTAINERS_ROOT",
+    "VM_CONTAINER_PREFIX",
+]
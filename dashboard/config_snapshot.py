@@ -0,0 +1,92 @@
+"""Parsed-file cache for the state directory's small config files.
+
+The dashboard reads ``.env``, ``dashboard_settings.json`` and every VM's
+``instance.json`` / ``.meta.json`` from many helpers on every request.  Each
+parse is cached under the file's ``(mtime_ns, size, inode)`` so a hit costs one
+``stat`` instead of open/read/parse, and an edit from the CLI (or an atomic
+rename over the file) is seen on the very next call.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+def parse_env_text(text: str) -> dict:
+    """Parse ``KEY=value`` lines the way the manager writes them."""
+    data = {}
+    for line in text.splitlines():
+        if not line.strip() or line.strip().startswith('#'):
+            continue
+        if '=' in line:
+            k, v = line.split('=', 1)
+            data[k.strip()] = v.strip().strip("'\"")
+    return data
+
+
+def parse_json_text(text: str) -> Any:
+    return json.loads(text)
+
+
+class ConfigSnapshotCache:
+    """Thread-safe map of ``(path, parser)`` to the last parsed contents."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple[str, Callable[[str], Any]], tuple[tuple[int, int, int], Any]]" = OrderedDict()
+
+    def load(self, path: str, parser: Callable[[str], Any], default: Any = None) -> Any:
+        """Return a private copy of ``parser(contents)``, or ``default`` when unreadable."""
+        key = (path, parser)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._drop(key)
+            return copy.deepcopy(default)
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+        try:
+            with open(path, 'r') as f:
+                value = parser(f.read())
+        except Exception:
+            value = default
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(value)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget ``path`` (every file when None); used after the dashboard writes one."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+    def _drop(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+CONFIG_FILES = ConfigSnapshotCache()
+
+
+__all__ = [
+    "CONFIG_FILES",
+    "ConfigSnapshotCache",
+    "parse_env_text",
+    "parse_json_text",
+]
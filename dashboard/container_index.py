@@ -0,0 +1,230 @@
+"""Live index of ``blobevm_*`` containers fed by the Docker events stream.
+
+One daemon thread syncs the index from the Engine API, then follows
+``/events`` and re-inspects a container whenever it changes.  Callers check
+:attr:`ContainerIndex.live` and fall back to their subprocess path while the
+index is not synced (no socket, daemon restart, tests).
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+from urllib.parse import quote
+
+try:
+    from .runtime_stats import DockerEngineClient, DockerEngineUnavailable
+except ImportError:  # pragma: no cover - direct module loading
+    from runtime_stats import DockerEngineClient, DockerEngineUnavailable
+
+VM_CONTAINER_PREFIX = "blobevm_"
+_MAX_BACKOFF = 30.0
+# Events that change a container's state or health.  exec_*, attach, resize,
+# top and the like (the dashboard's own ``docker exec`` calls among them) are
+# dropped without a re-inspect or listener call.
+LIFECYCLE_ACTIONS = frozenset({
+    "create", "start", "restart", "stop", "die", "kill", "pause", "unpause",
+    "oom", "destroy", "rename", "health_status",
+})
+
+
+def _entry_from_inspect(info: Mapping[str, Any]) -> Dict[str, Any]:
+    state = info.get("State") or {}
+    health = state.get("Health") if isinstance(state.get("Health"), Mapping) else {}
+    ports: Dict[str, str] = {}
+    for port, bindings in ((info.get("NetworkSettings") or {}).get("Ports") or {}).items():
+        for binding in bindings or ():
+            host_port = str((binding or {}).get("HostPort") or "")
+            if host_port:
+                ports.setdefault(port, host_port)
+    return {
+        "id": str(info.get("Id") or ""),
+        "name": str(info.get("Name") or "").lstrip("/"),
+        "state": str(state.get("Status") or ""),
+        "running": bool(state.get("Running")),
+        "restarting": bool(state.get("Restarting")),
+        "health": str(health.get("Status") or ""),
+        "ports": ports,
+        "restart_count": int(info.get("RestartCount") or 0),
+        "oom_killed": bool(state.get("OOMKilled")),
+        "exit_code": state.get("ExitCode"),
+        "started_at": state.get("StartedAt"),
+        "finished_at": state.get("FinishedAt"),
+        "inspect": dict(info),
+    }
+
+
+class ContainerIndex:
+    """Thread-safe name -> container entry map kept current from events."""
+
+    def __init__(self, client: Optional[DockerEngineClient] = None,
+                 prefix: str = VM_CONTAINER_PREFIX):
+        self.client = client or DockerEngineClient()
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._live = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._listeners: List[Callable[[str, str, Optional[Dict[str, Any]]], None]] = []
+        self.last_error: Optional[str] = None
+
+    @property
+    def live(self) -> bool:
+        return self._live
+
+    def add_listener(self, listener: Callable[[str, str, Optional[Dict[str, Any]]], None]) -> None:
+        """Call ``listener(action, name, entry)`` after each indexed change."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            result = dict(entry)
+            result.pop("inspect", None)
+            result["ports"] = dict(entry["ports"])
+            return result
+
+    def inspect(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return a private copy of the cached ``docker inspect`` document."""
+        with self._lock:
+            entry = self._entries.get(name)
+            return copy.deepcopy(entry["inspect"]) if entry else None
+
+    def names(self, running: Optional[bool] = None) -> List[str]:
+        with self._lock:
+            return sorted(
+                name for name, entry in self._entries.items()
+                if running is None or entry["running"] == running
+            )
+
+    def host_port(self, name: str, port: str = "3000/tcp") -> str:
+        with self._lock:
+            entry = self._entries.get(name)
+            return entry["ports"].get(port, "") if entry else ""
+
+    # -- maintenance ---------------------------------------------------
+
+    def _notify(self, action: str, name: str, entry: Optional[Dict[str, Any]]) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(action, name, entry)
+            except Exception:  # consumers must not stop the event loop
+                pass
+
+    def _inspect_id(self, container_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            info = self.client.get_json(f"/containers/{quote(container_id)}/json")
+        except DockerEngineUnavailable as exc:
+            if exc.status == 404:
+                return None
+            raise
+        return _entry_from_inspect(info) if isinstance(info, Mapping) else None
+
+    def sync(self) -> None:
+        """Rebuild the whole index from a container listing."""
+        filters = quote(json.dumps({"name": [self.prefix]}))
+        listing = self.client.get_json(f"/containers/json?all=1&filters={filters}")
+        entries: Dict[str, Dict[str, Any]] = {}
+        for container in listing or ():
+            entry = self._inspect_id(str(container.get("Id") or ""))
+            if entry and entry["name"].startswith(self.prefix):
+                entries[entry["name"]] = entry
+        with self._lock:
+            previous = self._entries
+            self._entries = entries
+        for name in set(previous) - set(entries):
+            self._notify("destroy", name, None)
+        for name, entry in entries.items():
+            if previous.get(name, {}).get("inspect") != entry["inspect"]:
+                self._notify("sync", name, self.get(name))
+
+    def apply_event(self, event: Mapping[str, Any]) -> None:
+        """Update the index for one ``/events`` document."""
+        if event.get("Type") != "container":
+            return
+        actor = event.get("Actor") or {}
+        attributes = actor.get("Attributes") or {}
+        name = str(attributes.get("name") or "")
+        old_name = str(attributes.get("oldName") or "").lstrip("/")
+        if not name.startswith(self.prefix) and not old_name.startswith(self.prefix):
+            return
+        action = str(event.get("Action") or event.get("status") or "").split(":", 1)[0]
+        if action not in LIFECYCLE_ACTIONS:
+            return
+        container_id = str(actor.get("ID") or event.get("id") or "")
+        entry = None if action == "destroy" else self._inspect_id(container_id)
+        with self._lock:
+            oom = action == "oom" or bool(
+                self._entries.get(name, {}).get("oom_killed") and action not in ("start", "restart"))
+            if old_name:
+                self._entries.pop(old_name, None)
+            if entry is None or not entry["name"].startswith(self.prefix):
+                self._entries.pop(name, None)
+                entry = None
+            else:
+                entry["oom_killed"] = entry["oom_killed"] or oom
+                self._entries.pop(name, None)
+                self._entries[entry["name"]] = entry
+        self._notify(action, entry["name"] if entry else name,
+                     self.get(entry["name"]) if entry else None)
+
+    def _run(self, stop: threading.Event) -> None:
+        backoff = 1.0
+        while not stop.is_set():
+            try:
+                since = int(time.time())
+                self.sync()
+                self._live = True
+                self.last_error = None
+                backoff = 1.0
+                filters = quote(json.dumps({"type": ["container"]}))
+                for event in self.client.stream_json(f"/events?since={since}&filters={filters}"):
+                    if stop.is_set():
+                        break
+                    if isinstance(event, Mapping):
+                        self.apply_event(event)
+            except Exception as exc:  # daemon restart, socket missing, bad JSON
+                self.last_error = str(exc)
+            self._live = False
+            stop.wait(backoff)
+            backoff = min(_MAX_BACKOFF, backoff * 2)
+
+    def start(self) -> bool:
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop,), name="docker-events", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop following events; the blocking stream read ends on its next event."""
+        self._stop.set()
+        self._live = False
+
+
+CONTAINER_INDEX = ContainerIndex()
+
+
+def start_container_index() -> bool:
+    """Start the shared events subscriber unless BLOBEVM_CONTAINER_EVENTS=0."""
+    if os.environ.get("BLOBEVM_CONTAINER_EVENTS", "1").strip().lower() in {"0", "false", "no", "off"}:
+        return False
+    return CONTAINER_INDEX.start()
+
+
+__all__ = [
+    "CONTAINER_INDEX",
+    "ContainerIndex",
+    "LIFECYCLE_ACTIONS",
+    "start_container_index",
+]
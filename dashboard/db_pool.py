@@ -0,0 +1,124 @@
+"""Pooled SQLite connections for the dashboard's users/ACL/jobs database.
+
+Opening a connection and re-running the ``CREATE TABLE IF NOT EXISTS``
+script on every helper call made concurrent job updates and logins
+serialize on file opens and schema checks.  Connections are opened once
+in WAL mode with a busy timeout, migrated the first time a database path is
+seen, and handed back to a small idle pool by ``close()`` so existing
+``conn = _users_conn(); try: ... finally: conn.close()`` callers keep working.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+
+class PooledConnection(sqlite3.Connection):
+    """A connection whose ``close()`` returns it to its pool."""
+
+    _pool: Optional["SQLitePool"] = None
+    _pool_path = ""
+    _checked_out = False
+
+    def close(self) -> None:
+        pool = self._pool
+        if pool is None or not self._checked_out:
+            sqlite3.Connection.close(self)
+            return
+        self._checked_out = False
+        pool._release(self)
+
+    def discard(self) -> None:
+        self._pool = None
+        sqlite3.Connection.close(self)
+
+
+class SQLitePool:
+    """Per-path idle pools of WAL connections with a one-time migration hook."""
+
+    def __init__(self, migrate: Optional[Callable[[sqlite3.Connection], None]] = None,
+                 max_idle: int = 8, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS):
+        self.migrate = migrate
+        self.max_idle = max_idle
+        self.busy_timeout_ms = busy_timeout_ms
+        self._lock = threading.Lock()
+        self._idle: Dict[str, List[PooledConnection]] = {}
+        self._migration_locks: Dict[str, threading.Lock] = {}
+        self._ready: set = set()
+
+    def connect(self, path: str) -> PooledConnection:
+        stale: List[PooledConnection] = []
+        with self._lock:
+            if not os.path.exists(path):
+                # The file was removed (or never existed): pooled handles
+                # would write to the unlinked inode and the schema is gone.
+                stale = self._idle.pop(path, [])
+                self._ready.discard(path)
+            idle = self._idle.get(path)
+            conn = idle.pop() if idle else None
+        for old in stale:
+            old.discard()
+        if conn is None:
+            conn = self._open(path)
+        conn._checked_out = True
+        return conn
+
+    def ensure_schema(self, path: str) -> None:
+        """Run the migration for ``path`` once per process."""
+        self.connect(path).close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            self._ready.clear()
+        for conns in idle.values():
+            for conn in conns:
+                conn.discard()
+
+    def _open(self, path: str) -> PooledConnection:
+        conn = sqlite3.connect(path, timeout=self.busy_timeout_ms / 1000.0,
+                               check_same_thread=False, factory=PooledConnection)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout_ms)}')
+        try:
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = NORMAL')
+        except sqlite3.DatabaseError:
+            # Some filesystems (e.g. network mounts) cannot host a WAL.
+            pass
+        conn._pool = self
+        conn._pool_path = path
+        if path not in self._ready and self.migrate is not None:
+            with self._lock:
+                gate = self._migration_locks.setdefault(path, threading.Lock())
+            with gate:
+                if path not in self._ready:
+                    self.migrate(conn)
+                    conn.commit()
+                    self._ready.add(path)
+        return conn
+
+    def _release(self, conn: PooledConnection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.discard()
+            return
+        with self._lock:
+            idle = self._idle.setdefault(conn._pool_path, [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.discard()
+
+
+__all__ = [
+    "PooledConnection",
+    "SQLitePool",
+]
@@ -0,0 +1,142 @@
+"""In-process publish/subscribe fan-out for the ``/dashboard/api/events`` stream.
+
+Producers (container events, job updates, optimizer runs) publish once and
+every connected tab receives the event from its own bounded queue, so the
+backend work per change is constant no matter how many clients listen.  A
+small replay buffer lets a reconnecting ``EventSource`` resume from its
+``Last-Event-ID``; a subscriber that falls behind is told to ``resync``
+instead of silently losing events.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+RESYNC_EVENT = "resync"
+
+
+def format_sse(event_id: Optional[int], event: str, data: Any) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    for line in json.dumps(data, separators=(",", ":"), default=str).splitlines() or [""]:
+        lines.append(f"data: {line}")
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscription:
+    """One client's view of the bus; ``vm`` limits it to that VM's events."""
+
+    def __init__(self, vm: Optional[str] = None, maxsize: int = 256):
+        self.vm = vm
+        self.queue: "queue.Queue[Tuple[int, str, Any]]" = queue.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def wants(self, data: Any) -> bool:
+        if self.vm is None or not isinstance(data, dict):
+            return True
+        if "name" in data:
+            return data["name"] == self.vm
+        if "targets" in data:
+            return self.vm in (data["targets"] or ())
+        return True
+
+    def offer(self, item: Tuple[int, str, Any]) -> None:
+        if self.overflowed or not self.wants(item[2]):
+            return
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.overflowed = True
+
+
+class EventBus:
+    """Thread-safe bus with a replay buffer of the most recent events."""
+
+    def __init__(self, history: int = 256, queue_size: int = 256):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._history: Deque[Tuple[int, str, Any]] = deque(maxlen=history)
+        self._subscribers: List[Subscription] = []
+        self._activation_listeners: List[Callable[[], None]] = []
+
+    def on_first_subscriber(self, listener: Callable[[], None]) -> None:
+        """Call ``listener()`` whenever the bus goes from zero to one subscriber."""
+        self._activation_listeners.append(listener)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event: str, data: Any) -> int:
+        with self._lock:
+            event_id = self._next_id
+            self._next_id += 1
+            item = (event_id, event, data)
+            self._history.append(item)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.offer(item)
+        return event_id
+
+    def subscribe(self, vm: Optional[str] = None, last_event_id: Optional[str] = None) -> Subscription:
+        subscription = Subscription(vm=vm, maxsize=self.queue_size)
+        with self._lock:
+            first = not self._subscribers
+            if last_event_id is not None and str(last_event_id).isdigit():
+                after = int(last_event_id)
+                oldest = self._history[0][0] if self._history else self._next_id
+                if after + 1 < oldest or after >= self._next_id:
+                    subscription.overflowed = True
+                else:
+                    for item in self._history:
+                        if item[0] > after:
+                            subscription.offer(item)
+            self._subscribers.append(subscription)
+        if first:
+            for listener in list(self._activation_listeners):
+                try:
+                    listener()
+                except Exception:
+                    pass
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def stream(self, subscription: Subscription, heartbeat: float = 15.0,
+               stop: Optional[threading.Event] = None) -> Iterator[str]:
+        """Yield SSE frames for ``subscription``; comments keep proxies from idling out."""
+        while stop is None or not stop.is_set():
+            if subscription.overflowed:
+                subscription.overflowed = False
+                with subscription.queue.mutex:
+                    subscription.queue.queue.clear()
+                yield format_sse(None, RESYNC_EVENT, {"reason": "missed events"})
+                continue
+            try:
+                event_id, event, data = subscription.queue.get(timeout=heartbeat)
+            except queue.Empty:
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(event_id, event, data)
+
+
+EVENT_BUS = EventBus()
+
+
+__all__ = [
+    "EVENT_BUS",
+    "EventBus",
+    "RESYNC_EVENT",
+    "Subscription",
+    "format_sse",
+]
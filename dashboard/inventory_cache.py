@@ -0,0 +1,98 @@
+"""Short-lived per-host snapshot of VM provider inventory.
+
+``manager_json_list`` runs the VM manager (or a remote agent request) for
+every call, and one dashboard page load can reach it several times.  The
+cache keeps the provider's raw ``list_vms()`` result for a few seconds and
+is dropped explicitly whenever a VM is mutated, a job finishes, or Docker
+reports a container change, so repeated reads are cheap without serving
+state older than the last known mutation.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_TTL = 3.0
+
+
+def _env_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get("BLOBEVM_INVENTORY_TTL", DEFAULT_TTL)))
+    except ValueError:
+        return DEFAULT_TTL
+
+
+class InventoryCache:
+    """Per-host TTL cache with single-flight loads and explicit invalidation."""
+
+    def __init__(self, ttl: Optional[float] = None,
+                 clock: Optional[Callable[[], float]] = None):
+        self.ttl = _env_ttl() if ttl is None else float(ttl)
+        self.clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        # host_id -> (loaded_at, loader, items)
+        self._entries: Dict[str, tuple] = {}
+        # Bumped by invalidate(); a load that started before the bump is
+        # returned to its caller but never stored.
+        self._generation: Dict[str, int] = {}
+        self._epoch = 0
+
+    def _fresh(self, host_id: str, loader: Callable[[], List[Dict[str, Any]]]):
+        entry = self._entries.get(host_id)
+        if entry is None or entry[1] != loader:
+            return None
+        if self.clock() - entry[0] >= self.ttl:
+            return None
+        return entry[2]
+
+    def get(self, host_id: str, loader: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Return a private copy of ``loader()``'s result for ``host_id``.
+
+        The loader (usually ``provider.list_vms``) is part of the key, so a
+        replaced provider never sees its predecessor's inventory.  Errors
+        propagate and are not cached.
+        """
+        host_id = str(host_id or "local")
+        if self.ttl <= 0:
+            return loader()
+        with self._lock:
+            items = self._fresh(host_id, loader)
+            if items is not None:
+                return copy.deepcopy(items)
+            load_lock = self._load_locks.setdefault(host_id, threading.Lock())
+        with load_lock:
+            with self._lock:
+                items = self._fresh(host_id, loader)
+                if items is not None:
+                    return copy.deepcopy(items)
+                generation = (self._epoch, self._generation.get(host_id, 0))
+            items = [dict(item) for item in loader()]
+            with self._lock:
+                if (self._epoch, self._generation.get(host_id, 0)) == generation:
+                    self._entries[host_id] = (self.clock(), loader, items)
+            return copy.deepcopy(items)
+
+    def invalidate(self, host_id: Optional[str] = None) -> None:
+        """Drop one host's snapshot, or every snapshot when ``host_id`` is None."""
+        with self._lock:
+            if host_id is None:
+                self._entries.clear()
+                self._epoch += 1
+                return
+            host_id = str(host_id)
+            self._entries.pop(host_id, None)
+            self._generation[host_id] = self._generation.get(host_id, 0) + 1
+
+
+INVENTORY_CACHE = InventoryCache()
+
+
+__all__ = [
+    "INVENTORY_CACHE",
+    "InventoryCache",
+]
@@ -0,0 +1,74 @@
+"""Leases that make background jobs recoverable across dashboard restarts.
+
+Each job row records the dashboard process that owns it and when that
+ownership lapses.  While the process is alive a heartbeat thread keeps
+pushing the expiry forward; a queued or running row whose lease has lapsed
+belongs to a process that died, and the next sweep claims it so it is
+re-queued or failed exactly once.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import socket
+import threading
+import time
+from typing import Callable, Optional
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+class JobLeases:
+    """This process's lease identity plus the heartbeat that renews it."""
+
+    def __init__(self, lease_seconds: Optional[int] = None, owner: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        self.lease_seconds = lease_seconds or _env_int("BLOBEVM_JOB_LEASE_SECONDS", 60)
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def interval(self) -> float:
+        """Heartbeat period: a lease survives two missed beats."""
+        return max(0.05, self.lease_seconds / 3.0)
+
+    def now(self) -> int:
+        return int(self.clock())
+
+    def expires_at(self) -> int:
+        return self.now() + self.lease_seconds
+
+    def start(self, tick: Callable[[], None]) -> bool:
+        """Call ``tick()`` every :attr:`interval` seconds on a daemon thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(tick, self._stop), name="job-heartbeat", daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self, tick: Callable[[], None], stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            try:
+                tick()
+            except Exception:
+                pass
+
+
+__all__ = [
+    "JobLeases",
+]
@@ -0,0 +1,127 @@
+"""Append-only output logs for background jobs.
+
+Job runners stream subprocess output here line by line instead of holding
+the whole output until the job ends.  Readers fetch by byte offset
+(``/dashboard/api/jobs/<id>/log?offset=``) or follow the log over SSE; a
+condition variable wakes followers as soon as new output lands.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from typing import Callable, Dict, IO, Tuple
+
+JOB_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def _complete_utf8(chunk: bytes) -> bytes:
+    """Drop a trailing partial UTF-8 sequence so offsets stay on boundaries."""
+    for back in range(1, min(4, len(chunk)) + 1):
+        byte = chunk[-back]
+        if byte < 0x80:
+            return chunk
+        if byte >= 0xC0:
+            need = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return chunk if back >= need else chunk[:-back]
+    return chunk
+
+
+class JobLogStore:
+    """Per-job log files under ``root_fn()``; safe for concurrent readers."""
+
+    def __init__(self, root_fn: Callable[[], str], max_files: int = 200):
+        self.root_fn = root_fn
+        self.max_files = max_files
+        self._cond = threading.Condition()
+        self._handles: Dict[str, IO[bytes]] = {}
+        self._closed: set = set()
+
+    def path(self, job_id: str) -> str:
+        if not JOB_ID_RE.match(job_id or ""):
+            raise ValueError("Invalid job id")
+        return os.path.join(self.root_fn(), f"{job_id}.log")
+
+    def open(self, job_id: str) -> None:
+        """Start a job's log (idempotent) and trim the oldest logs."""
+        path = self.path(job_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._cond:
+            self._closed.discard(job_id)
+            if job_id not in self._handles:
+                self._handles[job_id] = open(path, "ab")
+        self.prune()
+
+    def append(self, job_id: str, text: str) -> None:
+        if not text:
+            return
+        with self._cond:
+            handle = self._handles.get(job_id)
+            if handle is None:
+                path = self.path(job_id)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                handle = self._handles[job_id] = open(path, "ab")
+            handle.write(text.encode("utf-8", "replace"))
+            handle.flush()
+            self._cond.notify_all()
+
+    def close(self, job_id: str) -> None:
+        """Mark the log complete and wake any followers."""
+        with self._cond:
+            handle = self._handles.pop(job_id, None)
+            if handle is not None:
+                handle.close()
+            self._closed.add(job_id)
+            self._cond.notify_all()
+
+    def is_open(self, job_id: str) -> bool:
+        with self._cond:
+            return job_id in self._handles
+
+    def size(self, job_id: str) -> int:
+        try:
+            return os.path.getsize(self.path(job_id))
+        except OSError:
+            return 0
+
+    def read(self, job_id: str, offset: int = 0, limit: int = 65536) -> Tuple[str, int, int]:
+        """Return ``(text, next_offset, size)`` starting at byte ``offset``."""
+        size = self.size(job_id)
+        offset = max(0, min(int(offset or 0), size))
+        if offset >= size:
+            return "", offset, size
+        with open(self.path(job_id), "rb") as f:
+            f.seek(offset)
+            chunk = _complete_utf8(f.read(max(4, int(limit))))
+        return chunk.decode("utf-8", "replace"), offset + len(chunk), size
+
+    def wait(self, job_id: str, offset: int, timeout: float) -> bool:
+        """Block until the log grows past ``offset`` or is closed; True if it grew."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.size(job_id) > offset or job_id in self._closed, timeout=timeout)
+        return self.size(job_id) > offset
+
+    def prune(self) -> None:
+        root = self.root_fn()
+        try:
+            entries = [os.path.join(root, name) for name in os.listdir(root) if name.endswith(".log")]
+        except OSError:
+            return
+        if len(entries) <= self.max_files:
+            return
+        entries.sort(key=lambda path: os.path.getmtime(path))
+        with self._cond:
+            active = {self.path(job_id) for job_id in self._handles}
+        for path in entries[:len(entries) - self.max_files]:
+            if path not in active:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+__all__ = [
+    "JOB_ID_RE",
+    "JobLogStore",
+]
@@ -0,0 +1,168 @@
+"""Bounded worker pool for background dashboard jobs.
+
+Maintenance jobs (rebuilds, resets, prunes, image updates) each drive the
+Docker daemon hard.  Instead of a thread per job they wait in a queue served
+by a fixed number of workers, with separate caps on how many jobs may run
+at once per VM host and per job type.  Within what those caps allow, the
+queue is served by priority and then first-in, first-out, so a short
+interactive job is not stuck behind a fleet-wide rebuild.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 5
+PRIORITY_MAINTENANCE = 10
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def parse_type_limits(spec: str) -> Dict[str, int]:
+    """Parse ``"update-vm=2,rebuild-vms=1"`` into a limits mapping."""
+    limits = {}
+    for part in (spec or "").split(","):
+        name, _, value = part.partition("=")
+        if name.strip() and value.strip().isdigit():
+            limits[name.strip()] = max(1, int(value))
+    return limits
+
+
+class _QueuedJob:
+    __slots__ = ("job_id", "run", "job_type", "host_id", "priority", "seq")
+
+    def __init__(self, job_id, run, job_type, host_id, priority, seq):
+        self.job_id = job_id
+        self.run = run
+        self.job_type = job_type
+        self.host_id = host_id
+        self.priority = priority
+        self.seq = seq
+
+
+class JobScheduler:
+    """Priority/FIFO queue with per-host and per-type concurrency caps."""
+
+    def __init__(self, workers: Optional[int] = None, host_limit: Optional[int] = None,
+                 type_limits: Optional[Dict[str, int]] = None, default_type_limit: int = 1):
+        self.workers = workers or _env_int("BLOBEVM_JOB_WORKERS", 4)
+        self.host_limit = host_limit or _env_int("BLOBEVM_JOB_HOST_LIMIT", 2)
+        self.default_type_limit = default_type_limit
+        # Bulk lifecycle sub-jobs (vm-<action>) are bounded by the host cap.
+        self.type_limits = {"update-vm": 2, "recover-vm": 2, "vm-start": 8, "vm-stop": 8, "vm-restart": 8,
+                            "vm-recreate": 8, "vm-reset": 8}
+        self.type_limits.update(parse_type_limits(os.environ.get("BLOBEVM_JOB_TYPE_LIMITS", "")))
+        if type_limits:
+            self.type_limits.update(type_limits)
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._pending: List[_QueuedJob] = []
+        self._running_by_host: Dict[str, int] = {}
+        self._running_by_type: Dict[str, int] = {}
+        self._threads: List[threading.Thread] = []
+        self._listeners: List[Callable[[], None]] = []
+
+    def add_queue_listener(self, listener: Callable[[], None]) -> None:
+        """Call ``listener()`` after queue positions change."""
+        self._listeners.append(listener)
+
+    def submit(self, job_id: str, run: Callable[[], None], job_type: str = "",
+               host_id: str = "local", priority: int = PRIORITY_NORMAL) -> int:
+        """Queue ``run`` and return its 1-based queue position."""
+        with self._cond:
+            self._pending.append(_QueuedJob(job_id, run, job_type, host_id or "local", priority, next(self._seq)))
+            self._pending.sort(key=lambda job: (job.priority, job.seq))
+            self._ensure_workers()
+            self._cond.notify_all()
+            return self._position_locked(job_id) or 0
+
+    def position(self, job_id: str) -> Optional[int]:
+        with self._cond:
+            return self._position_locked(job_id)
+
+    def positions(self) -> Dict[str, int]:
+        with self._cond:
+            return {job.job_id: index + 1 for index, job in enumerate(self._pending)}
+
+    def running_count(self) -> int:
+        with self._cond:
+            return sum(self._running_by_type.values())
+
+    def _position_locked(self, job_id: str) -> Optional[int]:
+        for index, job in enumerate(self._pending):
+            if job.job_id == job_id:
+                return index + 1
+        return None
+
+    def capacity(self, job_type: str) -> int:
+        """Most jobs of ``job_type`` that can run at once on one host."""
+        return max(1, min(self.workers, self.host_limit, self._type_limit(job_type)))
+
+    def _type_limit(self, job_type: str) -> int:
+        return self.type_limits.get(job_type, self.default_type_limit)
+
+    def _eligible_locked(self) -> Optional[_QueuedJob]:
+        for job in self._pending:
+            if self._running_by_host.get(job.host_id, 0) >= self.host_limit:
+                continue
+            if self._running_by_type.get(job.job_type, 0) >= self._type_limit(job.job_type):
+                continue
+            return job
+        return None
+
+    def _ensure_workers(self) -> None:
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name=f"job-worker-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _notify_listeners(self) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception:
+                pass
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                job = self._eligible_locked()
+                while job is None:
+                    self._cond.wait()
+                    job = self._eligible_locked()
+                self._pending.remove(job)
+                self._running_by_host[job.host_id] = self._running_by_host.get(job.host_id, 0) + 1
+                self._running_by_type[job.job_type] = self._running_by_type.get(job.job_type, 0) + 1
+            self._notify_listeners()
+            try:
+                job.run()
+            except Exception:
+                pass
+            finally:
+                with self._cond:
+                    self._running_by_host[job.host_id] -= 1
+                    self._running_by_type[job.job_type] -= 1
+                    self._cond.notify_all()
+
+
+JOB_SCHEDULER = JobScheduler()
+
+
+__all__ = [
+    "JOB_SCHEDULER",
+    "JobScheduler",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_MAINTENANCE",
+    "PRIORITY_NORMAL",
+    "parse_type_limits",
+]
@@ -0,0 +1,273 @@
+"""In-process, array-backed time series for per-VM and host resource usage.
+
+Samples land in a raw ring (2 s, 15 min) and are averaged into 1 min (24 h)
+and 15 min (30 day) rings.  Every ring is a set of preallocated ``array``
+columns, so 40 VMs of 30-day history stay within a few MB and ingest never
+allocates per sample.
+
+Samples arrive from the shared stats cache, so the raw tier is only as fine
+as stats are refreshed: every 2 s with ``BLOBEVM_DOCKER_STATS_SAMPLER`` on,
+otherwise whenever a caller happens to read stats (gaps are left empty).
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+HOST_KEY = "host"
+VM_CONTAINER_PREFIX = "blobevm_"
+# (step seconds, retention seconds)
+TIERS: Tuple[Tuple[int, int], ...] = (
+    (2, 15 * 60),
+    (60, 24 * 3600),
+    (15 * 60, 30 * 86400),
+)
+FIELDS: Tuple[str, ...] = (
+    "cpu_percent",
+    "mem_percent",
+    "mem_bytes",
+    "net_rx_rate",
+    "net_tx_rate",
+    "block_read_rate",
+    "block_write_rate",
+)
+_COUNTERS = (
+    ("net_rx", "net_rx_rate"),
+    ("net_tx", "net_tx_rate"),
+    ("block_read", "block_read_rate"),
+    ("block_write", "block_write_rate"),
+)
+
+
+class _Ring:
+    """Fixed-capacity columnar ring; one ``array('f')`` per field."""
+
+    __slots__ = ("step", "capacity", "ts", "columns", "head", "count")
+
+    def __init__(self, step: int, retention: int):
+        self.step = int(step)
+        self.capacity = max(1, int(retention // step))
+        self.ts = array("d", bytes(8 * self.capacity))
+        self.columns = [array("f", bytes(4 * self.capacity)) for _ in FIELDS]
+        self.head = 0
+        self.count = 0
+
+    def append(self, ts: float, values: Sequence[float]) -> None:
+        index = self.head
+        self.ts[index] = ts
+        for column, value in zip(self.columns, values):
+            column[index] = value
+        self.head = (index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def last_ts(self) -> Optional[float]:
+        if not self.count:
+            return None
+        return self.ts[(self.head - 1) % self.capacity]
+
+    def select(self, start: float, end: float) -> Dict[str, List[float]]:
+        result: Dict[str, List[float]] = {"ts": []}
+        for field in FIELDS:
+            result[field] = []
+        first = (self.head - self.count) % self.capacity
+        for offset in range(self.count):
+            index = (first + offset) % self.capacity
+            ts = self.ts[index]
+            if ts < start or ts > end:
+                continue
+            result["ts"].append(ts)
+            for field, column in zip(FIELDS, self.columns):
+                result[field].append(round(column[index], 3))
+        return result
+
+
+class _Series:
+    """All tiers for one VM (or the host) plus the open rollup buckets."""
+
+    __slots__ = ("tiers", "buckets", "counters")
+
+    def __init__(self):
+        self.tiers = [_Ring(step, retention) for step, retention in TIERS]
+        # Per downsampled tier: [bucket_start, sample_count, *sums]
+        self.buckets: List[Optional[List[float]]] = [None] * (len(TIERS) - 1)
+        self.counters: Optional[Tuple[float, Tuple[int, ...]]] = None
+
+    def add(self, ts: float, values: Sequence[float]) -> None:
+        self.tiers[0].append(ts, values)
+        for position, ring in enumerate(self.tiers[1:]):
+            bucket_start = ts - (ts % ring.step)
+            bucket = self.buckets[position]
+            if bucket is not None and bucket[0] != bucket_start:
+                count = bucket[1]
+                ring.append(bucket[0], [total / count for total in bucket[2:]])
+                bucket = None
+            if bucket is None:
+                bucket = [bucket_start, 0.0] + [0.0] * len(values)
+                self.buckets[position] = bucket
+            bucket[1] += 1
+            for offset, value in enumerate(values):
+                bucket[2 + offset] += value
+
+    def rates(self, ts: float, counters: Tuple[int, ...]) -> Tuple[float, ...]:
+        """Turn cumulative I/O counters into bytes/s against the last sample."""
+        previous = self.counters
+        self.counters = (ts, counters)
+        if previous is None or ts <= previous[0]:
+            return (0.0,) * len(counters)
+        elapsed = ts - previous[0]
+        # A restarted container resets its counters; report 0 for that gap.
+        return tuple(
+            max(0.0, (current - last) / elapsed) if current >= last else 0.0
+            for current, last in zip(counters, previous[1])
+        )
+
+
+def _read_proc_stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            fields = handle.readline().split()
+    except OSError:
+        return None
+    if not fields or fields[0] != "cpu":
+        return None
+    try:
+        values = [int(value) for value in fields[1:]]
+    except ValueError:
+        return None
+    idle = values[3] + (values[4] if len(values) > 4 else 0)
+    return sum(values), idle
+
+
+def _read_meminfo(path: str) -> Tuple[int, int]:
+    info: Dict[str, int] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                parts = line.split()
+                if len(parts) >= 2 and parts[1].isdigit():
+                    info[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except OSError:
+        return 0, 0
+    total = info.get("MemTotal", 0)
+    available = info.get("MemAvailable", info.get("MemFree", 0))
+    return total, max(0, total - available)
+
+
+class MetricsStore:
+    """Thread-safe per-key series store fed from ``runtime_stats`` records."""
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None,
+                 proc_stat_path: str = "/proc/stat",
+                 meminfo_path: str = "/proc/meminfo",
+                 prefix: str = VM_CONTAINER_PREFIX):
+        self.clock = clock or time.time
+        self.proc_stat_path = proc_stat_path
+        self.meminfo_path = meminfo_path
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._series: Dict[str, _Series] = {}
+        self._host_cpu: Optional[Tuple[int, int]] = None
+
+    def _get_series(self, key: str) -> _Series:
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        return series
+
+    def _host_cpu_percent(self) -> float:
+        sample = _read_proc_stat(self.proc_stat_path)
+        previous, self._host_cpu = self._host_cpu, sample
+        if sample is None or previous is None or sample[0] <= previous[0]:
+            return 0.0
+        busy = (sample[0] - previous[0]) - (sample[1] - previous[1])
+        return max(0.0, min(100.0, busy / (sample[0] - previous[0]) * 100.0))
+
+    def ingest(self, records: Iterable[Mapping[str, object]], ts: Optional[float] = None) -> None:
+        """Add one stats refresh; the host series is derived alongside it."""
+        ts = float(self.clock() if ts is None else ts)
+        with self._lock:
+            # Raw samples arrive at the stats TTL; keep the 2 s tier at 2 s.
+            host = self._get_series(HOST_KEY)
+            last = host.tiers[0].last_ts()
+            if last is not None and ts - last < TIERS[0][0] / 2:
+                return
+            totals = [0.0] * len(_COUNTERS)
+            for record in records:
+                name = str(record.get("name") or "")
+                if not name.startswith(self.prefix):
+                    continue
+                counters = tuple(int(record.get(key) or 0) for key, _ in _COUNTERS)
+                series = self._get_series(name[len(self.prefix):])
+                rates = series.rates(ts, counters)
+                for offset, rate in enumerate(rates):
+                    totals[offset] += rate
+                values = [
+                    float(record.get("cpu_percent") or 0.0),
+                    float(record.get("mem_percent") or 0.0),
+                    float(record.get("mem_bytes") or 0),
+                    *rates,
+                ]
+                if all(math.isfinite(value) for value in values):
+                    series.add(ts, values)
+            total, used = _read_meminfo(self.meminfo_path)
+            host.add(ts, [
+                self._host_cpu_percent(),
+                used / total * 100.0 if total else 0.0,
+                float(used),
+                *totals,
+            ])
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return sorted(self._series)
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._series.pop(key, None)
+
+    def query(self, key: str, start: Optional[float] = None, end: Optional[float] = None,
+              step: Optional[int] = None) -> Dict[str, object]:
+        """Return columnar points for ``key`` between ``start`` and ``end``.
+
+        Without ``step`` the finest tier whose retention still covers
+        ``start`` is used; an explicit ``step`` picks the closest tier.
+        """
+        now = float(self.clock())
+        end = now if end is None else float(end)
+        start = end - TIERS[0][1] if start is None else float(start)
+        if step is not None:
+            tier = min(range(len(TIERS)), key=lambda index: abs(TIERS[index][0] - int(step)))
+        else:
+            tier = next((index for index, (_step, retention) in enumerate(TIERS)
+                         if now - start <= retention), len(TIERS) - 1)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                points: Dict[str, List[float]] = {"ts": []}
+                points.update({field: [] for field in FIELDS})
+            else:
+                points = series.tiers[tier].select(start, end)
+        return {
+            "key": key,
+            "step": TIERS[tier][0],
+            "start": start,
+            "end": end,
+            "fields": list(FIELDS),
+            "points": points,
+        }
+
+
+METRICS_STORE = MetricsStore()
+
+
+__all__ = [
+    "FIELDS",
+    "HOST_KEY",
+    "METRICS_STORE",
+    "MetricsStore",
+    "TIERS",
+]
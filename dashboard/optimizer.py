@@ -18,6 +18,7 @@ import subprocess
 import re
 import shutil
 from runtime_stats import get_docker_stats
+from container_index import CONTAINER_INDEX
 
 STATE_DIR = os.environ.get('BLOBEDASH_STATE', '/opt/blobe-vm')
 LOG_DIR = '/var/blobe/logs/optimizer'
@@ -152,6 +153,10 @@ def apply_density_profile(profile: str):
 
 
 def _docker_ps_names():
+    # The live events index only tracks VM containers, which is all the
+    # callers below act on.
+    if CONTAINER_INDEX.live:
+        return CONTAINER_INDEX.names(running=True)
     try:
         out = subprocess.check_output(['docker', 'ps', '--format', '{{.Names}}'], text=True)
         return [l.strip() for l in out.splitlines() if l.strip()]
@@ -235,6 +240,23 @@ def _activity_payload(name: str):
     return data
 
 
+_event_listeners = []
+
+
+def add_event_listener(listener):
+    """Call ``listener(kind, payload)`` on new notifications ('notification') and finished runs ('run')."""
+    if listener not in _event_listeners:
+        _event_listeners.append(listener)
+
+
+def _emit_event(kind: str, payload: dict):
+    for listener in list(_event_listeners):
+        try:
+            listener(kind, payload)
+        except Exception as e:
+            log(f'event listener error: {e}')
+
+
 def _notification_path(name: str):
     return os.path.join(NOTIFICATION_META_DIR, re.sub(r'[^A-Za-z0-9_.-]', '_', name) + '.json')
 
@@ -258,6 +280,7 @@ def push_vm_notification(name: str, kind: str, title: str, body: str, ttl_second
         items = [x for x in (existing.get('items') or []) if int(x.get('expiresAt') or 0) > now]
         items.append(payload)
         _write_json_file(path, {'items': items[-10:]})
+        _emit_event('notification', payload)
         return payload
     except Exception as e:
         log(f'failed pushing vm notification for {name}: {e}')
@@ -506,17 +529,7 @@ def gather_stats():
             name = record['name']
             cpu = record['cpu_percent']
             memperc = record['mem_percent']
-            memusage = record['mem_usage']
-            m = re.search(r'([0-9.]+)\s*([KMG]i?)B', memusage)
-            memBytes = 0
-            if m:
-                n = float(m.group(1)); u = m.group(2).upper()
-                mul = 1024
-                if u.startswith('M'):
-                    mul = 1024*1024
-                elif u.startswith('G'):
-                    mul = 1024*1024*1024
-                memBytes = int(n * mul)
+            memBytes = record['mem_bytes']
             out['containers'].append({'name': name, 'cpu': cpu, 'memperc': memperc, 'memBytes': memBytes})
     except Exception:
         pass
@@ -585,6 +598,9 @@ def _cpu_priority_metadata(data):
 
 
 def _container_identity(name):
+    if CONTAINER_INDEX.live:
+        entry = CONTAINER_INDEX.get(f'blobevm_{name}')
+        return (entry or {}).get('id') or None
     try:
         identity = subprocess.check_output(
             ['docker', 'inspect', '--format={{.ID}}', f'blobevm_{name}'],
@@ -688,6 +704,7 @@ def _record_last_run(events, stats=None):
             json.dump(payload, f, indent=2)
     except Exception as e:
         log(f'failed writing last run: {e}')
+    _emit_event('run', {'ts': int(time.time()), 'events': events or [], 'hostPressure': (stats or {}).get('hostPressure') or {}})
 
 
 def _read_last_restart():
@@ -850,14 +867,7 @@ def _run_swap_guard(cfg, vm_state_map=None, host_pressure=None):
                     vm_name = name[len('blobevm_'):]
                     if _is_vm_protected(vm_state_map.get(vm_name)):
                         continue
-                    usage = record['mem_usage']
-                    m = re.search(r'([0-9.]+)([KMG]i?)B', usage)
-                    bytes_ = 0
-                    if m:
-                        n = float(m.group(1)); u = m.group(2).upper(); mul = 1024
-                        if u.startswith('G'): mul = 1024*1024*1024
-                        elif u.startswith('M'): mul = 1024*1024
-                        bytes_ = int(n * mul)
+                    bytes_ = record['mem_bytes']
                     if bytes_ > maxBytes:
                         maxBytes = bytes_; heaviest = name
                 try:
@@ -985,9 +995,9 @@ def _run_health_guard(cfg, vm_state_map=None, host_pressure=None):
     return None
 
 
-def _derive_vm_states(cfg: dict, stats: dict):
-    profiles = load_profiles()
-    history = _history_state().get('vms', {})
+def _derive_vm_states(cfg: dict, stats: dict, profiles=None, history_state=None):
+    profiles = load_profiles() if profiles is None else profiles
+    history = (_history_state() if history_state is None else history_state).get('vms', {})
     by_name = {}
     for c in stats.get('containers') or []:
         name = str(c.get('name') or '')
@@ -1237,9 +1247,10 @@ def _recommend_vm_action(vm_state: dict, host_pressure: dict, capacity: dict):
     return {'action': 'observe', 'label': 'Observe', 'detail': 'No immediate optimizer action recommended.'}
 
 
-def _build_recommendations(cfg: dict, stats: dict, vm_states, host_pressure):
+def _build_recommendations(cfg: dict, stats: dict, vm_states, host_pressure, capacity=None):
     recs = []
-    capacity = _estimate_capacity(cfg, stats, vm_states, host_pressure)
+    if capacity is None:
+        capacity = _estimate_capacity(cfg, stats, vm_states, host_pressure)
     if host_pressure.get('level') in ('pressured', 'critical'):
         recs.append({
             'level': 'warn',
@@ -1404,7 +1415,10 @@ def status():
     cfg = load_config()
     raw_stats = gather_stats()
     host_pressure = _derive_host_pressure(raw_stats, cfg)
-    vm_states = _derive_vm_states(cfg, raw_stats)
+    # Profiles and history are read once and shared by every derived view.
+    profiles = load_profiles()
+    history = _history_state()
+    vm_states = _derive_vm_states(cfg, raw_stats, profiles=profiles, history_state=history)
     capacity = _estimate_capacity(cfg, raw_stats, vm_states, host_pressure)
     vm_states = [dict(v, recommendedAction=_recommend_vm_action(v, host_pressure, capacity)) for v in vm_states]
     stats = {
@@ -1413,10 +1427,10 @@ def status():
         'vmStates': vm_states,
         'capacity': capacity,
         'reliefCandidates': _relief_candidates(vm_states),
-        'recommendations': _build_recommendations(cfg, raw_stats, vm_states, host_pressure),
-        'profiles': load_profiles(),
+        'recommendations': _build_recommendations(cfg, raw_stats, vm_states, host_pressure, capacity=capacity),
+        'profiles': profiles,
         'densityProfiles': available_density_profiles(),
-        'history': _history_state(),
+        'history': history,
         'trends': _trend_state(),
     }
     last = 0
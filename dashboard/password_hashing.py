@@ -0,0 +1,104 @@
+"""Bounded, off-request-thread PBKDF2 for portal passwords.
+
+Each verification costs a few hundred milliseconds of CPU, so a burst of
+logins at class start used to pin the dashboard and starve forward-auth and
+API requests.  Verifications run on a small worker pool with a cap on how
+many may wait; beyond that callers get :class:`PasswordHasherBusy` straight
+away (the login route answers 429).  Hashes record their iteration count, so
+``BLOBEVM_PASSWORD_ITERATIONS`` can be tuned and older hashes are upgraded
+the next time their owner signs in.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+ALGORITHM = "pbkdf2_sha256"
+# Hashes written before iteration counts were recorded used this value.
+LEGACY_ITERATIONS = 260000
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    try:
+        return max(minimum, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Every worker is busy and the wait queue is full."""
+
+
+def _parse(stored: str) -> Optional[Tuple[int, str, str]]:
+    parts = (stored or "").split("$")
+    if len(parts) == 3 and parts[0] == ALGORITHM:
+        return LEGACY_ITERATIONS, parts[1], parts[2]
+    if len(parts) == 4 and parts[0] == ALGORITHM and parts[1].isdigit():
+        return int(parts[1]), parts[2], parts[3]
+    return None
+
+
+def _derive(password: str, salt: str, iterations: int) -> str:
+    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), iterations)
+    return base64.b64encode(dk).decode("ascii")
+
+
+class PasswordHasher:
+    """PBKDF2-SHA256 hashing with a bounded verification pool.
+
+    ``hashlib.pbkdf2_hmac`` releases the GIL, so worker threads hash in
+    parallel without slowing request threads beyond the cores they occupy.
+    """
+
+    def __init__(self, iterations: Optional[int] = None, workers: Optional[int] = None,
+                 max_waiting: Optional[int] = None):
+        self.iterations = iterations or _env_int("BLOBEVM_PASSWORD_ITERATIONS", LEGACY_ITERATIONS, 1000)
+        self.workers = workers or _env_int("BLOBEVM_PASSWORD_WORKERS", 2, 1)
+        waiting = _env_int("BLOBEVM_PASSWORD_QUEUE", 8, 0) if max_waiting is None else max_waiting
+        self._slots = threading.BoundedSemaphore(self.workers + waiting)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+
+    def hash(self, password: str, salt: Optional[str] = None) -> str:
+        salt = salt or secrets.token_hex(16)
+        return f"{ALGORITHM}${self.iterations}${salt}${_derive(password, salt, self.iterations)}"
+
+    def needs_rehash(self, stored: str) -> bool:
+        parsed = _parse(stored)
+        return parsed is None or parsed[0] != self.iterations or len((stored or "").split("$")) != 4
+
+    def check(self, password: str, stored: str) -> Tuple[bool, Optional[str]]:
+        """Verify on the calling thread; returns ``(ok, upgraded_hash_or_None)``."""
+        parsed = _parse(stored)
+        if parsed is None:
+            return False, None
+        iterations, salt, digest = parsed
+        if not hmac.compare_digest(_derive(password, salt, iterations), digest):
+            return False, None
+        return True, (self.hash(password) if self.needs_rehash(stored) else None)
+
+    def verify(self, password: str, stored: str) -> Tuple[bool, Optional[str]]:
+        """:meth:`check` on the worker pool; raises :class:`PasswordHasherBusy` when saturated."""
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Too many sign-ins in progress, try again shortly")
+        try:
+            return self._executor.submit(self.check, password, stored).result()
+        finally:
+            self._slots.release()
+
+
+PASSWORD_HASHER = PasswordHasher()
+
+
+__all__ = [
+    "LEGACY_ITERATIONS",
+    "PASSWORD_HASHER",
+    "PasswordHasher",
+    "PasswordHasherBusy",
+]
@@ -0,0 +1,47 @@
+"""Per-request memo for views that are expensive to rebuild.
+
+A single dashboard request often needs the optimizer status, the VM
+inventory and the ``docker ps`` port map from several helpers (one call per
+VM in the portal list, for example).  The request holds one
+:class:`RequestSnapshot` so each view is computed at most once, and anything
+that changes VM state drops it so later reads in the same request are fresh.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class RequestSnapshot:
+    """Lazily computed values shared by every helper handling one request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable, loader: Callable[[], Any], private: bool = False) -> Any:
+        """Return the value for ``key``, calling ``loader()`` the first time.
+
+        ``private=True`` hands out a deep copy so callers may mutate it.
+        """
+        with self._lock:
+            if key in self._values:
+                value = self._values[key]
+                return copy.deepcopy(value) if private else value
+        value = loader()
+        with self._lock:
+            value = self._values.setdefault(key, value)
+        return copy.deepcopy(value) if private else value
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._values
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+__all__ = ["RequestSnapshot"]
@@ -0,0 +1,112 @@
+"""Monotonic revisions, strong ETags and per-VM deltas for inventory payloads.
+
+Polling clients send the ETag back as ``If-None-Match`` (answered with 304)
+or the last ``revision`` as ``?since=`` (answered with only the VMs that
+changed or disappeared).  Each response variant (local list, fleet list,
+overview, per request host) is tracked as its own stream so their item sets
+never mix.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+def payload_digest(payload: Any) -> str:
+    """Stable SHA-256 of a JSON-compatible value."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def item_key(item: Mapping[str, Any]) -> Tuple[str, str]:
+    return (str(item.get("host_id") or "local"), str(item.get("name") or ""))
+
+
+class _Stream:
+    __slots__ = ("digest", "revision", "base", "items", "removed", "trimmed")
+
+    def __init__(self, revision: int):
+        self.digest = ""
+        self.revision = revision
+        # Deltas are only exact for ``since`` values this stream has seen.
+        self.base = revision
+        self.items: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        self.removed: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self.trimmed = 0
+
+
+class RevisionLog:
+    """Thread-safe revision counter shared by every inventory stream."""
+
+    def __init__(self, max_streams: int = 32, max_tombstones: int = 256):
+        self.max_streams = max_streams
+        self.max_tombstones = max_tombstones
+        self._lock = threading.Lock()
+        self._streams: "OrderedDict[str, _Stream]" = OrderedDict()
+        # Millisecond start keeps revisions from a previous process below
+        # anything issued by this one, so stale cursors get a full payload.
+        self._counter = int(time.time() * 1000)
+
+    def observe(self, stream: str, items: Iterable[Mapping[str, Any]]) -> int:
+        """Record the current item list for ``stream`` and return its revision."""
+        digests = {item_key(item): payload_digest(item) for item in items}
+        digest = payload_digest(sorted((list(key), value) for key, value in digests.items()))
+        with self._lock:
+            state = self._streams.get(stream)
+            if state is None:
+                self._counter += 1
+                state = _Stream(self._counter)
+                self._streams[stream] = state
+                while len(self._streams) > self.max_streams:
+                    self._streams.popitem(last=False)
+            self._streams.move_to_end(stream)
+            if state.digest == digest:
+                return state.revision
+            if state.digest:
+                self._counter += 1
+                state.revision = self._counter
+            state.digest = digest
+            for key in set(state.items) - set(digests):
+                del state.items[key]
+                state.removed[key] = state.revision
+                state.removed.move_to_end(key)
+            for key, value in digests.items():
+                previous = state.items.get(key)
+                if previous is None or previous[0] != value:
+                    state.items[key] = (value, state.revision)
+                    state.removed.pop(key, None)
+            while len(state.removed) > self.max_tombstones:
+                _key, revision = state.removed.popitem(last=False)
+                state.trimmed = max(state.trimmed, revision)
+            return state.revision
+
+    def delta(self, stream: str, since: int,
+              items: Iterable[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the changes after ``since``, or None when a full payload is needed."""
+        with self._lock:
+            state = self._streams.get(stream)
+            if state is None or since < state.base or since > state.revision or since < state.trimmed:
+                return None
+            changed_keys = {key for key, (_digest, revision) in state.items.items() if revision > since}
+            removed = [
+                {"host_id": key[0], "name": key[1]}
+                for key, revision in state.removed.items() if revision > since
+            ]
+        changed: List[Mapping[str, Any]] = [item for item in items if item_key(item) in changed_keys]
+        return {"delta": True, "since": since, "changed": changed, "removed": removed}
+
+
+INVENTORY_REVISIONS = RevisionLog()
+
+
+__all__ = [
+    "INVENTORY_REVISIONS",
+    "RevisionLog",
+    "item_key",
+    "payload_digest",
+]
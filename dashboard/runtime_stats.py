@@ -1,25 +1,67 @@
-"""Cached, canonical Docker container statistics for dashboard processes."""
+"""Cached, canonical Docker container statistics for dashboard processes.
+
+Every backend yields the same typed :class:`StatsRecord` shape with byte
+counts already resolved, so consumers never parse ``docker stats`` strings.
+"""
 
 from __future__ import annotations
 
+import http.client
+import json
 import math
 import os
+import re
+import socket
 import subprocess
 import threading
 import time
-from typing import Callable, Dict, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, TypedDict
+from urllib.parse import quote
+
+try:
+    from .cgroup_stats import CgroupStatsReader
+except ImportError:  # pragma: no cover - direct module loading
+    from cgroup_stats import CgroupStatsReader
 
 DOCKER_STATS_COMMAND = (
     "docker",
     "stats",
     "--no-stream",
     "--format",
-    "{{.Name}}|{{.CPUPerc}}|{{.MemPerc}}|{{.MemUsage}}",
+    "{{.Name}}|{{.CPUPerc}}|{{.MemPerc}}|{{.MemUsage}}|{{.NetIO}}|{{.BlockIO}}|{{.PIDs}}",
 )
 _DEFAULT_TTL = 2.0
 _MIN_TTL = 0.5
 _MAX_TTL = 10.0
 _STALE_MAX_AGE = 10.0
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+_ENGINE_TIMEOUT = 5.0
+_ENGINE_WORKERS = 8
+_ENGINE_PRIME_INTERVAL = 0.1
+_BACKENDS = {"auto", "cgroup", "engine", "cli"}
+_SIZE_RE = re.compile(r"^\s*([0-9.]+(?:e[+-]?[0-9]+)?)\s*([kKMGTP]?)(i?)B\s*$")
+_SIZE_POWERS = {"": 0, "K": 1, "M": 2, "G": 3, "T": 4, "P": 5}
+
+
+class StatsRecord(TypedDict):
+    """One container sample; byte fields are 0 when a backend cannot see them.
+
+    :meth:`DockerStatsCache.get` also stamps each copy with ``sample_seq`` and
+    ``sample_age``.
+    """
+
+    name: str
+    cpu_percent: float
+    mem_percent: float
+    mem_bytes: int
+    mem_limit: int
+    swap_bytes: int
+    net_rx: int
+    net_tx: int
+    block_read: int
+    block_write: int
+    pids: int
 
 
 def _configured_ttl(value: Optional[object] = None) -> float:
@@ -35,47 +77,440 @@ def _subprocess_runner(argv: Sequence[str]) -> str:
     return subprocess.check_output(list(argv), text=True)
 
 
+def _docker_socket_path() -> str:
+    host = os.environ.get("DOCKER_HOST", "")
+    if host.startswith("unix://"):
+        return host[len("unix://"):]
+    return DEFAULT_DOCKER_SOCKET
+
+
+def _configured_backend() -> str:
+    backend = os.environ.get("BLOBEVM_DOCKER_STATS_BACKEND", "auto").strip().lower()
+    return backend if backend in _BACKENDS else "auto"
+
+
+def _parse_size(text: str) -> int:
+    """Parse one ``docker stats`` size: binary (``MiB``) or decimal (``MB``)."""
+    match = _SIZE_RE.match(text)
+    if not match:
+        return 0
+    base = 1024 if match.group(3) else 1000
+    value = float(match.group(1)) * base ** _SIZE_POWERS[match.group(2).upper()]
+    return int(round(value)) if math.isfinite(value) else 0
+
+
+def _parse_pair(text: str) -> Tuple[int, int]:
+    """Parse ``"<a> / <b>"`` columns such as MemUsage, NetIO and BlockIO."""
+    left, _, right = str(text or "").partition("/")
+    return _parse_size(left), _parse_size(right)
+
+
+def _int(value: Any) -> int:
+    try:
+        return max(0, int(value or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def make_record(name: str, cpu_percent: float, mem_percent: float, *,
+                mem_bytes: int = 0, mem_limit: int = 0, swap_bytes: int = 0,
+                net_rx: int = 0, net_tx: int = 0, block_read: int = 0,
+                block_write: int = 0, pids: int = 0) -> StatsRecord:
+    return {
+        "name": name,
+        "cpu_percent": cpu_percent,
+        "mem_percent": mem_percent,
+        "mem_bytes": _int(mem_bytes),
+        "mem_limit": _int(mem_limit),
+        "swap_bytes": _int(swap_bytes),
+        "net_rx": _int(net_rx),
+        "net_tx": _int(net_tx),
+        "block_read": _int(block_read),
+        "block_write": _int(block_write),
+        "pids": _int(pids),
+    }
+
+
+class DockerEngineUnavailable(OSError):
+    """The Docker Engine API socket is missing or returned an error."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float]):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class DockerEngineClient:
+    """Minimal Engine API client over the local unix socket.
+
+    Each worker thread keeps one keep-alive connection, so a refresh costs a
+    container listing plus one concurrent stats request per running container
+    instead of a ``docker`` process spawn.  Stats are read with
+    ``one-shot=true`` (no second daemon-side sample, which costs about a
+    second per container); CPU percentages come from the usage delta against
+    the previous refresh, the same way the cgroup reader computes them.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None,
+                 timeout: float = _ENGINE_TIMEOUT,
+                 max_workers: int = _ENGINE_WORKERS,
+                 prime_interval: float = _ENGINE_PRIME_INTERVAL):
+        self.socket_path = socket_path or _docker_socket_path()
+        self.timeout = float(timeout)
+        self.max_workers = max(1, int(max_workers))
+        self.prime_interval = max(0.0, float(prime_interval))
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._cpu_lock = threading.Lock()
+        self._cpu_previous: Dict[str, Tuple[float, float]] = {}
+
+    def available(self) -> bool:
+        return os.path.exists(self.socket_path)
+
+    def _connection(self) -> _UnixHTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = _UnixHTTPConnection(self.socket_path, self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            conn.close()
+
+    def get_json(self, path: str) -> Any:
+        if not self.available():
+            raise DockerEngineUnavailable(f"docker socket not found: {self.socket_path}")
+        # A kept-alive connection may have been closed by the daemon between
+        # refreshes; retry once on a fresh connection before giving up.
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request("GET", path, headers={"Host": "docker"})
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                self._drop_connection()
+                if attempt:
+                    raise DockerEngineUnavailable(f"docker engine request failed: {exc}") from exc
+                continue
+            if response.status != 200:
+                raise DockerEngineUnavailable(
+                    f"docker engine returned HTTP {response.status} for {path.split('?', 1)[0]}",
+                    status=response.status)
+            return json.loads(body.decode("utf-8") or "null")
+        raise DockerEngineUnavailable("docker engine request failed")
+
+    def stream_json(self, path: str) -> Iterator[Any]:
+        """Yield newline-delimited JSON documents from a streaming endpoint.
+
+        Streams get their own connection without a read timeout so they never
+        block the pooled request connections.
+        """
+        if not self.available():
+            raise DockerEngineUnavailable(f"docker socket not found: {self.socket_path}")
+        conn = _UnixHTTPConnection(self.socket_path, None)
+        try:
+            conn.request("GET", path, headers={"Host": "docker"})
+            response = conn.getresponse()
+            if response.status != 200:
+                raise DockerEngineUnavailable(
+                    f"docker engine returned HTTP {response.status} for {path.split('?', 1)[0]}",
+                    status=response.status)
+            while True:
+                line = response.readline()
+                if not line:
+                    return
+                line = line.strip()
+                if line:
+                    yield json.loads(line.decode("utf-8"))
+        finally:
+            conn.close()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="docker-stats")
+            return self._executor
+
+    def container_stats(self) -> List[StatsRecord]:
+        containers = self.get_json("/containers/json")
+        if not isinstance(containers, list):
+            raise DockerEngineUnavailable("unexpected container listing from docker engine")
+        targets = []
+        for container in containers:
+            if not isinstance(container, Mapping) or not container.get("Id"):
+                continue
+            names = container.get("Names") or []
+            name = str(names[0]).lstrip("/") if names else str(container["Id"])[:12]
+            targets.append((name, str(container["Id"])))
+        if not targets:
+            return []
+
+        def fetch(target):
+            try:
+                return target, self.get_json(f"/containers/{quote(target[1])}/stats?stream=false&one-shot=true")
+            except DockerEngineUnavailable:
+                # Containers can stop between listing and sampling; the CLI
+                # omits them too.
+                return target, None
+
+        samples = [(target, raw) for target, raw in self._pool().map(fetch, targets) if isinstance(raw, Mapping)]
+        with self._cpu_lock:
+            baseline = dict(self._cpu_previous)
+        unprimed = [target for target, raw in samples if target[1] not in baseline and not _has_precpu(raw)]
+        if unprimed and self.prime_interval:
+            # A container seen for the first time has no CPU baseline; take
+            # one so callers do not see it at 0% until the next refresh.
+            for target, raw in samples:
+                if target in unprimed:
+                    baseline[target[1]] = _cpu_counters(raw)
+            time.sleep(self.prime_interval)
+            again = {target: raw for target, raw in self._pool().map(fetch, unprimed) if isinstance(raw, Mapping)}
+            samples = [(target, again.get(target, raw)) for target, raw in samples]
+
+        records: List[StatsRecord] = []
+        previous: Dict[str, Tuple[float, float]] = {}
+        for (name, container_id), raw in samples:
+            # With neither precpu nor a baseline the delta is zero, not the
+            # container's lifetime average.
+            record = _engine_record(name, raw, None if _has_precpu(raw) else (baseline.get(container_id) or _cpu_counters(raw)))
+            if record:
+                records.append(record)
+            counters = _cpu_counters(raw)
+            if counters is not None:
+                previous[container_id] = counters
+        with self._cpu_lock:
+            self._cpu_previous = previous
+        return records
+
+
+def _cpu_counters(raw: Mapping) -> Optional[Tuple[float, float]]:
+    """``(container total_usage, host system_cpu_usage)`` from a stats document."""
+    cpu_stats = raw.get("cpu_stats") or {}
+    try:
+        return (float((cpu_stats.get("cpu_usage") or {}).get("total_usage", 0)),
+                float(cpu_stats.get("system_cpu_usage", 0)))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _has_precpu(raw: Mapping) -> bool:
+    """Whether the daemon filled ``precpu_stats`` (it does not for one-shot reads)."""
+    try:
+        return float((raw.get("precpu_stats") or {}).get("system_cpu_usage") or 0) > 0
+    except (TypeError, ValueError, AttributeError):
+        return False
+
+
+def _engine_record(name: str, raw: Any,
+                   previous: Optional[Tuple[float, float]] = None) -> Optional[StatsRecord]:
+    """Convert one Engine API stats document to a typed record.
+
+    ``previous`` stands in for ``precpu_stats`` as ``(total_usage,
+    system_cpu_usage)`` from an earlier read of the same container.
+    """
+    if not isinstance(raw, Mapping):
+        return None
+    cpu_stats = raw.get("cpu_stats") or {}
+    precpu = raw.get("precpu_stats") or {}
+    cpu_usage = cpu_stats.get("cpu_usage") or {}
+    try:
+        if previous is None:
+            previous = (float((precpu.get("cpu_usage") or {}).get("total_usage", 0)),
+                        float(precpu.get("system_cpu_usage", 0)))
+        cpu_delta = float(cpu_usage.get("total_usage", 0)) - previous[0]
+        system_delta = float(cpu_stats.get("system_cpu_usage", 0)) - previous[1]
+        online = float(cpu_stats.get("online_cpus") or len(cpu_usage.get("percpu_usage") or ()) or 1)
+        cpu = cpu_delta / system_delta * online * 100.0 if cpu_delta > 0 and system_delta > 0 else 0.0
+        memory = raw.get("memory_stats") or {}
+        mem_stats = memory.get("stats") or {}
+        # Same accounting as the docker CLI: page cache is not "used".
+        cache = mem_stats.get("inactive_file", mem_stats.get("total_inactive_file", 0))
+        limit = float(memory.get("limit", 0))
+        used = max(0.0, float(memory.get("usage", 0)) - float(cache or 0))
+        mem = used / limit * 100.0 if limit > 0 else 0.0
+        networks = raw.get("networks") or {}
+        net_rx = sum(_int(iface.get("rx_bytes")) for iface in networks.values())
+        net_tx = sum(_int(iface.get("tx_bytes")) for iface in networks.values())
+        block = {"read": 0, "write": 0}
+        for entry in (raw.get("blkio_stats") or {}).get("io_service_bytes_recursive") or ():
+            op = str(entry.get("op") or "").lower()
+            if op in block:
+                block[op] += _int(entry.get("value"))
+        pids = (raw.get("pids_stats") or {}).get("current")
+    except (TypeError, ValueError, AttributeError):
+        return None
+    if not math.isfinite(cpu) or not math.isfinite(mem):
+        return None
+    return make_record(
+        name, round(cpu, 2), round(mem, 2),
+        mem_bytes=int(used), mem_limit=int(limit), net_rx=net_rx, net_tx=net_tx,
+        block_read=block["read"], block_write=block["write"], pids=pids,
+    )
+
+
 class DockerStatsCache:
-    """Thread-safe TTL cache with bounded stale-on-error behavior."""
+    """Thread-safe TTL cache with bounded stale-on-error behavior.
+
+    Samples come from cgroup v2 files for ``blobevm_*`` containers when the
+    hierarchy is readable, then the Engine API socket, then the ``docker
+    stats`` CLI.  An injected ``runner`` pins the CLI path.
+    """
 
     def __init__(self, runner: Optional[Callable[[Sequence[str]], str]] = None,
                  clock: Optional[Callable[[], float]] = None,
-                 ttl: Optional[float] = None):
+                 ttl: Optional[float] = None,
+                 engine: Optional[DockerEngineClient] = None,
+                 cgroup: Optional[CgroupStatsReader] = None,
+                 listeners: Optional[List[Callable[[List[StatsRecord], float], None]]] = None):
+        backend = _configured_backend()
+        if runner is None and backend in {"auto", "cgroup"} and cgroup is None:
+            cgroup = CgroupStatsReader()
+        if runner is None and backend in {"auto", "engine"} and engine is None:
+            engine = DockerEngineClient()
+        self.cgroup = cgroup
+        self.engine = engine
         self.runner = runner or _subprocess_runner
         self.clock = clock or time.monotonic
         self.ttl = _configured_ttl(ttl)
         self._lock = threading.Lock()
-        self._records: List[Dict[str, object]] = []
+        self._refresh_lock = threading.Lock()
+        self._records: List[StatsRecord] = []
+        self._sequence = 0
         self._successful_at: Optional[float] = None
         self._refreshed_at: Optional[float] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+        self.listeners = listeners if listeners is not None else []
         self.last_error: Optional[str] = None
 
-    def get(self) -> List[Dict[str, object]]:
-        now = self.clock()
-        with self._lock:
-            if self._refreshed_at is not None and now - self._refreshed_at < self.ttl:
-                return [record.copy() for record in self._records]
-            try:
-                records = self._parse(self.runner(list(DOCKER_STATS_COMMAND)))
-            except Exception as exc:
+    def get(self) -> List[StatsRecord]:
+        """Return the latest records stamped with ``sample_seq``/``sample_age``.
+
+        Without a sampler the first caller after the TTL refreshes inline and
+        concurrent callers wait for that single refresh.  With a sampler
+        running, readers only copy the current snapshot.
+        """
+        if not self.sampler_running():
+            with self._refresh_lock:
+                now = self.clock()
+                if self._refreshed_at is None or now - self._refreshed_at >= self.ttl:
+                    self._refresh_locked(now)
+        return self._snapshot(self.clock())
+
+    def refresh(self) -> bool:
+        """Take one sample now; returns ``False`` when every backend failed."""
+        with self._refresh_lock:
+            return self._refresh_locked(self.clock())
+
+    def _refresh_locked(self, now: float) -> bool:
+        try:
+            records = self._sample()
+        except Exception as exc:
+            with self._lock:
                 self.last_error = str(exc)
                 self._refreshed_at = now
-                if (self._successful_at is not None and
-                        now - self._successful_at <= _STALE_MAX_AGE):
-                    return [record.copy() for record in self._records]
-                return []
+            return False
+        with self._lock:
             self._records = records
+            self._sequence += 1
             self._successful_at = now
             self._refreshed_at = now
             self.last_error = None
-            return [record.copy() for record in records]
+        wall = time.time()
+        for listener in list(self.listeners):
+            try:
+                listener([dict(record) for record in records], wall)
+            except Exception:  # a broken consumer must not fail the refresh
+                pass
+        return True
+
+    def _snapshot(self, now: float) -> List[StatsRecord]:
+        with self._lock:
+            if (self._successful_at is None or
+                    now - self._successful_at > _STALE_MAX_AGE):
+                return []
+            age = round(max(0.0, now - self._successful_at), 3)
+            stamp = {"sample_seq": self._sequence, "sample_age": age}
+            return [{**record, **stamp} for record in self._records]
+
+    def sampler_running(self) -> bool:
+        sampler = self._sampler
+        return sampler is not None and sampler.is_alive()
+
+    def start_sampler(self) -> bool:
+        """Refresh every TTL on a daemon thread (stale-while-revalidate)."""
+        with self._refresh_lock:
+            if self.sampler_running():
+                return False
+            self._sampler_stop = threading.Event()
+            self._sampler = threading.Thread(
+                target=self._sample_loop, args=(self._sampler_stop,),
+                name="docker-stats-sampler", daemon=True)
+            self._sampler.start()
+            return True
+
+    def stop_sampler(self, timeout: Optional[float] = None) -> None:
+        self._sampler_stop.set()
+        sampler = self._sampler
+        if sampler is not None and sampler is not threading.current_thread():
+            sampler.join(timeout)
+        self._sampler = None
+
+    def _sample_loop(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            started = time.monotonic()
+            try:
+                self.refresh()
+            except Exception as exc:  # keep sampling; readers see last_error
+                self.last_error = str(exc)
+            stop.wait(max(0.0, self.ttl - (time.monotonic() - started)))
+
+    def _sample(self) -> List[StatsRecord]:
+        if self.cgroup is not None:
+            try:
+                records = self.cgroup.read()
+            except OSError as exc:
+                if _configured_backend() == "cgroup":
+                    raise
+                self.last_error = str(exc)
+            else:
+                return [make_record(**record) for record in records]
+        if self.engine is not None:
+            try:
+                return self.engine.container_stats()
+            except (DockerEngineUnavailable, ValueError) as exc:
+                if _configured_backend() == "engine":
+                    raise
+                self.last_error = str(exc)
+        return self._parse(self.runner(list(DOCKER_STATS_COMMAND)))
 
     @staticmethod
-    def _parse(output: str) -> List[Dict[str, object]]:
-        records: List[Dict[str, object]] = []
+    def _parse(output: str) -> List[StatsRecord]:
+        records: List[StatsRecord] = []
         for line in output.splitlines():
-            parts = line.split("|", 3)
-            if len(parts) != 4 or not parts[0].strip():
+            parts = line.split("|")
+            if len(parts) < 4 or not parts[0].strip():
                 continue
             try:
                 cpu = float(parts[1].strip().rstrip("%"))
@@ -84,25 +519,54 @@ class DockerStatsCache:
                 continue
             if not math.isfinite(cpu) or not math.isfinite(mem):
                 continue
-            records.append({
-                "name": parts[0].strip(),
-                "cpu_percent": cpu,
-                "mem_percent": mem,
-                "mem_usage": parts[3].strip(),
-            })
+            # Older format strings stop after MemUsage; missing columns are 0.
+            parts += [""] * (7 - len(parts))
+            mem_bytes, mem_limit = _parse_pair(parts[3])
+            net_rx, net_tx = _parse_pair(parts[4])
+            block_read, block_write = _parse_pair(parts[5])
+            pids = parts[6].strip()
+            records.append(make_record(
+                parts[0].strip(), cpu, mem,
+                mem_bytes=mem_bytes, mem_limit=mem_limit,
+                net_rx=net_rx, net_tx=net_tx,
+                block_read=block_read, block_write=block_write,
+                pids=int(pids) if pids.isdigit() else 0,
+            ))
         return records
 
 
-_default_cache = DockerStatsCache()
+def _sampler_enabled() -> bool:
+    value = os.environ.get("BLOBEVM_DOCKER_STATS_SAMPLER", "")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
 
+_stats_listeners: List[Callable[[List[StatsRecord], float], None]] = []
+_default_cache = DockerStatsCache(listeners=_stats_listeners)
 
-def get_docker_stats() -> List[Dict[str, object]]:
+
+def add_stats_listener(listener: Callable[[List[StatsRecord], float], None]) -> None:
+    """Call ``listener(records, wall_time)`` after every successful refresh."""
+    if listener not in _stats_listeners:
+        _stats_listeners.append(listener)
+
+
+def get_docker_stats() -> List[StatsRecord]:
+    if _sampler_enabled() and not _default_cache.sampler_running():
+        _default_cache.start_sampler()
     return _default_cache.get()
 
 
+def start_docker_stats_sampler() -> bool:
+    """Start the shared background sampler if BLOBEVM_DOCKER_STATS_SAMPLER is on."""
+    if not _sampler_enabled():
+        return False
+    return _default_cache.start_sampler()
+
+
 def _clear_default_cache() -> None:
     global _default_cache
-    _default_cache = DockerStatsCache()
+    _default_cache.stop_sampler(timeout=1.0)
+    _default_cache = DockerStatsCache(listeners=_stats_listeners)
 
 
 get_docker_stats.cache_clear = _clear_default_cache
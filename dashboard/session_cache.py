@@ -0,0 +1,95 @@
+"""LRU of already-verified Dashboard-Auth and Portal-Auth session tokens.
+
+Every authenticated request used to base64-decode its cookie, recompute the
+HMAC, parse the payload and (for portal sessions) look the user up in
+SQLite.  Polling endpoints repeat that for the same cookie every few
+seconds.  A verified token is remembered under a digest of the token and the
+secret that signed it, together with its expiry and the resolved user, so
+repeat requests skip the crypto and the database.  Only successful
+verifications are stored; user updates, disables and deletes drop them all.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+DEFAULT_USER_TTL_SECONDS = 60.0
+
+
+def _env_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get("BLOBEVM_SESSION_CACHE_TTL", DEFAULT_USER_TTL_SECONDS)))
+    except ValueError:
+        return DEFAULT_USER_TTL_SECONDS
+
+
+class VerifiedTokenCache:
+    """Bounded, thread-safe ``(kind, secret, token) -> value`` cache.
+
+    Entries live until the token's own expiry, capped at ``max_age`` seconds
+    so a user snapshot cannot outlive out-of-band database edits for long.
+    """
+
+    def __init__(self, max_entries: int = 2048, max_age: Optional[float] = None,
+                 clock: Optional[Callable[[], float]] = None):
+        self.max_entries = max_entries
+        self.max_age = _env_ttl() if max_age is None else float(max_age)
+        self.clock = clock or time.time
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._generation = 0
+
+    @staticmethod
+    def _key(kind: str, secret: str, token: str) -> str:
+        return hashlib.sha256(f"{kind}\0{secret}\0{token}".encode("utf-8")).hexdigest()
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, kind: str, secret: str, token: str) -> Optional[Any]:
+        """Return a private copy of the cached value, or None on a miss."""
+        key = self._key(kind, secret, token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.clock() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(entry[1])
+
+    def put(self, kind: str, secret: str, token: str, expires_at: float, value: Any,
+            generation: int) -> None:
+        if self.max_age <= 0 or value is None:
+            return
+        deadline = min(float(expires_at), self.clock() + self.max_age)
+        with self._lock:
+            if generation != self._generation:
+                return
+            key = self._key(kind, secret, token)
+            self._entries[key] = (deadline, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+SESSION_TOKENS = VerifiedTokenCache()
+
+
+__all__ = [
+    "SESSION_TOKENS",
+    "VerifiedTokenCache",
+]
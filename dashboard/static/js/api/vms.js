@@ -12,6 +12,32 @@
     }catch(_){ return ''; }
   }
 
+  // Recover/escalate return a job id; resolve with the job's JSON result once it finishes.
+  async function waitForJob(jobId, timeoutMs){
+    const deadline = Date.now() + (timeoutMs || 15 * 60 * 1000);
+    while(Date.now() < deadline){
+      const res = await fetch(`/dashboard/api/jobs/${encodeURIComponent(jobId)}`, { cache:'no-store' });
+      const body = await readJson(res);
+      const job = body && body.job;
+      if(!res.ok || !job) return { ok:false, status: res.status, body: body || {} };
+      if(job.status !== 'queued' && job.status !== 'running'){
+        let result;
+        try { result = JSON.parse(job.output || job.error || '{}'); }
+        catch (e) { result = { ok:false, error: job.error || job.output || 'Job failed' }; }
+        result.jobId = jobId;
+        return { ok: job.status === 'succeeded' && !!result.ok, status: res.status, body: result };
+      }
+      await new Promise(resolve => setTimeout(resolve, 1000));
+    }
+    return { ok:false, status: 504, body: { ok:false, error:'Timed out waiting for the job', jobId } };
+  }
+
+  async function followJob(res){
+    const body = await readJson(res);
+    if(res.ok && body && body.jobId) return await waitForJob(body.jobId);
+    return { ok: !!(res.ok && body && body.ok), status: res.status, body };
+  }
+
   window.api.startVM = async function(vmname){
     const res = await fetch(`/dashboard/api/start/${encodeURIComponent(vmname)}${hostQuery()}`, {method:'POST'});
     const body = await readJson(res);
@@ -29,8 +55,7 @@
       headers:{'Content-Type':'application/json'},
       body: JSON.stringify(payload || {})
     });
-    const body = await readJson(res);
-    return { ok: !!(res.ok && body && body.ok), status: res.status, body };
+    return await followJob(res);
   };
 
   window.api.optimizerSummary = async function(){
@@ -45,8 +70,7 @@
       headers:{'Content-Type':'application/json'},
       body: JSON.stringify(payload || {})
     });
-    const body = await readJson(res);
-    return { ok: !!(res.ok && body && body.ok), status: res.status, body };
+    return await followJob(res);
   };
 
   window.api.stopVMViaPortal = async function(vmname){
@@ -1,4 +1,12 @@
 (function(){
+  // While the /dashboard/api/events stream is open, status is refetched on
+  // change and the timer only runs as a slow safety net.
+  const EVENTS_SAFETY_INTERVAL = 30000;
+
+  function remoteHost(){
+    try{ return !!new URLSearchParams(window.location.search).get('host_id'); }catch(_){ return false; }
+  }
+
   window.useVMStatus = function(vmname, opts){
     const interval = (opts && opts.interval) || 1500;
     const { useState, useEffect } = React;
@@ -8,7 +16,11 @@
       useEffect(()=>{
         let cancelled = false;
         let handle = null;
+        let source = null;
+        let streaming = false;
+        let lastPoll = 0;
         async function pollOnce(){
+          lastPoll = Date.now();
           try{
             const j = await window.api.getVMStatus(vmname);
             if(!cancelled) setState(j && typeof j === 'object' ? j : { ok:false, status:'unknown', state:'unknown' });
@@ -16,9 +28,20 @@
             if(!cancelled) setState({ ok:false, error:String(e), status:'unknown', state:'unknown', running:false, healthy:false, crashed:false, exists:false });
           }
         }
+        // Remote VMs are not covered by this server's event stream.
+        if(typeof window.EventSource === 'function' && !remoteHost()){
+          source = new window.EventSource(`/dashboard/api/events?vm=${encodeURIComponent(vmname)}`);
+          source.onopen = ()=>{ streaming = true; };
+          source.onerror = ()=>{ streaming = false; };
+          source.addEventListener('vm', pollOnce);
+          source.addEventListener('resync', pollOnce);
+        }
         pollOnce();
-        handle = setInterval(pollOnce, interval);
-        return ()=>{ cancelled = true; if(handle) clearInterval(handle); };
+        handle = setInterval(()=>{
+          if(streaming && Date.now() - lastPoll < EVENTS_SAFETY_INTERVAL) return;
+          pollOnce();
+        }, interval);
+        return ()=>{ cancelled = true; if(handle) clearInterval(handle); if(source) source.close(); };
       }, [vmname, interval]);
       return state;
     })();
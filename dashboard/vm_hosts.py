@@ -7,9 +7,11 @@ identity that a remote provider can implement later.
 
 from __future__ import annotations
 
+import json
 import os
 import subprocess
-from typing import Any, Iterable, Mapping, Protocol, Sequence
+from collections import deque
+from typing import Any, Callable, Iterable, Mapping, Protocol, Sequence
 
 
 class VmHostError(RuntimeError):
@@ -107,6 +109,35 @@ class LocalDockerHost:
                 f"VM manager is unavailable: {self.manager}"
             ) from exc
 
+    def stream_manager(
+        self, *args: object, on_output: Callable[[str], None], tail_chars: int = 16000
+    ) -> subprocess.CompletedProcess[str]:
+        """Run the manager, passing each output line to ``on_output`` as it arrives.
+
+        stderr is merged into stdout; only the last ``tail_chars`` characters
+        are kept in the returned result.
+        """
+
+        try:
+            proc = subprocess.Popen(
+                self.command(*args), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, bufsize=1, errors="replace",
+            )
+        except FileNotFoundError as exc:
+            raise VmHostUnavailable(
+                f"VM manager is unavailable: {self.manager}"
+            ) from exc
+        tail: deque[str] = deque()
+        kept = 0
+        with proc:
+            for line in proc.stdout:
+                on_output(line)
+                tail.append(line)
+                kept += len(line)
+                while kept > tail_chars and len(tail) > 1:
+                    kept -= len(tail.popleft())
+        return subprocess.CompletedProcess(proc.args, proc.returncode, "".join(tail)[-tail_chars:], "")
+
     def check_call(self, *args: object, **kwargs: Any) -> int:
         """Run a manager command using ``subprocess.check_call`` semantics."""
 
@@ -172,8 +203,27 @@ class LocalDockerHost:
         return normalized
 
     def list_vms(self) -> list[dict[str, Any]]:
-        """List manager inventory and normalize its legacy text format."""
+        """List manager inventory from ``list --json``.
+
+        Managers that predate the JSON mode exit non-zero or print the text
+        listing; both fall back to parsing the legacy ``- name -> ...`` lines.
+        """
+
+        try:
+            output = self.check_output("list", "--json", text=True, stderr=subprocess.DEVNULL)
+            records = json.loads(output)
+            if not isinstance(records, list):
+                raise ValueError("manager list --json did not return a list")
+        except (subprocess.CalledProcessError, ValueError):
+            return self._list_vms_text()
+        instances = [
+            {key: value for key, value in record.items() if value is not None}
+            for record in records
+            if isinstance(record, Mapping) and record.get("name")
+        ]
+        return self.normalize_inventory(instances)
 
+    def _list_vms_text(self) -> list[dict[str, Any]]:
         output = self.check_output("list", text=True)
         if isinstance(output, bytes):
             output = output.decode()
@@ -0,0 +1,88 @@
+"""Wait until a VM is actually serving instead of sleeping a fixed interval.
+
+Callers hand :meth:`ReadinessWaiter.wait` a probe for one VM.  The probe is
+retried on an exponential backoff up to a deadline, and a Docker state or
+health event for that VM (fed in through :meth:`ReadinessWaiter.notify`)
+cuts the current backoff short, so the wait ends about when the VM starts
+answering.  Successful waits record how long the VM took to boot.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Probe = Callable[[], Tuple[bool, Any]]
+
+
+class ReadinessWaiter:
+    """Event-woken, backoff-paced readiness polling with boot-time history."""
+
+    def __init__(self, initial_delay: float = 0.25, max_delay: float = 4.0,
+                 clock: Callable[[], float] = time.monotonic, max_history: int = 256):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.max_history = max_history
+        self._cond = threading.Condition()
+        self._versions: Dict[str, int] = {}
+        self._boots: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def now(self) -> float:
+        """Timestamp to pass back as ``started_at`` when the boot was triggered."""
+        return self.clock()
+
+    def notify(self, name: str) -> None:
+        """Wake waiters for ``name``: its container changed state or health."""
+        with self._cond:
+            self._versions[name] = self._versions.get(name, 0) + 1
+            self._cond.notify_all()
+
+    def wait(self, name: str, probe: Probe, timeout: float,
+             started_at: Optional[float] = None, source: str = "") -> Dict[str, Any]:
+        """Probe until it reports ready or ``timeout`` seconds pass.
+
+        Returns ``{ready, seconds, probes, detail}`` where ``detail`` is the
+        last probe's second value and ``seconds`` is measured from
+        ``started_at`` (default: now).
+        """
+        start = self.clock() if started_at is None else started_at
+        deadline = self.clock() + max(0.0, timeout)
+        delay = self.initial_delay
+        probes = 0
+        while True:
+            with self._cond:
+                version = self._versions.get(name, 0)
+            probes += 1
+            ready, detail = probe()
+            now = self.clock()
+            if ready:
+                seconds = round(max(0.0, now - start), 3)
+                self._record(name, seconds, source)
+                return {"ready": True, "seconds": seconds, "probes": probes, "detail": detail}
+            remaining = deadline - now
+            if remaining <= 0:
+                return {"ready": False, "seconds": round(max(0.0, now - start), 3), "probes": probes, "detail": detail}
+            with self._cond:
+                self._cond.wait_for(lambda: self._versions.get(name, 0) != version, timeout=min(delay, remaining))
+            delay = min(self.max_delay, delay * 2)
+
+    def boot_time(self, name: str) -> Optional[Dict[str, Any]]:
+        """Last recorded ``{seconds, at, source}`` for ``name``, if any."""
+        with self._cond:
+            boot = self._boots.get(name)
+            return dict(boot) if boot else None
+
+    def _record(self, name: str, seconds: float, source: str) -> None:
+        with self._cond:
+            self._boots.pop(name, None)
+            self._boots[name] = {"seconds": seconds, "at": int(time.time()), "source": source}
+            while len(self._boots) > self.max_history:
+                self._boots.popitem(last=False)
+
+
+__all__ = [
+    "ReadinessWaiter",
+]
@@ -0,0 +1,27 @@
+const EVENTS_URL = '/Dashboard/api/events'
+const STATE_EVENTS = ['vm', 'job', 'pressure', 'optimizer', 'notification', 'resync']
+
+// Subscribe to the dashboard SSE stream. `onEvent(type, data)` fires for each
+// state event; `onStatus(connected)` tracks whether the stream is up so
+// callers can relax their polling. Returns an unsubscribe function.
+export function subscribeDashboardEvents(onEvent, { onStatus = () => {}, vm = '', EventSourceImpl = globalThis.EventSource } = {}) {
+  if (typeof EventSourceImpl !== 'function') {
+    onStatus(false)
+    return () => {}
+  }
+  const url = vm ? `${EVENTS_URL}?vm=${encodeURIComponent(vm)}` : EVENTS_URL
+  const source = new EventSourceImpl(url, { withCredentials: true })
+  source.onopen = () => onStatus(true)
+  source.onerror = () => onStatus(false)
+  for (const type of STATE_EVENTS) {
+    source.addEventListener(type, event => {
+      let data = {}
+      try { data = JSON.parse(event.data || '{}') } catch (_e) {}
+      onEvent(type, data)
+    })
+  }
+  return () => {
+    source.close()
+    onStatus(false)
+  }
+}
@@ -1,5 +1,6 @@
 const MIN_VISIBLE_DELAY_MS = 800
 const DEFAULT_HIDDEN_DELAY_MS = 60_000
+const EVENTS_CONNECTED_DELAY_MS = 10_000
 
 export function instanceNamesKey(instances = []) {
   return [...new Set(
@@ -9,7 +10,63 @@ export function instanceNamesKey(instances = []) {
   )].sort().join('\u0000')
 }
 
-export function pollDelayMs({ visible = true, intervalMs = 3000, hiddenDelayMs = DEFAULT_HIDDEN_DELAY_MS } = {}) {
+export function pollDelayMs({ visible = true, intervalMs = 3000, hiddenDelayMs = DEFAULT_HIDDEN_DELAY_MS, eventsConnected = false } = {}) {
   if (!visible) return Math.max(0, Number(hiddenDelayMs) || DEFAULT_HIDDEN_DELAY_MS)
-  return Math.max(MIN_VISIBLE_DELAY_MS, Number(intervalMs) || 3000)
+  const delay = Math.max(MIN_VISIBLE_DELAY_MS, Number(intervalMs) || 3000)
+  // With the event stream up, state changes trigger a reload; the timer only
+  // refreshes live stats.
+  return eventsConnected ? Math.max(EVENTS_CONNECTED_DELAY_MS, delay) : delay
+}
+
+export function instanceKey(instance = {}) {
+  return `${instance?.host_id ?? 'local'}\u0000${instance?.name ?? ''}`
+}
+
+// Rebuild the full instance list from a `?since=` delta response
+// ({ delta, changed, removed }); full responses pass through unchanged.
+export function applyInventoryDelta(instances = [], body = {}) {
+  if (!body?.delta) return body?.instances || []
+  const removed = new Set((body.removed || []).map(instanceKey))
+  const changed = new Map((body.changed || []).map(instance => [instanceKey(instance), instance]))
+  const merged = []
+  for (const instance of instances) {
+    const key = instanceKey(instance)
+    if (removed.has(key)) continue
+    if (changed.has(key)) {
+      merged.push(changed.get(key))
+      changed.delete(key)
+    } else {
+      merged.push(instance)
+    }
+  }
+  return [...merged, ...changed.values()]
+}
+
+// Conditional poller for revisioned inventory endpoints (/list, /overview).
+// Sends the last ETag as If-None-Match and the last revision as ?since=, so an
+// unchanged fleet costs a 304 and a changed one only the VMs that moved.
+export function createInventoryPoller(fetcher) {
+  let state = { etag: '', revision: null, body: null }
+  return {
+    async fetch(path) {
+      const headers = state.etag ? { 'If-None-Match': state.etag } : {}
+      const url = state.body && state.revision != null
+        ? `${path}${path.includes('?') ? '&' : '?'}since=${encodeURIComponent(state.revision)}`
+        : path
+      const res = await fetcher(url, { headers })
+      if (res.status === 304 && state.body) return { ok: true, status: 304, body: state.body }
+      const body = await res.json().catch(() => ({ ok: false }))
+      if (!res.ok || body?.ok === false) return { ok: false, status: res.status, body }
+      const merged = { ...body, instances: applyInventoryDelta(state.body?.instances || [], body) }
+      delete merged.delta
+      delete merged.changed
+      delete merged.removed
+      delete merged.since
+      state = { etag: res.headers?.get?.('ETag') || '', revision: body.revision ?? null, body: merged }
+      return { ok: true, status: res.status, body: merged }
+    },
+    reset() {
+      state = { etag: '', revision: null, body: null }
+    }
+  }
 }
@@ -21,11 +21,17 @@ export default function APIInfo(){
     '/dashboard/api/stats',
     '/dashboard/api/list',
     '/dashboard/api/vm/stats',
+    '/dashboard/api/vms/status?names=<a,b>',
+    '/dashboard/api/vms/bulk',
+    '/dashboard/api/metrics/host',
+    '/dashboard/api/metrics/vm/<name>',
     '/dashboard/api/vm/logs/<name>',
     '/dashboard/api/vm/exec/<name>',
     '/dashboard/api/overview',
     '/dashboard/api/notifications',
+    '/dashboard/api/events',
     '/dashboard/api/jobs',
+    '/dashboard/api/jobs/<id>/log?offset=<n>&follow=1',
     '/dashboard/api/apps',
     '/dashboard/api/optimizer/status',
     '/dashboard/api/optimizer/v2/summary',
@@ -4,6 +4,7 @@ import { Cpu, Memory, HardDrives, Network, Plus, ArrowRight, PlayCircle, CheckCi
 import apiFetch from '../lib/fetchWrapper'
 import Button from '../components/Button'
 import { formatBytes, formatDuration } from '../lib/formatters.js'
+import { createInventoryPoller } from '../lib/polling.js'
 
 function Metric({icon:Icon,label,value,detail,tone='ok'}){
   return <div className="host-metric"><div className="metric-label"><Icon size={21}/><span>{label}</span></div><strong>{value}</strong><div className="metric-track"><i style={{width:`${Math.min(Number.parseFloat(value)||0,100)}%`}}/></div><div className="metric-foot"><span>{detail}</span><em className={`tone-${tone}`}>{tone === 'ok' ? 'Healthy' : 'Attention'}</em></div></div>
@@ -30,6 +31,7 @@ export default function Home(){
   const navigate = useNavigate()
   useEffect(()=>{
     let live = true
+    const fleetPoller = createInventoryPoller(apiFetch)
     const get = (path) => apiFetch(path).then(r=>r.json().then(body=>({ok:r.ok,body}))).then(({ok,body})=>{
       if(!ok || body?.ok === false) throw new Error(body?.error || 'Unable to load host overview')
       return body
@@ -39,8 +41,9 @@ export default function Home(){
         if(!live) return
         setOverview(prev=>({...(prev||{}), ...body})); setError('')
       }).catch(e=>live && setError(e.message || 'Unable to load host overview'))
-      get('/overview?parts=instances').then(body=>{
+      fleetPoller.fetch('/overview?parts=instances').then(({ok,body})=>{
         if(!live) return
+        if(!ok) throw new Error(body?.error || 'Unable to load host overview')
         setFleet(body.instances || [])
       }).catch(()=>{ if(live) setFleet(prev=>prev||[]) })
     }
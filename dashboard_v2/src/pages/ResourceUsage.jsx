@@ -5,6 +5,8 @@ import { formatBytes } from '../lib/formatters.js'
 export default function ResourceUsage(){
   const [stats, setStats] = useState(null)
   const [loading, setLoading] = useState(true)
+  const [history, setHistory] = useState(null)
+  const [range, setRange] = useState(3600)
 
   useEffect(()=>{
     let stopped = false
@@ -23,6 +25,23 @@ export default function ResourceUsage(){
     return ()=>{ stopped=true }
   }, [])
 
+  useEffect(()=>{
+    let stopped = false
+    apiFetch(`/metrics/host?range=${range}`)
+      .then(r=>r.json()).then(j=>{ if(!stopped) setHistory(j && j.ok ? j : null) })
+      .catch(()=>{ if(!stopped) setHistory(null) })
+    return ()=>{ stopped=true }
+  }, [range])
+
+  function summary(field){
+    const values = history && history.points ? history.points[field] || [] : []
+    if(!values.length) return null
+    const total = values.reduce((a,b)=>a+b, 0)
+    return { avg: total / values.length, max: Math.max(...values) }
+  }
+  const cpuHistory = summary('cpu_percent')
+  const memHistory = summary('mem_bytes')
+
   return (
     <div>
       <h1 style={{marginTop:0}}>Resource Usage</h1>
@@ -53,6 +72,21 @@ export default function ResourceUsage(){
           </div>
         )}
       </div>
+      <div className="glass-card" style={{marginTop:12}}>
+        <div style={{display:'flex',justifyContent:'space-between',alignItems:'center'}}>
+          <div style={{fontSize:12,color:'var(--muted)'}}>History{history ? ` (${history.step}s resolution)` : ''}</div>
+          <select value={range} onChange={e=>setRange(parseInt(e.target.value,10))}>
+            <option value={900}>15 minutes</option>
+            <option value={3600}>1 hour</option>
+            <option value={86400}>24 hours</option>
+            <option value={2592000}>30 days</option>
+          </select>
+        </div>
+        <div style={{display:'grid',gridTemplateColumns:'1fr 1fr',gap:12,marginTop:8}}>
+          <div>CPU avg {cpuHistory ? `${cpuHistory.avg.toFixed(1)}%` : '—'} · peak {cpuHistory ? `${cpuHistory.max.toFixed(1)}%` : '—'}</div>
+          <div>Memory avg {memHistory ? formatBytes(memHistory.avg) : '—'} · peak {memHistory ? formatBytes(memHistory.max) : '—'}</div>
+        </div>
+      </div>
     </div>
   )
 }
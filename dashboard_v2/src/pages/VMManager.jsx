@@ -4,7 +4,8 @@ import apiFetch from '../lib/fetchWrapper'
 import Modal from '../components/Modal'
 import VmExec from '../components/VmExec'
 import { useToasts } from '../components/ToastProvider'
-import { instanceNamesKey, pollDelayMs } from '../lib/polling'
+import { createInventoryPoller, instanceNamesKey, pollDelayMs } from '../lib/polling'
+import { subscribeDashboardEvents } from '../lib/events'
 import { canCacheVmSettingsResponse, clearRemovedVmState, createLoadInFlightRunner, createLogSelectionTracker } from '../lib/vmManagerRaces'
 import { canUseRemotePlacement, createPlacementPayload, getEligibleRemoteHosts, getPlacementValidationReason, hostOptionLabel, normalizeHostInventory, remotePlacementDisabledReason } from '../lib/hostPlacement'
 
@@ -153,6 +154,8 @@ export default function VMManager(){
   const loadRunnerRef = useRef(null)
   const mountedRef = useRef(true)
   const manageRequestSequenceRef = useRef(0)
+  const listPollerRef = useRef(null)
+  if(!listPollerRef.current) listPollerRef.current = createInventoryPoller(apiFetch)
   if(!loadRunnerRef.current) loadRunnerRef.current = createLoadInFlightRunner()
   if(!logSelectionTrackerRef.current) logSelectionTrackerRef.current = createLogSelectionTracker()
 
@@ -187,13 +190,13 @@ export default function VMManager(){
     }
     try{
       const [rList, rStats, rOpt, rSettings, rHosts] = await Promise.all([
-        apiFetch('/list?fleet=1'),
+        listPollerRef.current.fetch('/list?fleet=1'),
         apiFetch('/vm/stats').catch(()=>({ok:false})),
         apiFetch('/optimizer/v2/summary').catch(()=>({ok:false})),
         apiFetch('/settings').catch(()=>({ok:false})),
         apiFetch('/hosts').catch(()=>({ok:false}))
       ])
-      const j = await rList.json().catch(()=>({instances:[]}))
+      const j = rList.body && Array.isArray(rList.body.instances) ? rList.body : {instances:[]}
       const statJ = rStats && rStats.ok ? await rStats.json().catch(()=>({vms:{}})) : (rStats && typeof rStats.json === 'function' ? await rStats.json().catch(()=>({vms:{}})) : {vms:{}})
       const optJ = rOpt && typeof rOpt.json === 'function' ? await rOpt.json().catch(()=>({ok:false})) : {ok:false}
       const settingsJ = rSettings && typeof rSettings.json === 'function' ? await rSettings.json().catch(()=>({})) : {}
@@ -304,6 +307,7 @@ export default function VMManager(){
     let stopped = false
     let timer = null
     let loading = false
+    let eventsConnected = false
 
     const clearTimer = () => {
       if(timer !== null){
@@ -317,7 +321,7 @@ export default function VMManager(){
       timer = setTimeout(async () => {
         timer = null
         if(stopped || document.visibilityState !== 'visible') return
-        if(loading) return schedule(pollDelayMs({ visible:true, intervalMs: parseInt(localStorage.getItem('nbv2_update_interval') || '3000', 10) }))
+        if(loading) return schedule(pollDelayMs({ visible:true, intervalMs: parseInt(localStorage.getItem('nbv2_update_interval') || '3000', 10), eventsConnected }))
         loading = true
         try{
           await load({ silent: didLoadOnceRef.current })
@@ -325,7 +329,7 @@ export default function VMManager(){
           loading = false
           if(!stopped && document.visibilityState === 'visible'){
             const intervalMs = parseInt(localStorage.getItem('nbv2_update_interval') || '3000', 10)
-            schedule(pollDelayMs({ visible:true, intervalMs }))
+            schedule(pollDelayMs({ visible:true, intervalMs, eventsConnected }))
           }
         }
       }, delay)
@@ -336,11 +340,19 @@ export default function VMManager(){
       if(document.visibilityState === 'visible') schedule(0)
     }
 
+    // VM, job and optimizer changes reload right away; the timer then only
+    // needs to refresh live stats, so it slows down while the stream is up.
+    const unsubscribeEvents = subscribeDashboardEvents(() => {
+      clearTimer()
+      schedule(250)
+    }, { onStatus: connected => { eventsConnected = connected } })
+
     document.addEventListener('visibilitychange', onVisibilityChange)
     schedule(0)
     return () => {
       stopped = true
       clearTimer()
+      unsubscribeEvents()
       document.removeEventListener('visibilitychange', onVisibilityChange)
     }
   }, [])
@@ -0,0 +1,44 @@
+import test from 'node:test'
+import assert from 'node:assert/strict'
+import { subscribeDashboardEvents } from '../src/lib/events.js'
+import { pollDelayMs } from '../src/lib/polling.js'
+
+class FakeEventSource {
+  constructor(url) {
+    this.url = url
+    this.listeners = {}
+    this.closed = false
+    FakeEventSource.last = this
+  }
+  addEventListener(type, fn) { this.listeners[type] = fn }
+  close() { this.closed = true }
+}
+
+test('subscribeDashboardEvents parses state events and reports connection status', () => {
+  const seen = []
+  const statuses = []
+  const stop = subscribeDashboardEvents((type, data) => seen.push([type, data]), {
+    vm: 'alpha', onStatus: up => statuses.push(up), EventSourceImpl: FakeEventSource
+  })
+  const source = FakeEventSource.last
+  assert.equal(source.url, '/Dashboard/api/events?vm=alpha')
+  source.onopen()
+  source.listeners.vm({ data: '{"name":"alpha","running":true}' })
+  source.listeners.resync({ data: 'not json' })
+  stop()
+  assert.deepEqual(seen, [['vm', { name: 'alpha', running: true }], ['resync', {}]])
+  assert.deepEqual(statuses, [true, false])
+  assert.equal(source.closed, true)
+})
+
+test('subscribeDashboardEvents is a no-op without EventSource', () => {
+  const statuses = []
+  const stop = subscribeDashboardEvents(() => {}, { onStatus: up => statuses.push(up), EventSourceImpl: undefined })
+  stop()
+  assert.deepEqual(statuses, [false])
+})
+
+test('pollDelayMs relaxes visible polling while the event stream is connected', () => {
+  assert.equal(pollDelayMs({ visible: true, intervalMs: 3000, eventsConnected: true }), 10000)
+  assert.equal(pollDelayMs({ visible: true, intervalMs: 30000, eventsConnected: true }), 30000)
+})
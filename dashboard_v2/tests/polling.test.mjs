@@ -1,6 +1,6 @@
 import test from 'node:test'
 import assert from 'node:assert/strict'
-import { instanceNamesKey, pollDelayMs } from '../src/lib/polling.js'
+import { applyInventoryDelta, createInventoryPoller, instanceNamesKey, pollDelayMs } from '../src/lib/polling.js'
 
 test('instanceNamesKey is stable for the same instance-name set', () => {
   assert.equal(
@@ -24,3 +24,39 @@ test('pollDelayMs uses a conservative delay while hidden', () => {
   assert.equal(pollDelayMs({ visible: false, intervalMs: 3000, hiddenDelayMs: 60000 }), 60000)
   assert.equal(pollDelayMs({ visible: false, intervalMs: 3000 }), 60000)
 })
+
+test('applyInventoryDelta replaces changed, drops removed and appends new instances', () => {
+  const previous = [{ name: 'alpha', status: 'stopped' }, { name: 'beta' }, { name: 'beta', host_id: 'pc' }]
+  const merged = applyInventoryDelta(previous, {
+    delta: true,
+    changed: [{ name: 'alpha', status: 'running' }, { name: 'gamma' }],
+    removed: [{ name: 'beta', host_id: 'local' }]
+  })
+  assert.deepEqual(merged, [{ name: 'alpha', status: 'running' }, { name: 'beta', host_id: 'pc' }, { name: 'gamma' }])
+  assert.deepEqual(applyInventoryDelta(previous, { instances: [{ name: 'x' }] }), [{ name: 'x' }])
+})
+
+test('createInventoryPoller revalidates with ETag and since, reusing the body on 304', async () => {
+  const calls = []
+  const responses = [
+    { status: 200, etag: '"a"', body: { instances: [{ name: 'alpha' }], revision: 5 } },
+    { status: 304, etag: '"a"' },
+    { status: 200, etag: '"b"', body: { delta: true, since: 5, revision: 6, changed: [{ name: 'beta' }], removed: [] } }
+  ]
+  const fetcher = async (url, opts) => {
+    calls.push([url, opts.headers['If-None-Match'] || ''])
+    const next = responses.shift()
+    return { status: next.status, ok: next.status === 200, headers: { get: () => next.etag }, json: async () => next.body }
+  }
+  const poller = createInventoryPoller(fetcher)
+  assert.deepEqual((await poller.fetch('/list?fleet=1')).body.instances, [{ name: 'alpha' }])
+  assert.equal((await poller.fetch('/list?fleet=1')).status, 304)
+  const third = await poller.fetch('/list?fleet=1')
+  assert.deepEqual(third.body.instances, [{ name: 'alpha' }, { name: 'beta' }])
+  assert.equal(third.body.delta, undefined)
+  assert.deepEqual(calls, [
+    ['/list?fleet=1', ''],
+    ['/list?fleet=1&since=5', '"a"'],
+    ['/list?fleet=1&since=5', '"a"']
+  ])
+})
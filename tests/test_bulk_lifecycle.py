@@ -0,0 +1,118 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from job_scheduler import JobScheduler
+
+
+def _wait_for(predicate, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class _FakeHost:
+    host_id = "local"
+    host_name = "EpicVM Server"
+
+    def __init__(self, delay=0.0, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def run_manager(self, *args, **kwargs):
+        with self._lock:
+            self.calls.append(args)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        code = 1 if args[-1] in self.failing else 0
+        return subprocess.CompletedProcess(args, code, f"{' '.join(args)}\n", "")
+
+
+def _load_app(monkeypatch, tmp_path, name):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location(name, os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "JOB_SCHEDULER", JobScheduler(workers=2, host_limit=2))
+    return module
+
+
+def test_bulk_reset_runs_vms_in_parallel_and_reports_each_one(monkeypatch, tmp_path):
+    module = _load_app(monkeypatch, tmp_path, "bulk_lifecycle_test_app")
+    host = _FakeHost(delay=0.1)
+    monkeypatch.setattr(module, "_vm_host", lambda *args, **kwargs: host)
+    client = module.app.test_client()
+    names = [f"vm{i}" for i in range(6)]
+
+    assert client.post("/dashboard/api/vms/bulk", json={"action": "reset", "names": names}).status_code == 400
+    started = time.time()
+    resp = client.post("/dashboard/api/vms/bulk", json={"action": "reset", "names": names, "parallelism": 3, "confirm": "DELETE"})
+    assert resp.status_code == 202
+    body = resp.get_json()
+    # The scheduler's host limit (2) caps the requested parallelism (3).
+    assert body["parallelism"] == 2 and body["requestedParallelism"] == 3 and sorted(body["jobs"]) == names
+
+    url = f"/dashboard/api/jobs/{body['jobId']}"
+    assert _wait_for(lambda: client.get(url).get_json()["job"]["status"] == "succeeded")
+    # Three rounds of delete/create/start, not six.
+    assert time.time() - started < 6 * 3 * 0.1
+    assert host.peak == 2
+    job = client.get(url).get_json()["job"]
+    assert job["summary"] == {"total": 6, "succeeded": 6}
+    assert {child["targets"][0] for child in job["children"]} == set(names)
+    assert [call for call in host.calls if call[-1] == "vm0"] == [("delete", "vm0"), ("create", "vm0"), ("start", "vm0")]
+
+    listed = client.get("/dashboard/api/jobs").get_json()["jobs"]
+    assert [item["id"] for item in listed] == [body["jobId"]]
+
+
+def test_failure_budget_cancels_vms_not_yet_started(monkeypatch, tmp_path):
+    module = _load_app(monkeypatch, tmp_path, "bulk_lifecycle_budget_test_app")
+    host = _FakeHost(failing={"vm0"})
+    monkeypatch.setattr(module, "_vm_host", lambda *args, **kwargs: host)
+    client = module.app.test_client()
+
+    resp = client.post("/dashboard/api/vms/bulk", json={"action": "restart", "names": ["vm0", "vm1", "vm2"], "parallelism": 1, "maxFailures": 0})
+    url = f"/dashboard/api/jobs/{resp.get_json()['jobId']}"
+    assert _wait_for(lambda: client.get(url).get_json()["job"]["status"] == "failed")
+    job = client.get(url).get_json()["job"]
+    assert job["summary"] == {"total": 3, "failed": 1, "cancelled": 2}
+    assert host.calls == [("restart", "vm0")]
+    assert job["error"] == "restart: 1 failed, 2 cancelled"
+    cancelled = next(child["id"] for child in job["children"] if child["status"] == "cancelled")
+    assert client.get(f"/dashboard/api/jobs/{cancelled}/log").get_json()["done"] is True
+
+
+def test_sub_jobs_overlap_exactly_the_effective_parallelism(monkeypatch, tmp_path):
+    module = _load_app(monkeypatch, tmp_path, "bulk_lifecycle_overlap_test_app")
+    monkeypatch.setattr(module, "JOB_SCHEDULER", JobScheduler(workers=8, host_limit=8))
+    host = _FakeHost(delay=0.1)
+    monkeypatch.setattr(module, "_vm_host", lambda *args, **kwargs: host)
+    client = module.app.test_client()
+    names = [f"vm{i}" for i in range(8)]
+
+    resp = client.post("/dashboard/api/vms/bulk", json={"action": "start", "names": names, "parallelism": 4})
+    assert resp.get_json()["parallelism"] == 4
+    url = f"/dashboard/api/jobs/{resp.get_json()['jobId']}"
+    started = time.time()
+    assert _wait_for(lambda: client.get(url).get_json()["job"]["status"] == "succeeded")
+    assert host.peak == 4
+    assert time.time() - started < 8 * 0.1
@@ -0,0 +1,144 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from cgroup_stats import CgroupStatsReader
+from runtime_stats import DockerStatsCache
+
+
+class FakeClock:
+    def __init__(self, value=100.0):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+    def advance(self, seconds):
+        self.value += seconds
+
+
+def _container(tmp_path, container_id, name, *, driver="systemd", usage_usec=0,
+               current=0, inactive=0, limit="max", swap=0):
+    config = tmp_path / "containers" / container_id
+    config.mkdir(parents=True)
+    (config / "config.v2.json").write_text(json.dumps({"Name": f"/{name}", "State": {"Running": True}}))
+    if driver == "systemd":
+        cgroup = tmp_path / "cgroup" / "system.slice" / f"docker-{container_id}.scope"
+    else:
+        cgroup = tmp_path / "cgroup" / "docker" / container_id
+    cgroup.mkdir(parents=True)
+    (cgroup / "cpu.stat").write_text(f"usage_usec {usage_usec}\nuser_usec 0\nsystem_usec 0\n")
+    (cgroup / "memory.current").write_text(f"{current}\n")
+    (cgroup / "memory.stat").write_text(f"anon {current}\ninactive_file {inactive}\n")
+    (cgroup / "memory.max").write_text(f"{limit}\n")
+    (cgroup / "memory.swap.current").write_text(f"{swap}\n")
+    (cgroup / "io.stat").write_text("8:0 rbytes=100 wbytes=20 rios=1 wios=1\n8:16 rbytes=5 wbytes=0\n")
+    (cgroup / "pids.current").write_text("12\n")
+    return cgroup
+
+
+@pytest.fixture
+def cgroup_tree(tmp_path):
+    (tmp_path / "cgroup").mkdir()
+    (tmp_path / "cgroup" / "cgroup.controllers").write_text("cpu memory pids\n")
+    (tmp_path / "containers").mkdir()
+    (tmp_path / "meminfo").write_text("MemTotal:        4194304 kB\n")
+    (tmp_path / "proc").mkdir()
+    return tmp_path
+
+
+def _reader(tree, clock):
+    return CgroupStatsReader(
+        cgroup_root=str(tree / "cgroup"),
+        containers_root=str(tree / "containers"),
+        meminfo_path=str(tree / "meminfo"),
+        proc_root=str(tree / "proc"),
+        clock=clock,
+        prime_interval=0,
+    )
+
+
+def test_reads_exact_bytes_and_cpu_from_usage_deltas(cgroup_tree):
+    clock = FakeClock()
+    vm = _container(cgroup_tree, "aaa", "blobevm_a", usage_usec=1_000_000,
+                    current=300 * 1024 * 1024, inactive=44 * 1024 * 1024,
+                    limit=str(1024 * 1024 * 1024), swap=4096)
+    _container(cgroup_tree, "bbb", "traefik", usage_usec=5)
+    (vm / "cgroup.procs").write_text("4242\n4243\n")
+    net = cgroup_tree / "proc" / "4242" / "net"
+    net.mkdir(parents=True)
+    (net / "dev").write_text(
+        "Inter-|   Receive                            |  Transmit\n"
+        " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets\n"
+        "    lo:     900       9    0    0    0     0          0         0      900       9    0    0    0     0       0          0\n"
+        "  eth0:    7000      70    0    0    0     0          0         0     3000      30    0    0    0     0       0          0\n"
+    )
+    reader = _reader(cgroup_tree, clock)
+
+    first = reader.read()
+    assert first == [{
+        "name": "blobevm_a", "cpu_percent": 0.0, "mem_percent": 25.0,
+        "mem_bytes": 256 * 1024 * 1024, "mem_limit": 1024 * 1024 * 1024,
+        "swap_bytes": 4096, "net_rx": 7000, "net_tx": 3000,
+        "block_read": 105, "block_write": 20, "pids": 12,
+    }]
+
+    (vm / "cpu.stat").write_text("usage_usec 4000000\n")
+    clock.advance(2)
+    assert reader.read()[0]["cpu_percent"] == 150.0
+
+
+def test_unlimited_memory_uses_host_total_and_cgroupfs_layout(cgroup_tree):
+    _container(cgroup_tree, "ccc", "blobevm_c", driver="cgroupfs",
+               current=1024 * 1024 * 1024)
+    record = _reader(cgroup_tree, FakeClock()).read()[0]
+    assert record["mem_limit"] == 4 * 1024 * 1024 * 1024
+    assert record["mem_percent"] == 25.0
+
+
+def test_stopped_containers_without_cgroup_are_skipped(cgroup_tree):
+    config = cgroup_tree / "containers" / "ddd"
+    config.mkdir()
+    (config / "config.v2.json").write_text(json.dumps({"Name": "/blobevm_d"}))
+    assert _reader(cgroup_tree, FakeClock()).read() == []
+
+
+def test_running_containers_outside_known_layouts_fall_back(cgroup_tree):
+    config = cgroup_tree / "containers" / "eee"
+    config.mkdir()
+    (config / "config.v2.json").write_text(json.dumps({"Name": "/blobevm_e", "State": {"Running": True}}))
+    reader = _reader(cgroup_tree, FakeClock())
+    with pytest.raises(OSError):
+        reader.read()
+
+    calls = []
+    cache = DockerStatsCache(runner=lambda argv: calls.append(argv) or "blobevm_e|1.5%|2.0%|1MiB / 1GiB",
+                             clock=FakeClock(), ttl=2, cgroup=reader)
+    cache.engine = None
+    assert cache.get()[0]["name"] == "blobevm_e" and len(calls) == 1
+
+
+def test_reader_is_unavailable_without_unified_hierarchy(tmp_path):
+    reader = CgroupStatsReader(cgroup_root=str(tmp_path), containers_root=str(tmp_path))
+    assert not reader.available()
+    with pytest.raises(OSError):
+        reader.read()
+
+
+def test_stats_cache_uses_cgroup_reader_as_drop_in_source(cgroup_tree):
+    _container(cgroup_tree, "aaa", "blobevm_a", current=128 * 1024 * 1024,
+               limit=str(1024 * 1024 * 1024))
+    calls = []
+    cache = DockerStatsCache(
+        runner=lambda argv: calls.append(argv) or "",
+        clock=FakeClock(), ttl=2, cgroup=_reader(cgroup_tree, FakeClock()),
+    )
+    record = cache.get()[0]
+    assert record["mem_bytes"] == 128 * 1024 * 1024
+    assert record["mem_limit"] == 1024 * 1024 * 1024
+    assert record["net_rx"] == 0 and record["pids"] == 12
+    assert calls == []
@@ -0,0 +1,65 @@
+import importlib.util
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from config_snapshot import ConfigSnapshotCache, parse_env_text, parse_json_text
+
+
+def test_parse_env_text_strips_quotes_and_comments():
+    assert parse_env_text("# c\nNO_TRAEFIK='1'\nBASE_PATH=\"/vm\"\n\nBAD\n") == {"NO_TRAEFIK": "1", "BASE_PATH": "/vm"}
+
+
+def test_unchanged_file_is_parsed_once_and_edits_are_seen(tmp_path, monkeypatch):
+    cache = ConfigSnapshotCache()
+    path = tmp_path / "instance.json"
+    path.write_text(json.dumps({"access_mode": "public"}))
+    parses = []
+
+    def parser(text):
+        parses.append(text)
+        return parse_json_text(text)
+
+    first = cache.load(str(path), parser, {})
+    first["access_mode"] = "mutated"
+    assert cache.load(str(path), parser, {}) == {"access_mode": "public"}
+    assert len(parses) == 1
+
+    path.write_text(json.dumps({"access_mode": "restricted", "x": 1}))
+    assert cache.load(str(path), parser, {})["access_mode"] == "restricted"
+    assert len(parses) == 2
+
+    path.write_text("{broken")
+    assert cache.load(str(path), parser, {"fallback": True}) == {"fallback": True}
+    path.unlink()
+    assert cache.load(str(path), parser, {}) == {}
+
+
+def test_dashboard_helpers_read_through_the_snapshot(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("config_snapshot_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "CONFIG_FILES", ConfigSnapshotCache())
+    (tmp_path / ".env").write_text("NO_TRAEFIK='0'\nBASE_PATH='/desk'\n")
+    (tmp_path / "instances" / "alpha").mkdir(parents=True)
+    (tmp_path / "instances" / "alpha" / ".meta.json").write_text(json.dumps({"path_override": "/custom/alpha"}))
+
+    real_open = open
+    opened = []
+    monkeypatch.setattr("builtins.open", lambda path, *a, **k: opened.append(str(path)) or real_open(path, *a, **k))
+    for _ in range(5):
+        assert module._vm_path_prefix("alpha") == "/custom/alpha"
+        assert module._vm_path_prefix("beta") == "/desk/beta"
+        assert module._is_direct_mode() is False
+    assert sorted(set(opened)) == sorted(opened)
+
+    assert module._write_env_kv({"NO_TRAEFIK": "1"})
+    assert module._is_direct_mode() is True
+    module._set_instance_meta("beta", "access_mode", "restricted")
+    assert module._vm_access_mode("beta") == "restricted"
@@ -0,0 +1,164 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+import container_index
+import optimizer
+from container_index import ContainerIndex
+from runtime_stats import DockerEngineUnavailable
+
+
+def _inspect(container_id, name, *, running=True, health=None, port="20001",
+             restarts=0, oom=False):
+    state = {"Status": "running" if running else "exited", "Running": running,
+             "Restarting": False, "OOMKilled": oom, "ExitCode": 0 if running else 137}
+    if health:
+        state["Health"] = {"Status": health}
+    return {
+        "Id": container_id,
+        "Name": f"/{name}",
+        "RestartCount": restarts,
+        "State": state,
+        "NetworkSettings": {"Ports": {"3000/tcp": [{"HostIp": "0.0.0.0", "HostPort": port}] if port else None}},
+    }
+
+
+class FakeEngine:
+    def __init__(self, containers):
+        self.containers = {item["Id"]: item for item in containers}
+        self.calls = []
+
+    def get_json(self, path):
+        self.calls.append(path)
+        if path.startswith("/containers/json"):
+            return [{"Id": container_id} for container_id in self.containers]
+        container_id = path.split("/")[2]
+        if container_id not in self.containers:
+            raise DockerEngineUnavailable("no such container", status=404)
+        return self.containers[container_id]
+
+    def stream_json(self, path):
+        return iter(())
+
+
+def _event(action, container_id, name, **attributes):
+    return {"Type": "container", "Action": action,
+            "Actor": {"ID": container_id, "Attributes": {"name": name, **attributes}}}
+
+
+def test_sync_indexes_vm_containers_with_state_ports_and_health():
+    engine = FakeEngine([
+        _inspect("id-a", "blobevm_a", health="healthy", restarts=2),
+        _inspect("id-b", "blobevm_b", running=False, port=None),
+        _inspect("id-t", "traefik"),
+    ])
+    index = ContainerIndex(client=engine)
+    index.sync()
+
+    assert index.names() == ["blobevm_a", "blobevm_b"]
+    assert index.names(running=True) == ["blobevm_a"]
+    entry = index.get("blobevm_a")
+    assert entry["id"] == "id-a" and entry["health"] == "healthy"
+    assert entry["restart_count"] == 2 and entry["ports"] == {"3000/tcp": "20001"}
+    assert "inspect" not in entry
+    assert index.host_port("blobevm_a") == "20001"
+    assert index.host_port("blobevm_b") == ""
+    assert index.inspect("blobevm_b")["State"]["ExitCode"] == 137
+
+
+def test_events_update_rename_oom_and_destroy():
+    engine = FakeEngine([_inspect("id-a", "blobevm_a")])
+    index = ContainerIndex(client=engine)
+    index.sync()
+    seen = []
+    index.add_listener(lambda action, name, entry: seen.append((action, name, bool(entry))))
+
+    engine.containers["id-a"] = _inspect("id-a", "blobevm_a", running=False)
+    index.apply_event(_event("oom", "id-a", "blobevm_a"))
+    index.apply_event(_event("die", "id-a", "blobevm_a"))
+    assert index.get("blobevm_a")["oom_killed"] is True
+    assert index.get("blobevm_a")["running"] is False
+
+    engine.containers["id-a"] = _inspect("id-a", "blobevm_a")
+    index.apply_event(_event("start", "id-a", "blobevm_a"))
+    assert index.get("blobevm_a")["oom_killed"] is False
+
+    engine.containers["id-a"] = _inspect("id-a", "blobevm_renamed")
+    index.apply_event(_event("rename", "id-a", "blobevm_renamed", oldName="/blobevm_a"))
+    assert index.names() == ["blobevm_renamed"]
+
+    del engine.containers["id-a"]
+    index.apply_event(_event("destroy", "id-a", "blobevm_renamed"))
+    assert index.names() == []
+    assert seen[-1] == ("destroy", "blobevm_renamed", False)
+    assert ("oom", "blobevm_a", True) in seen
+
+
+def test_unrelated_events_are_ignored():
+    engine = FakeEngine([])
+    index = ContainerIndex(client=engine)
+    seen = []
+    index.add_listener(lambda action, name, entry: seen.append(action))
+    index.apply_event(_event("start", "id-t", "traefik"))
+    index.apply_event({"Type": "network", "Action": "connect"})
+    for action in ("exec_create: sh -c true", "exec_start: sh -c true", "exec_die", "attach", "resize", "top"):
+        index.apply_event(_event(action, "id-a", "blobevm_a"))
+    assert engine.calls == [] and seen == []
+
+    engine.containers["id-a"] = _inspect("id-a", "blobevm_a", health="unhealthy")
+    index.apply_event(_event("health_status: unhealthy", "id-a", "blobevm_a"))
+    assert seen == ["health_status"] and index.get("blobevm_a")["health"] == "unhealthy"
+
+
+def test_optimizer_reads_the_live_index_instead_of_docker(monkeypatch):
+    engine = FakeEngine([_inspect("id-a", "blobevm_a"), _inspect("id-b", "blobevm_b", running=False)])
+    index = ContainerIndex(client=engine)
+    index.sync()
+    monkeypatch.setattr(index, "_live", True)
+    monkeypatch.setattr(optimizer, "CONTAINER_INDEX", index)
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("subprocess should not run while the index is live")
+
+    monkeypatch.setattr(optimizer.subprocess, "check_output", no_subprocess)
+    assert optimizer._docker_ps_names() == ["blobevm_a"]
+    assert optimizer._container_identity("b") == "id-b"
+    assert optimizer._container_identity("missing") is None
+
+
+def test_start_is_opt_out(monkeypatch):
+    monkeypatch.setenv("BLOBEVM_CONTAINER_EVENTS", "0")
+    assert container_index.start_container_index() is False
+
+
+def test_dashboard_inspect_and_port_use_the_live_index(monkeypatch):
+    import app as dashboard_app
+
+    engine = FakeEngine([_inspect("id-a", "blobevm_a", port="20007")])
+    index = ContainerIndex(client=engine)
+    index.sync()
+    monkeypatch.setattr(index, "_live", True)
+    monkeypatch.setattr(dashboard_app, "CONTAINER_INDEX", index)
+    monkeypatch.setattr(dashboard_app, "_docker", lambda *args: pytest.fail("docker CLI called"))
+
+    info, err = dashboard_app._docker_inspect_vm("a")
+    assert err is None and info["Id"] == "id-a"
+    assert dashboard_app._docker_inspect_vm("missing") == (None, "not-found")
+    assert dashboard_app._vm_host_port("blobevm_a") == "20007"
+
+
+def test_destroyed_vm_history_is_dropped(monkeypatch, tmp_path):
+    import app as dashboard_app
+    from metrics_store import MetricsStore
+
+    store = MetricsStore(clock=lambda: 1_700_000_000.0, proc_stat_path=str(tmp_path / "stat"),
+                         meminfo_path=str(tmp_path / "meminfo"))
+    store.ingest([{"name": "blobevm_a", "cpu_percent": 1.0}, {"name": "blobevm_b", "cpu_percent": 2.0}])
+    monkeypatch.setattr(dashboard_app, "METRICS_STORE", store)
+
+    dashboard_app.CONTAINER_INDEX._notify("die", "blobevm_b", None)
+    dashboard_app.CONTAINER_INDEX._notify("destroy", "blobevm_a", None)
+    assert store.keys() == ["b", "host"]
@@ -0,0 +1,63 @@
+import importlib.util
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from db_pool import SQLitePool
+
+
+def test_pool_reuses_wal_connections_and_migrates_once(tmp_path):
+    migrations = []
+    pool = SQLitePool(migrate=lambda conn: migrations.append(1) or conn.execute("CREATE TABLE t (x)"), max_idle=1)
+    path = str(tmp_path / "db.sqlite3")
+
+    first = pool.connect(path)
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    first.execute("INSERT INTO t VALUES (1)")
+    first.close()
+    second = pool.connect(path)
+    assert second is first and not second.in_transaction
+    assert second.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    other = pool.connect(path)
+    assert other is not first
+    second.close()
+    other.close()
+    assert migrations == [1]
+
+    os.remove(path)
+    pool.connect(path).close()
+    assert migrations == [1, 1]
+
+
+def test_users_db_has_hot_indexes_and_handles_concurrent_job_updates(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("db_pool_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "USERS_DB", SQLitePool(migrate=module._migrate_users_db))
+
+    job_ids = [module._create_job("restart", ["alpha"]) for _ in range(8)]
+
+    def progress(job_id):
+        for step in range(10):
+            module._update_job(job_id, status="running", progress=f"step {step}")
+
+    threads = [threading.Thread(target=progress, args=(job_id,)) for job_id in job_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    conn = module._users_conn()
+    try:
+        rows = conn.execute("SELECT progress FROM jobs").fetchall()
+        indexes = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    finally:
+        conn.close()
+    assert [row["progress"] for row in rows] == ["step 9"] * 8
+    assert {"jobs_created_at", "user_vm_access_vm_name", "access_requests_status"} <= indexes
@@ -0,0 +1,79 @@
+import importlib.util
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def direct_app(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    if dashboard_dir not in sys.path:
+        sys.path.insert(0, dashboard_dir)
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("direct_mode_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    (tmp_path / ".env").write_text("NO_TRAEFIK=1\n")
+    for name in ("alpha", "beta", "gamma"):
+        (tmp_path / "instances" / name).mkdir(parents=True)
+    (tmp_path / "instances" / "gamma" / "instance.json").write_text(json.dumps({"host_port": "20009"}))
+
+    calls = []
+
+    def fake_docker(*args):
+        calls.append(args)
+        assert args[0] == "ps", "per-VM docker port/inspect must not run"
+        return SimpleNamespace(returncode=0, stderr="", stdout=(
+            "blobevm_alpha\tUp 2 hours\t0.0.0.0:20001->3000/tcp, :::20001->3000/tcp\n"
+            "blobevm_beta\tUp 5 minutes\t0.0.0.0:20002->3000/tcp\n"
+            "blobevm_gamma\tExited (0) 1 hour ago\t\n"
+        ))
+
+    monkeypatch.setattr(module, "_docker", fake_docker)
+    monkeypatch.setattr(module.LOCAL_VM_HOST, "check_output",
+                        lambda *args, **kwargs: pytest.fail(f"manager spawned: {args}"))
+    return module, calls
+
+
+def test_direct_mode_inventory_resolves_every_port_with_one_docker_call(direct_app, monkeypatch):
+    module, calls = direct_app
+    monkeypatch.setattr(module.LOCAL_VM_HOST, "list_vms", lambda: [
+        {"name": "alpha", "status": "running", "url": ""},
+        {"name": "beta", "status": "running", "url": ""},
+        {"name": "gamma", "status": "stopped", "url": ""},
+    ])
+
+    with module.app.test_request_context("/dashboard/api/list", headers={"Host": "vm.example:5000"}):
+        items = module.manager_json_list()
+        assert module._build_vm_url("beta") == "http://vm.example:20002/"
+
+    assert [(item["name"], item.get("port"), item["url"]) for item in items] == [
+        ("alpha", "20001", "http://vm.example:20001/"),
+        ("beta", "20002", "http://vm.example:20002/"),
+        ("gamma", "20009", "http://vm.example:20009/"),
+    ]
+    assert len(calls) == 1
+
+
+def test_direct_mode_fallback_shares_the_same_snapshot_for_status_and_ports(direct_app, monkeypatch):
+    module, calls = direct_app
+
+    def broken_list():
+        raise RuntimeError("manager missing")
+
+    monkeypatch.setattr(module.LOCAL_VM_HOST, "list_vms", broken_list)
+
+    with module.app.test_request_context("/dashboard/api/list", headers={"Host": "vm.example"}):
+        items = module.manager_json_list()
+
+    assert [(item["name"], item["status"], item.get("port")) for item in items] == [
+        ("alpha", "Up 2 hours", "20001"),
+        ("beta", "Up 5 minutes", "20002"),
+        ("gamma", "Exited (0) 1 hour ago", "20009"),
+    ]
+    assert len(calls) == 1
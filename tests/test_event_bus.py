@@ -0,0 +1,95 @@
+import importlib.util
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from event_bus import EventBus, format_sse
+
+
+def _frames(bus, subscription, count):
+    stream = bus.stream(subscription, heartbeat=0.01)
+    return [next(stream) for _ in range(count)]
+
+
+def test_publish_fans_out_once_per_subscriber_with_vm_filter():
+    bus = EventBus()
+    everything = bus.subscribe()
+    alpha = bus.subscribe(vm="alpha")
+    bus.publish("vm", {"name": "beta", "running": True})
+    bus.publish("vm", {"name": "alpha", "running": False})
+    bus.publish("job", {"id": "j1", "targets": ["alpha"]})
+    bus.publish("pressure", {"level": "pressured"})
+
+    assert everything.queue.qsize() == 4
+    assert [item[1] for item in list(alpha.queue.queue)] == ["vm", "job", "pressure"]
+    assert _frames(bus, alpha, 1)[0] == format_sse(2, "vm", {"name": "alpha", "running": False})
+
+
+def test_last_event_id_replays_history_or_asks_for_resync():
+    bus = EventBus(history=2)
+    for index in range(4):
+        bus.publish("job", {"id": str(index)})
+
+    resumed = bus.subscribe(last_event_id="3")
+    assert [item[0] for item in list(resumed.queue.queue)] == [4]
+    too_old = bus.subscribe(last_event_id="1")
+    assert _frames(bus, too_old, 1)[0].startswith("event: resync")
+
+
+def test_slow_subscriber_overflows_into_a_single_resync_then_keepalives():
+    bus = EventBus(queue_size=1)
+    slow = bus.subscribe()
+    bus.publish("vm", {"name": "a"})
+    bus.publish("vm", {"name": "b"})
+
+    frames = _frames(bus, slow, 2)
+    assert frames[0].startswith("event: resync")
+    assert frames[1] == ": keep-alive\n\n"
+
+
+def test_first_subscriber_starts_the_watcher_once():
+    bus = EventBus()
+    started = []
+    bus.on_first_subscriber(lambda: started.append(1))
+    first = bus.subscribe()
+    bus.subscribe()
+    bus.unsubscribe(first)
+    assert started == [1]
+
+
+def test_events_endpoint_streams_vm_job_and_pressure_changes(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("event_bus_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    bus = EventBus()
+    monkeypatch.setattr(module, "EVENT_BUS", bus)
+    monkeypatch.setattr(module, "EVENTS_HEARTBEAT_SECONDS", 0.01)
+
+    response = module.app.test_client().get("/Dashboard/api/events", buffered=False)
+    assert response.mimetype == "text/event-stream"
+    assert bus.subscriber_count() == 1
+
+    module._publish_vm_event("die", "blobevm_alpha", {"running": False, "state": "exited"})
+    module._publish_vm_event("die", "traefik", {})
+    module._publish_vm_event("exec_die", "blobevm_alpha", {"running": True, "state": "running"})
+    module._publish_optimizer_event("run", {"ts": 1, "events": [], "hostPressure": {"level": "critical", "score": 90}})
+    module._publish_optimizer_event("run", {"ts": 2, "events": [], "hostPressure": {"level": "critical", "score": 91}})
+
+    chunks = iter(response.response)
+    assert next(chunks) == b"retry: 3000\n\n"
+    vm_frame, pressure_frame = next(chunks).decode(), next(chunks).decode()
+    assert vm_frame.startswith("id: 1\nevent: vm\n")
+    assert json.loads(vm_frame.split("data: ", 1)[1]) == {
+        "name": "alpha", "action": "die", "exists": True, "running": False, "state": "exited", "health": "",
+    }
+    assert "event: pressure" in pressure_frame and '"level":"critical"' in pressure_frame
+    assert next(chunks) == b": keep-alive\n\n"
+
+    response.close()
+    assert bus.subscriber_count() == 0
@@ -0,0 +1,60 @@
+import importlib.util
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from auth_cache import AuthDecisionCache
+
+
+def test_decisions_expire_and_stale_generations_are_not_stored():
+    now = [100.0]
+    cache = AuthDecisionCache(ttl=5, clock=lambda: now[0])
+    cache.put(("a", "", "alpha"), "allow", cache.generation())
+    assert cache.get(("a", "", "alpha")) == "allow"
+    now[0] += 5
+    assert cache.get(("a", "", "alpha")) is None
+
+    generation = cache.generation()
+    cache.invalidate()
+    cache.put(("a", "", "alpha"), "allow", generation)
+    assert cache.get(("a", "", "alpha")) is None
+
+
+def test_forward_auth_reuses_decisions_until_acl_changes(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_USER_SECRET", "portal-secret")
+    spec = importlib.util.spec_from_file_location("forward_auth_cache_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "FORWARD_AUTH_CACHE", AuthDecisionCache(ttl=60))
+    monkeypatch.setattr(module, "_validate_known_vm_names", lambda names: None)
+    monkeypatch.setattr(module, "_hash_user_password", lambda password, salt=None: "pbkdf2_sha256$salt$fast")
+    module._set_instance_meta("alpha", "access_mode", "restricted")
+    module._create_user("viewer", "long-enough-password", assigned_vms=[])
+    token = module._create_portal_token("viewer", False)
+
+    lookups = []
+    real_lookup = module._get_user_by_username
+    monkeypatch.setattr(module, "_get_user_by_username", lambda name: lookups.append(name) or real_lookup(name))
+    client = module.app.test_client()
+    client.set_cookie("Portal-Auth", token)
+
+    for _ in range(20):
+        denied = client.get("/dashboard/auth/vm/alpha", headers={"X-Forwarded-Uri": "/vm/alpha/vnc.html"})
+        assert denied.status_code == 302 and denied.headers["Location"].endswith("/dashboard/vm/alpha/")
+    assert len(lookups) == 1
+
+    module._update_user("viewer", assigned_vms=["alpha"])
+    assert client.get("/dashboard/auth/vm/alpha").status_code == 200
+
+    module._set_instance_meta("beta", "access_mode", "restricted")
+    assert client.get("/dashboard/auth/vm/beta").status_code == 302
+    module._set_instance_meta("beta", "access_mode", "public")
+    assert client.get("/dashboard/auth/vm/beta").status_code == 200
+
+    client.delete_cookie("Portal-Auth")
+    anonymous = client.get("/dashboard/auth/vm/alpha", headers={"X-Forwarded-Uri": "/vm/alpha/"})
+    assert anonymous.headers["Location"].endswith("/portal/login?next=/vm/alpha/")
@@ -1,6 +1,8 @@
 import importlib.util
 import json
 import sys
+import threading
+import time
 from pathlib import Path
 
 
@@ -22,6 +24,15 @@ def load_app(monkeypatch, tmp_path):
     return module
 
 
+def wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
 def test_escalation_uses_hermes_and_preserves_local_record(monkeypatch, tmp_path):
     module = load_app(monkeypatch, tmp_path)
     calls = []
@@ -87,7 +98,41 @@ def test_escalate_route_recovers_then_hands_off_to_hermes(monkeypatch, tmp_path)
 
     response = client.post("/dashboard/api/vm/alpha/escalate", json={"reason": "startup failed"})
 
-    assert response.status_code == 200
-    assert response.get_json()["escalation"]["queued"] is True
+    assert response.status_code == 202
+    job_url = f"/dashboard/api/jobs/{response.get_json()['jobId']}"
+    assert wait_for(lambda: client.get(job_url).get_json()["job"]["status"] == "succeeded")
+    output = json.loads(client.get(job_url).get_json()["job"]["output"])
+    assert output["escalation"]["queued"] is True
+    # Same top-level shape as a recover-vm job, for recover requests deduplicated onto it.
+    assert output["recovered"] is False and output["recovery"]["recovered"] is False
     assert calls[0][0] == "recover"
     assert calls[1][0:3] == ("hermes", "alpha", "startup failed")
+
+
+def test_recover_route_queues_one_job_per_vm(monkeypatch, tmp_path):
+    module = load_app(monkeypatch, tmp_path)
+    gate = threading.Event()
+    calls = []
+
+    def slow_recover(name, **kwargs):
+        calls.append(name)
+        gate.wait(5)
+        return {"ok": True, "recovered": True, "attempts": [{"action": "start", "ok": True}], "status": {"running": True, "logs": "x" * 50000}}
+
+    monkeypatch.setattr(module, "_recover_vm", slow_recover)
+    client = module.app.test_client()
+
+    first = client.post("/dashboard/api/vm/alpha/recover", json={"mode": "standard"})
+    second = client.post("/dashboard/api/vm/alpha/recover", json={"mode": "standard"})
+    assert first.status_code == second.status_code == 202
+    assert second.get_json() == {"ok": True, "jobId": first.get_json()["jobId"], "deduplicated": True}
+    assert client.post("/dashboard/api/vm/Bad Name/recover").status_code == 400
+
+    gate.set()
+    job_url = f"/dashboard/api/jobs/{first.get_json()['jobId']}"
+    assert wait_for(lambda: client.get(job_url).get_json()["job"]["status"] == "succeeded")
+    result = json.loads(client.get(job_url).get_json()["job"]["output"])
+    assert result["recovered"] is True and result["status"] == {"running": True}
+    assert calls == ["alpha"]
+    third = client.post("/dashboard/api/vm/alpha/recover", json={})
+    assert third.get_json()["deduplicated"] is False
@@ -0,0 +1,149 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from inventory_cache import InventoryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.value = 100.0
+
+    def __call__(self):
+        return self.value
+
+
+def test_repeated_reads_within_ttl_load_once_and_return_private_copies():
+    clock = FakeClock()
+    cache = InventoryCache(ttl=3, clock=clock)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [{"name": "alpha", "status": "running"}]
+
+    first = cache.get("local", loader)
+    first[0]["status"] = "mutated"
+    assert cache.get("local", loader) == [{"name": "alpha", "status": "running"}]
+    assert len(calls) == 1
+
+    clock.value += 3
+    cache.get("local", loader)
+    assert len(calls) == 2
+
+
+def test_invalidate_is_per_host_and_global():
+    cache = InventoryCache(ttl=60, clock=FakeClock())
+    calls = {"local": 0, "pc": 0}
+
+    def loader_for(host):
+        def loader():
+            calls[host] += 1
+            return [{"name": host}]
+        return loader
+
+    local, remote = loader_for("local"), loader_for("pc")
+    cache.get("local", local)
+    cache.get("pc", remote)
+    cache.invalidate("local")
+    cache.get("local", local)
+    cache.get("pc", remote)
+    assert calls == {"local": 2, "pc": 1}
+
+    cache.invalidate()
+    cache.get("local", local)
+    cache.get("pc", remote)
+    assert calls == {"local": 3, "pc": 2}
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    cache = InventoryCache(ttl=60, clock=FakeClock())
+    started, release = threading.Event(), threading.Event()
+    results = []
+
+    def slow_loader():
+        started.set()
+        release.wait(5)
+        return [{"name": "before-delete"}]
+
+    worker = threading.Thread(target=lambda: results.append(cache.get("local", slow_loader)))
+    worker.start()
+    started.wait(5)
+    cache.invalidate("local")
+    release.set()
+    worker.join(5)
+
+    assert results == [[{"name": "before-delete"}]]
+    assert cache.get("local", lambda: [{"name": "after-delete"}]) == [{"name": "after-delete"}]
+
+
+def test_errors_and_replaced_loaders_are_not_served_from_cache():
+    cache = InventoryCache(ttl=60, clock=FakeClock())
+
+    def broken():
+        raise RuntimeError("manager missing")
+
+    with pytest.raises(RuntimeError):
+        cache.get("local", broken)
+    assert cache.get("local", lambda: [{"name": "a"}]) == [{"name": "a"}]
+    assert cache.get("local", lambda: [{"name": "b"}]) == [{"name": "b"}]
+
+
+def test_dashboard_list_is_cached_until_a_mutation(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("inventory_cache_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "INVENTORY_CACHE", InventoryCache(ttl=60))
+    monkeypatch.setattr(module, "_is_direct_mode", lambda: False)
+    calls = []
+
+    def list_vms():
+        calls.append(1)
+        return [{"name": "alpha", "status": "running", "url": ""}]
+
+    monkeypatch.setattr(module.LOCAL_VM_HOST, "list_vms", list_vms)
+    monkeypatch.setattr(module.LOCAL_VM_HOST, "check_call", lambda *args, **kwargs: 0)
+    client = module.app.test_client()
+
+    for _ in range(3):
+        assert client.get("/dashboard/api/list").status_code == 200
+    assert len(calls) == 1
+
+    assert client.post("/dashboard/api/stop/alpha").get_json() == {"ok": True}
+    client.get("/dashboard/api/list")
+    assert len(calls) == 2
+
+
+def test_manager_fallback_invalidates_after_the_fallback_command(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("inventory_fallback_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+    marker = tmp_path / "fallback-ran"
+    script = tmp_path / "blobe-vm-manager"
+    script.write_text(f"#!/bin/sh\ntouch {marker}\n")
+    script.chmod(0o755)
+    monkeypatch.setattr(module, "_repo_manager_path", lambda: str(script))
+    monkeypatch.setattr(module, "_job_run_manager",
+                        lambda host, *args: subprocess.CompletedProcess(args, 1, "", "unknown command"))
+    invalidations = []
+    monkeypatch.setattr(module, "_invalidate_inventory", lambda host=None: invalidations.append(marker.exists()))
+
+    assert module._run_manager("stop", "alpha")[0] is True
+    assert invalidations == [True]
+    module._run_manager("list")
+    assert invalidations == [True]
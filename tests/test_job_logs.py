@@ -0,0 +1,93 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from job_logs import JobLogStore
+from job_scheduler import JobScheduler
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_reads_resume_from_offsets_on_utf8_boundaries(tmp_path):
+    logs = JobLogStore(lambda: str(tmp_path))
+    logs.open("job1")
+    logs.append("job1", "ab€\n")
+    data, offset, size = logs.read("job1", 0, limit=4)
+    assert (data, offset) == ("ab", 2)
+    data, offset, size = logs.read("job1", offset)
+    assert data == "€\n" and offset == size
+
+    assert logs.wait("job1", offset, timeout=0.01) is False
+    threading.Timer(0.05, logs.append, ("job1", "more\n")).start()
+    assert logs.wait("job1", offset, timeout=5) is True
+    logs.close("job1")
+    assert logs.read("job1", offset)[0] == "more\n"
+
+    try:
+        logs.path("../escape")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("path traversal accepted")
+
+
+class _StreamingHost:
+    host_id = "local"
+
+    def __init__(self, gate):
+        self.gate = gate
+
+    def stream_manager(self, *args, on_output):
+        on_output("building alpha\n")
+        self.gate.wait(5)
+        on_output("done\n")
+        return subprocess.CompletedProcess(args, 0, "building alpha\ndone\n", "")
+
+
+def test_job_output_is_readable_while_running_and_followable(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("job_logs_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "JOB_SCHEDULER", JobScheduler(workers=1, host_limit=1))
+    monkeypatch.setattr(module, "EVENTS_HEARTBEAT_SECONDS", 0.05)
+    gate = threading.Event()
+    host = _StreamingHost(gate)
+
+    def work():
+        result = module._job_run_manager(host, "rebuild-vms", "alpha")
+        return result.returncode == 0, result.stdout
+
+    job_id = module._start_job("rebuild-vms", ["alpha"], work, host=host)
+    client = module.app.test_client()
+    url = f"/dashboard/api/jobs/{job_id}/log"
+    assert _wait_for(lambda: client.get(url).get_json()["data"] == "building alpha\n")
+    first = client.get(url).get_json()
+    assert first["done"] is False and first["nextOffset"] == len("building alpha\n")
+
+    gate.set()
+    assert _wait_for(lambda: client.get(f"/dashboard/api/jobs/{job_id}").get_json()["job"]["status"] == "succeeded")
+    rest = client.get(url, query_string={"offset": first["nextOffset"]}).get_json()
+    assert rest["data"] == "done\n" and rest["done"] is True
+
+    body = client.get(url, query_string={"follow": "1"}).get_data(as_text=True)
+    assert body.index("event: log") < body.index("event: end")
+    assert "building alpha" in body and '"status":"succeeded"' in body
+
+    assert client.get("/dashboard/api/jobs/bad..id/log").status_code in (400, 404)
+    assert client.get("/dashboard/api/jobs/missing/log").status_code == 404
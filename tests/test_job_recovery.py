@@ -0,0 +1,125 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from job_leases import JobLeases
+from job_scheduler import JobScheduler
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class _RecordingHost:
+    host_id = "local"
+
+    def __init__(self):
+        self.calls = []
+
+    def run_manager(self, *args, **kwargs):
+        self.calls.append(args)
+        return subprocess.CompletedProcess(args, 0, "ok\n", "")
+
+
+def _load_app(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("job_recovery_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "JOB_SCHEDULER", JobScheduler(workers=2, host_limit=2))
+    monkeypatch.setattr(module, "JOB_LEASES", JobLeases(lease_seconds=60, owner="current"))
+    return module
+
+
+def _orphan(module, job_id, status="running", attempts=1, owner="previous", expires_at=1):
+    conn = module._users_conn()
+    try:
+        conn.execute(
+            "UPDATE jobs SET status = ?, attempts = ?, lease_owner = ?, lease_expires_at = ? WHERE id = ?",
+            (status, attempts, owner, expires_at, job_id),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _job(client, job_id):
+    return client.get(f"/dashboard/api/jobs/{job_id}").get_json()["job"]
+
+
+def test_restart_requeues_replayable_jobs_and_fails_the_rest(monkeypatch, tmp_path):
+    module = _load_app(monkeypatch, tmp_path)
+    host = _RecordingHost()
+    monkeypatch.setattr(module, "_vm_host", lambda *args, **kwargs: host)
+    client = module.app.test_client()
+
+    rebuild = module._create_job("rebuild-vms", ["alpha"], payload={"host_id": "local", "command": "rebuild-vms", "args": ["alpha"], "flagged": ["alpha"]})
+    legacy = module._create_job("reset-vm", ["beta"])
+    exhausted = module._create_job("update-vm", ["gamma"], payload={"name": "gamma"})
+    alive = module._create_job("prune-blobevm-resources", [], payload={})
+    _orphan(module, rebuild)
+    _orphan(module, legacy)
+    _orphan(module, exhausted, attempts=module.JOB_MAX_ATTEMPTS)
+    _orphan(module, alive, status="queued", owner="other-live-process", expires_at=int(time.time()) + 60)
+    for name, flag in (("alpha", "rebuilding"), ("beta", "rebuilding"), ("gamma", "updating")):
+        module._set_flag(name, flag, True)
+
+    recovered = module.start_job_recovery()
+    assert recovered == {rebuild: "requeued", legacy: "failed", exhausted: "failed"}
+    assert module.start_job_recovery() == {}
+
+    assert _wait_for(lambda: _job(client, rebuild)["status"] == "succeeded")
+    assert host.calls == [("rebuild-vms", "alpha")]
+    assert _job(client, rebuild)["attempts"] == 2
+    assert _job(client, legacy)["error"] == "Interrupted by a dashboard restart"
+    assert "gave up after" in _job(client, exhausted)["error"]
+    assert _job(client, alive)["status"] == "queued"
+    assert not any(module._has_flag(name, flag) for name, flag in (("alpha", "rebuilding"), ("beta", "rebuilding"), ("gamma", "updating")))
+
+
+def test_requeued_bulk_job_skips_vms_that_already_finished(monkeypatch, tmp_path):
+    module = _load_app(monkeypatch, tmp_path)
+    host = _RecordingHost()
+    monkeypatch.setattr(module, "_vm_host", lambda *args, **kwargs: host)
+    client = module.app.test_client()
+
+    payload = {"action": "restart", "host_id": "local", "parallelism": 2, "max_failures": None}
+    parent = module._create_job("bulk-restart", ["vm0", "vm1", "vm2"], payload=payload)
+    children = {name: module._create_job("vm-restart", [name], parent_id=parent) for name in ("vm0", "vm1", "vm2")}
+    module._update_job(children["vm0"], status="succeeded")
+    _orphan(module, parent)
+    _orphan(module, children["vm1"])
+
+    assert module.start_job_recovery() == {parent: "requeued"}
+    assert _wait_for(lambda: _job(client, parent)["status"] == "succeeded")
+    assert sorted(host.calls) == [("restart", "vm1"), ("restart", "vm2")]
+    assert _job(client, parent)["summary"] == {"total": 3, "succeeded": 3}
+
+
+def test_heartbeat_renews_leases_owned_by_this_process(monkeypatch, tmp_path):
+    module = _load_app(monkeypatch, tmp_path)
+    job_id = module._create_job("update-vm", ["alpha"], payload={"name": "alpha"})
+    _orphan(module, job_id, status="queued", owner="current", expires_at=5)
+
+    module._renew_job_leases()
+    conn = module._users_conn()
+    try:
+        row = conn.execute("SELECT lease_expires_at, heartbeat_at FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    finally:
+        conn.close()
+    assert row["lease_expires_at"] > time.time() + 30 and row["heartbeat_at"]
+    assert module._recover_orphaned_jobs() == {}
+    assert "payload" not in module.app.test_client().get(f"/dashboard/api/jobs/{job_id}").get_json()["job"]
+    assert {"rebuild-vms", "update-vm", "bulk-reset", "reset-all-instances"} <= set(module.JOB_HANDLERS)
@@ -0,0 +1,84 @@
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from job_scheduler import PRIORITY_INTERACTIVE, PRIORITY_MAINTENANCE, JobScheduler, parse_type_limits
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_parse_type_limits():
+    assert parse_type_limits("update-vm=3, rebuild-vms=1,bad,x=") == {"update-vm": 3, "rebuild-vms": 1}
+
+
+def test_type_and_host_limits_hold_jobs_in_priority_then_fifo_order():
+    scheduler = JobScheduler(workers=4, host_limit=2, type_limits={"update-vm": 2})
+    gates = {}
+    started = []
+
+    def job(name):
+        gates[name] = threading.Event()
+
+        def run():
+            started.append(name)
+            gates[name].wait(5)
+        return run
+
+    scheduler.submit("rebuild-1", job("rebuild-1"), job_type="rebuild-vms", priority=PRIORITY_MAINTENANCE)
+    assert _wait_for(lambda: started == ["rebuild-1"])
+    scheduler.submit("rebuild-2", job("rebuild-2"), job_type="rebuild-vms", priority=PRIORITY_MAINTENANCE)
+    scheduler.submit("prune", job("prune"), job_type="prune", priority=PRIORITY_MAINTENANCE)
+    scheduler.submit("update-a", job("update-a"), job_type="update-vm", priority=PRIORITY_INTERACTIVE)
+    scheduler.submit("remote", job("remote"), job_type="prune", host_id="lab-pc", priority=PRIORITY_MAINTENANCE)
+
+    # One rebuild at a time, two jobs per host: the interactive update jumps
+    # ahead of the queued maintenance, and the other host is not held back.
+    assert _wait_for(lambda: sorted(started) == ["rebuild-1", "remote", "update-a"])
+    assert scheduler.positions() == {"rebuild-2": 1, "prune": 2}
+    assert scheduler.running_count() == 3
+
+    # Finishing the rebuild makes both queued jobs eligible for the one free
+    # host slot; the earlier one gets it.
+    gates["rebuild-1"].set()
+    assert _wait_for(lambda: len(started) == 4)
+    assert started[-1] == "rebuild-2" and scheduler.positions() == {"prune": 1}
+
+    for gate in gates.values():
+        gate.set()
+    assert _wait_for(lambda: len(started) == 5 and scheduler.running_count() == 0)
+
+
+def test_jobs_endpoint_reports_queued_jobs_with_their_position(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("job_scheduler_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    scheduler = JobScheduler(workers=1, host_limit=1)
+    monkeypatch.setattr(module, "JOB_SCHEDULER", scheduler)
+    gate = threading.Event()
+
+    first = module._start_job("prune-blobevm-resources", [], lambda: gate.wait(5) and (True, "pruned"), host="local")
+    client = module.app.test_client()
+    assert _wait_for(lambda: client.get(f"/dashboard/api/jobs/{first}").get_json()["job"]["status"] == "running")
+    second = module._start_job("update-vm", ["alpha"], lambda: (True, "updated"), host="local")
+
+    jobs = {job["id"]: job for job in client.get("/dashboard/api/jobs").get_json()["jobs"]}
+    assert jobs[first]["status"] == "running"
+    assert jobs[second]["status"] == "queued" and jobs[second]["queuePosition"] == 1
+
+    gate.set()
+    assert _wait_for(lambda: client.get(f"/dashboard/api/jobs/{second}").get_json()["job"]["status"] == "succeeded")
@@ -0,0 +1,102 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from metrics_store import HOST_KEY, TIERS, MetricsStore
+
+
+class FakeClock:
+    def __init__(self, value=1_700_000_040.0):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+    def advance(self, seconds):
+        self.value += seconds
+
+
+def _store(tmp_path, clock):
+    (tmp_path / "stat").write_text("cpu  100 0 100 800 0 0 0 0 0 0\n")
+    (tmp_path / "meminfo").write_text("MemTotal: 1000 kB\nMemAvailable: 750 kB\n")
+    return MetricsStore(clock=clock, proc_stat_path=str(tmp_path / "stat"),
+                        meminfo_path=str(tmp_path / "meminfo"))
+
+
+def _record(name, cpu, mem_bytes=0, net_rx=0):
+    return {"name": name, "cpu_percent": cpu, "mem_percent": 10.0,
+            "mem_bytes": mem_bytes, "net_rx": net_rx, "net_tx": 0,
+            "block_read": 0, "block_write": 0}
+
+
+def test_raw_tier_keeps_vm_samples_and_io_rates(tmp_path):
+    clock = FakeClock()
+    store = _store(tmp_path, clock)
+    store.ingest([_record("blobevm_a", 5.0, 100, net_rx=1000), _record("traefik", 99.0)])
+    clock.advance(2)
+    store.ingest([_record("blobevm_a", 7.0, 200, net_rx=5000)])
+
+    result = store.query("a")
+    assert result["step"] == 2
+    assert result["points"]["ts"] == [clock.value - 2, clock.value]
+    assert result["points"]["cpu_percent"] == [5.0, 7.0]
+    assert result["points"]["mem_bytes"] == [100.0, 200.0]
+    assert result["points"]["net_rx_rate"] == [0.0, 2000.0]
+    assert "traefik" not in store.keys()
+
+
+def test_host_series_uses_proc_counters_and_vm_io_totals(tmp_path):
+    clock = FakeClock()
+    store = _store(tmp_path, clock)
+    store.ingest([_record("blobevm_a", 1.0, net_rx=0)])
+    (tmp_path / "stat").write_text("cpu  150 0 150 900 0 0 0 0 0 0\n")
+    clock.advance(2)
+    store.ingest([_record("blobevm_a", 1.0, net_rx=400)])
+
+    points = store.query(HOST_KEY)["points"]
+    assert points["cpu_percent"] == [0.0, 50.0]
+    assert points["mem_percent"] == [25.0, 25.0]
+    assert points["mem_bytes"] == [256000.0, 256000.0]
+    assert points["net_rx_rate"] == [0.0, 200.0]
+
+
+def test_minute_rollup_averages_and_long_ranges_pick_coarser_tiers(tmp_path):
+    clock = FakeClock(1_700_000_040.0)  # minute-aligned
+    store = _store(tmp_path, clock)
+    for cpu in (10.0, 20.0, 30.0):
+        store.ingest([_record("blobevm_a", cpu)])
+        clock.advance(20)
+    store.ingest([_record("blobevm_a", 90.0)])  # opens the next bucket
+
+    hour = store.query("a", start=clock.value - 3600)
+    assert hour["step"] == 60
+    assert hour["points"]["ts"] == [1_700_000_040.0]
+    assert hour["points"]["cpu_percent"] == [20.0]
+    assert store.query("a", start=clock.value - 7 * 86400)["step"] == 900
+    assert store.query("a", step=60)["step"] == 60
+
+
+def test_raw_ring_is_fixed_size(tmp_path):
+    clock = FakeClock()
+    store = _store(tmp_path, clock)
+    capacity = TIERS[0][1] // TIERS[0][0]
+    for index in range(capacity + 25):
+        store.ingest([_record("blobevm_a", float(index))])
+        clock.advance(2)
+
+    points = store.query("a", start=0, step=2)["points"]
+    assert len(points["ts"]) == capacity
+    assert points["cpu_percent"][0] == 25.0
+    assert points["cpu_percent"][-1] == float(capacity + 24)
+
+
+def test_samples_faster_than_raw_step_are_coalesced_and_unknown_keys_are_empty(tmp_path):
+    clock = FakeClock()
+    store = _store(tmp_path, clock)
+    store.ingest([_record("blobevm_a", 1.0)])
+    clock.advance(0.5)
+    store.ingest([_record("blobevm_a", 2.0)])
+
+    assert store.query("a")["points"]["cpu_percent"] == [1.0]
+    assert store.query("missing")["points"]["ts"] == []
@@ -141,3 +141,27 @@ def test_invalid_metadata_mode_is_normalized_to_auto(tmp_path):
 
     assert result.returncode == 0, result.stderr
     assert "Nested Docker: auto" in result.stdout
+
+
+def test_list_json_reads_all_metadata_into_structured_records(tmp_path):
+    for name in ("vm1", "vm2"):
+        result, _ = run_manager(tmp_path, "create", name)
+        assert result.returncode == 0, result.stderr
+    instances = tmp_path / "state" / "instances"
+    (instances / "vm1" / "instance.json").write_text(json.dumps({
+        "start_docker": "off", "cpu_limit": "2", "mem_limit": "1g", "title": "Build box",
+    }))
+    (instances / "vm2" / "instance.json").write_text(json.dumps({"path_override": "desk"}))
+
+    result, _ = run_manager(tmp_path, "list", "--json")
+
+    assert result.returncode == 0, result.stderr
+    records = {record["name"]: record for record in json.loads(result.stdout)}
+    assert records["vm1"]["nested_docker"] == "off"
+    assert (records["vm1"]["cpu_limit"], records["vm1"]["mem_limit"]) == ("2", "1g")
+    assert records["vm1"]["title"] == "Build box"
+    assert records["vm1"]["status"] == "blobevm_vm1 (stopped)"
+    assert records["vm1"]["running"] is False
+    assert records["vm1"]["url"].endswith("/vm/vm1/")
+    assert records["vm2"]["nested_docker"] == "auto"
+    assert records["vm2"]["url"].endswith("/desk/")
@@ -0,0 +1,78 @@
+import base64
+import hashlib
+import importlib.util
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+import password_hashing
+from password_hashing import PasswordHasher, PasswordHasherBusy
+
+
+def _legacy_hash(password, salt="legacysalt"):
+    dk = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), 260000)
+    return f"pbkdf2_sha256${salt}${base64.b64encode(dk).decode('ascii')}"
+
+
+def test_legacy_hashes_verify_and_are_upgraded_to_the_tuned_cost():
+    hasher = PasswordHasher(iterations=2000, workers=1)
+    ok, upgraded = hasher.verify("correct horse", _legacy_hash("correct horse"))
+    assert ok and upgraded.startswith("pbkdf2_sha256$2000$")
+    assert hasher.verify("correct horse", upgraded) == (True, None)
+    assert hasher.verify("wrong", upgraded) == (False, None)
+    assert hasher.verify("x", "md5$nope") == (False, None)
+
+
+def test_saturated_pool_rejects_instead_of_queueing():
+    hasher = PasswordHasher(iterations=1000, workers=1, max_waiting=0)
+    started, release = threading.Event(), threading.Event()
+    original = password_hashing._derive
+
+    def slow_derive(*args):
+        started.set()
+        release.wait(5)
+        return original(*args)
+
+    stored = hasher.hash("pw")
+    password_hashing._derive = slow_derive
+    try:
+        worker = threading.Thread(target=hasher.verify, args=("pw", stored))
+        worker.start()
+        assert started.wait(5)
+        with pytest.raises(PasswordHasherBusy):
+            hasher.verify("pw", stored)
+    finally:
+        release.set()
+        worker.join()
+        password_hashing._derive = original
+
+
+def test_portal_login_answers_429_when_busy_and_rehashes_on_success(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_USER_SECRET", "portal-secret")
+    spec = importlib.util.spec_from_file_location("password_hashing_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "_validate_known_vm_names", lambda names: None)
+    monkeypatch.setattr(module, "PASSWORD_HASHER", PasswordHasher(iterations=1000, workers=1))
+    module._create_user("student", "long-enough-password")
+    module._rehash_user_password(module._get_user_by_username("student")["id"], _legacy_hash("long-enough-password"))
+    client = module.app.test_client()
+    origin = {"Origin": "http://localhost"}
+
+    assert client.post("/portal/api/auth/login", json={"username": "student", "password": "nope"}, headers=origin).status_code == 401
+    assert client.post("/portal/api/auth/login", json={"username": "student", "password": "long-enough-password"}, headers=origin).status_code == 200
+    assert module._get_user_by_username("student")["password_hash"].startswith("pbkdf2_sha256$1000$")
+
+    def busy(password, stored):
+        raise PasswordHasherBusy("busy")
+
+    monkeypatch.setattr(module.PASSWORD_HASHER, "verify", busy)
+    response = client.post("/portal/api/auth/login", json={"username": "student", "password": "long-enough-password"}, headers=origin)
+    assert response.status_code == 429 and response.headers["Retry-After"] == "1"
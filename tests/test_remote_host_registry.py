@@ -606,3 +606,58 @@ def test_create_rechecks_remote_placement_and_capability(monkeypatch, tmp_path):
         json={"name": "alpha", "placement": "local", "host_id": "epic-pc"},
     )
     assert mismatch.status_code == 400
+
+
+def test_fleet_inventory_fans_out_and_serves_late_hosts_as_stale(monkeypatch, tmp_path):
+    import importlib
+    import threading
+    import time
+
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    module = importlib.import_module("dashboard.app")
+    release = threading.Event()
+    slow_calls = []
+
+    class FakeRegistry:
+        providers = {"local": object(), "fast-pc": object(), "slow-pc": object(), "broken-pc": object()}
+
+        def refresh(self):
+            return None
+
+        def cached_inventory(self, host_id):
+            assert host_id == "slow-pc"
+            return [{"name": "late", "status": "running", "host_id": "slow-pc"}]
+
+    def fake_list(host_id=None):
+        if host_id is None:
+            time.sleep(0.05)
+            return [{"name": "here", "host_id": "local"}]
+        if host_id == "fast-pc":
+            return [{"name": "quick", "host_id": "fast-pc"}]
+        if host_id == "broken-pc":
+            raise VmHostUnavailable("agent offline")
+        slow_calls.append(threading.current_thread().name)
+        release.wait(5)
+        return []
+
+    monkeypatch.setattr(module, "VM_HOST_REGISTRY", FakeRegistry())
+    monkeypatch.setattr(module, "manager_json_list", fake_list)
+    monkeypatch.setattr(module, "_external_base_url", lambda: "https://dash.example")
+
+    started = time.monotonic()
+    try:
+        instances, timings = module.manager_json_fleet_inventory(deadline=0.2)
+        again, _ = module.manager_json_fleet_inventory(deadline=0.05)
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 2
+    assert len(slow_calls) == 1 and again[-1]["stale"] is True
+    assert [item["name"] for item in instances] == ["here", "quick", "late"]
+    assert instances[-1]["stale"] is True
+    assert instances[-1]["url"] == "https://dash.example/vm/late/?host_id=slow-pc"
+    by_host = {timing["host_id"]: timing for timing in timings}
+    assert by_host["slow-pc"]["stale"] is True and by_host["slow-pc"]["count"] == 1
+    assert by_host["fast-pc"]["stale"] is False and by_host["fast-pc"]["count"] == 1
+    assert by_host["broken-pc"]["error"] == "agent offline"
+    assert by_host["local"]["elapsed_ms"] >= 50
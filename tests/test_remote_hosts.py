@@ -1,5 +1,8 @@
+import json
 import os
+import subprocess
 import sys
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -32,9 +35,18 @@ def test_local_provider_preserves_manager_commands(monkeypatch):
 
 def test_local_inventory_items_have_non_breaking_placement_metadata(monkeypatch):
     def fake_check_output(argv, **kwargs):
-        assert argv == ["/custom/blobe-vm-manager", "list"]
-        assert kwargs == {"text": True}
-        return "- alpha -> running -> http://127.0.0.1:20001/\n"
+        assert argv == ["/custom/blobe-vm-manager", "list", "--json"]
+        assert kwargs == {"text": True, "stderr": subprocess.DEVNULL}
+        return json.dumps([
+            {
+                "name": "alpha",
+                "status": "running",
+                "url": "http://127.0.0.1:20001/",
+                "port": "20001",
+                "nested_docker": "auto",
+                "title": None,
+            }
+        ])
 
     monkeypatch.setattr("dashboard.vm_hosts.subprocess.check_output", fake_check_output)
     host = LocalDockerHost(manager="/custom/blobe-vm-manager")
@@ -46,6 +58,8 @@ def test_local_inventory_items_have_non_breaking_placement_metadata(monkeypatch)
             "name": "alpha",
             "status": "running",
             "url": "http://127.0.0.1:20001/",
+            "port": "20001",
+            "nested_docker": "auto",
             "placement": "local",
             "host_id": "local",
             "host_name": "EpicVM Server",
@@ -54,6 +68,27 @@ def test_local_inventory_items_have_non_breaking_placement_metadata(monkeypatch)
     ]
 
 
+def test_local_inventory_falls_back_to_legacy_text_listing(monkeypatch):
+    calls = []
+
+    def fake_check_output(argv, **kwargs):
+        calls.append(argv[1:])
+        if "--json" in argv:
+            raise subprocess.CalledProcessError(1, argv)
+        assert kwargs == {"text": True}
+        return "Instances:\n- alpha -> running -> http://127.0.0.1:20001/\n"
+
+    monkeypatch.setattr("dashboard.vm_hosts.subprocess.check_output", fake_check_output)
+    host = LocalDockerHost(manager="/custom/blobe-vm-manager")
+
+    inventory = host.list_vms()
+
+    assert calls == [["list", "--json"], ["list"]]
+    assert [(item["name"], item["status"], item["url"]) for item in inventory] == [
+        ("alpha", "running", "http://127.0.0.1:20001/")
+    ]
+
+
 def test_vm_host_registry_looks_up_local_provider_and_rejects_unknown_hosts():
     host = LocalDockerHost(manager="/custom/blobe-vm-manager")
     registry = VmHostRegistry([host])
@@ -126,13 +161,18 @@ def test_dashboard_bulk_recreate_uses_registered_provider(monkeypatch, tmp_path)
         return SimpleNamespace(returncode=0, stdout="direct\n", stderr="")
 
     monkeypatch.setattr(module.LOCAL_VM_HOST, "run_manager", fake_provider_run)
+    monkeypatch.setattr(module.LOCAL_VM_HOST, "stream_manager", None)
     monkeypatch.setattr(module.subprocess, "run", fake_subprocess_run)
+    client = module.app.test_client()
 
-    response = module.app.test_client().post(
-        "/dashboard/api/recreate", json={"names": ["alpha"]}
-    )
+    response = client.post("/dashboard/api/recreate", json={"names": ["alpha"]})
 
-    assert response.status_code == 200
+    assert response.status_code == 202
+    job_url = f"/dashboard/api/jobs/{response.get_json()['jobId']}"
+    deadline = time.time() + 5
+    while client.get(job_url).get_json()["job"]["status"] != "succeeded" and time.time() < deadline:
+        time.sleep(0.01)
+    assert client.get(job_url).get_json()["job"]["summary"] == {"total": 1, "succeeded": 1}
     assert provider_calls == [
         (("recreate", "alpha"), {"capture_output": True, "text": True})
     ]
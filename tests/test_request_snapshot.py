@@ -0,0 +1,68 @@
+import importlib.util
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from request_snapshot import RequestSnapshot
+
+
+def test_snapshot_loads_each_key_once_and_copies_private_values():
+    snapshot = RequestSnapshot()
+    loads = []
+    loader = lambda: loads.append(1) or [{"name": "alpha"}]
+
+    shared = snapshot.get("inventory", loader, private=True)
+    shared[0]["name"] = "mutated"
+    assert snapshot.get("inventory", loader, private=True) == [{"name": "alpha"}]
+    assert loads == [1] and "inventory" in snapshot
+
+    snapshot.clear()
+    snapshot.get("inventory", loader)
+    assert loads == [1, 1]
+
+
+def test_one_request_gathers_optimizer_status_and_inventory_once(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("request_snapshot_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+    counts = {"status": 0, "list": 0}
+    names = ["vm%d" % index for index in range(6)]
+
+    def fake_status():
+        counts["status"] += 1
+        return {"stats": {"vmStates": [{"name": name, "profile": "desktop"} for name in names]}}
+
+    def fake_list():
+        counts["list"] += 1
+        return [{"name": name, "status": "running", "url": ""} for name in names]
+
+    docs = [{"Name": f"/blobevm_{name}", "State": {"Running": True, "Status": "running"}} for name in names]
+    monkeypatch.setattr(module, "_docker", lambda *args: SimpleNamespace(returncode=0, stdout=json.dumps(docs), stderr=""))
+    monkeypatch.setattr(module.dash_optimizer, "status", fake_status)
+    monkeypatch.setattr(module.dash_optimizer, "get_vm_notifications", lambda name: [])
+    monkeypatch.setattr(module.LOCAL_VM_HOST, "list_vms", fake_list)
+    monkeypatch.setattr(module.INVENTORY_CACHE, "ttl", 0)
+
+    with module.app.test_request_context("/portal/api/vms"):
+        for name in names:
+            assert module._vm_status_payload(name)["profile"] == "desktop"
+        for name in names:
+            assert module._portal_vm_payload(name)["name"] == name
+        assert counts == {"status": 1, "list": 1}
+
+        module._invalidate_inventory("local")
+        module.manager_json_list()
+        module._vm_status_payload("vm0")
+        assert counts == {"status": 2, "list": 2}
+
+    with module.app.test_request_context("/portal/api/vms"):
+        module._vm_status_payload("vm0")
+        assert counts["status"] == 3
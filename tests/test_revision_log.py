@@ -0,0 +1,73 @@
+import importlib.util
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from revision_log import RevisionLog
+
+
+def test_revision_only_moves_when_items_change():
+    log = RevisionLog()
+    first = log.observe("list", [{"name": "a", "status": "running"}])
+    assert log.observe("list", [{"name": "a", "status": "running"}]) == first
+    second = log.observe("list", [{"name": "a", "status": "stopped"}])
+    assert second > first
+
+
+def test_delta_reports_changed_and_removed_since_a_revision():
+    log = RevisionLog()
+    base = log.observe("list", [{"name": "a"}, {"name": "b"}, {"name": "c", "host_id": "pc"}])
+    items = [{"name": "a", "status": "up"}, {"name": "c", "host_id": "pc"}, {"name": "d"}]
+    current = log.observe("list", items)
+
+    delta = log.delta("list", base, items)
+    assert delta["changed"] == [{"name": "a", "status": "up"}, {"name": "d"}]
+    assert delta["removed"] == [{"host_id": "local", "name": "b"}]
+    assert log.delta("list", current, items)["changed"] == []
+
+
+def test_unknown_or_expired_cursors_need_a_full_payload():
+    log = RevisionLog(max_tombstones=1)
+    base = log.observe("list", [{"name": "a"}, {"name": "b"}, {"name": "c"}])
+    assert log.delta("list", base - 1, []) is None
+    assert log.delta("list", base + 100, []) is None
+    assert log.delta("other", base, []) is None
+
+    middle = log.observe("list", [{"name": "b"}, {"name": "c"}])
+    log.observe("list", [{"name": "c"}])
+    # Only the newest removal is remembered; older cursors lost "a".
+    assert log.delta("list", base, []) is None
+    assert log.delta("list", middle, [])["removed"] == [{"host_id": "local", "name": "b"}]
+
+
+def test_list_endpoint_answers_304_and_deltas(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("revision_log_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "INVENTORY_REVISIONS", RevisionLog())
+    inventory = [{"name": "alpha", "status": "running"}, {"name": "beta", "status": "running"}]
+    monkeypatch.setattr(module, "manager_json_list", lambda: [dict(item) for item in inventory])
+    client = module.app.test_client()
+
+    first = client.get("/Dashboard/api/list")
+    etag = first.headers["ETag"]
+    revision = first.get_json()["revision"]
+    assert first.headers["X-Inventory-Revision"] == str(revision)
+
+    cached = client.get("/Dashboard/api/list", headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.data == b""
+
+    inventory[1] = {"name": "beta", "status": "stopped"}
+    changed = client.get(f"/Dashboard/api/list?since={revision}", headers={"If-None-Match": etag})
+    body = changed.get_json()
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+    assert body["delta"] is True and "instances" not in body
+    assert body["changed"] == [{"name": "beta", "status": "stopped"}]
+    assert body["revision"] > revision
+
+    assert client.get("/Dashboard/api/list?since=1").get_json()["instances"] == inventory
@@ -1,14 +1,23 @@
+import json
 import math
 import os
+import socketserver
 import sys
 import threading
 import time
+from http.server import BaseHTTPRequestHandler
 
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
 
-from runtime_stats import DOCKER_STATS_COMMAND, DockerStatsCache, get_docker_stats
+from runtime_stats import (
+    DOCKER_STATS_COMMAND,
+    DockerEngineClient,
+    DockerStatsCache,
+    get_docker_stats,
+    start_docker_stats_sampler,
+)
 
 
 class FakeClock:
@@ -22,23 +31,38 @@ class FakeClock:
         self.value += seconds
 
 
+MIB = 1024 * 1024
+GIB = 1024 * MIB
+
+
+def typed(name, cpu, mem, mem_bytes, mem_limit=GIB, **extra):
+    record = {
+        "name": name, "cpu_percent": cpu, "mem_percent": mem,
+        "mem_bytes": mem_bytes, "mem_limit": mem_limit, "swap_bytes": 0,
+        "net_rx": 0, "net_tx": 0, "block_read": 0, "block_write": 0, "pids": 0,
+        "sample_seq": 1, "sample_age": 0.0,
+    }
+    record.update(extra)
+    return record
+
+
 def test_cache_hit_within_ttl_and_parses_canonical_records():
     calls = []
     clock = FakeClock()
 
     def runner(argv):
         calls.append(argv)
-        return "blobevm_a|12.5%|3.25%|12.3MiB / 1GiB\n"
+        return "blobevm_a|12.5%|3.25%|12.3MiB / 1GiB|1.5kB / 648B|4.1MB / 0B|27\n"
 
     cache = DockerStatsCache(runner=runner, clock=clock, ttl=2)
     first = cache.get()
     clock.advance(1.9)
     second = cache.get()
 
-    assert first == second == [{
-        "name": "blobevm_a", "cpu_percent": 12.5,
-        "mem_percent": 3.25, "mem_usage": "12.3MiB / 1GiB",
-    }]
+    record = typed("blobevm_a", 12.5, 3.25, round(12.3 * MIB), net_rx=1500,
+                   net_tx=648, block_read=4_100_000, pids=27)
+    assert first == [record]
+    assert second == [{**record, "sample_age": 1.9}]
     assert len(calls) == 1
     assert calls[0] == list(DOCKER_STATS_COMMAND)
 
@@ -53,10 +77,7 @@ def test_cached_records_are_not_mutable_through_return_value():
     first = cache.get()
     first[0]["name"] = "corrupted"
 
-    assert cache.get() == [{
-        "name": "a", "cpu_percent": 1.0, "mem_percent": 2.0,
-        "mem_usage": "3MiB / 1GiB",
-    }]
+    assert cache.get() == [typed("a", 1.0, 2.0, 3 * MIB)]
 
 
 def test_cache_expires_after_ttl():
@@ -98,7 +119,8 @@ def test_concurrent_get_is_single_flight():
         thread.join()
 
     assert len(calls) == 1
-    assert results == [[{"name": "a", "cpu_percent": 1.0, "mem_percent": 2.0, "mem_usage": "3MiB / 1GiB"}]] * 2
+    for result in results:
+        assert [{**record, "sample_age": 0.0} for record in result] == [typed("a", 1.0, 2.0, 3 * MIB)]
 
 
 def test_failed_refresh_uses_successful_value_for_ten_seconds_then_empty():
@@ -127,10 +149,19 @@ def test_malformed_and_nonfinite_metrics_are_ignored():
         clock=FakeClock(),
         ttl=2,
     )
-    assert cache.get() == [{
-        "name": "c", "cpu_percent": 3.0, "mem_percent": 4.0,
-        "mem_usage": "5MiB / 1GiB",
-    }]
+    assert cache.get() == [typed("c", 3.0, 4.0, 5 * MIB)]
+
+
+def test_cli_sizes_are_parsed_once_with_binary_and_decimal_units():
+    cache = DockerStatsCache(
+        runner=lambda argv: "a|1%|2%|1.5GiB / 2GiB|2.5GB / 1MB|-- / --|--\n",
+        clock=FakeClock(),
+        ttl=2,
+    )
+    record = cache.get()[0]
+    assert record["mem_bytes"] == round(1.5 * GIB) and record["mem_limit"] == 2 * GIB
+    assert record["net_rx"] == 2_500_000_000 and record["net_tx"] == 1_000_000
+    assert record["block_read"] == record["block_write"] == record["pids"] == 0
 
 
 def test_ttl_environment_is_bounded(monkeypatch):
@@ -150,8 +181,181 @@ def test_module_helper_uses_fixed_command_without_shell(monkeypatch):
         seen["kwargs"] = kwargs
         return "a|1%|2%|3MiB / 1GiB\n"
 
+    monkeypatch.setenv("BLOBEVM_DOCKER_STATS_BACKEND", "cli")
     monkeypatch.setattr("runtime_stats.subprocess.check_output", fake_check_output)
     get_docker_stats.cache_clear()
     assert get_docker_stats() and seen["argv"] == list(DOCKER_STATS_COMMAND)
     assert seen["kwargs"] == {"text": True}
     get_docker_stats.cache_clear()
+
+
+def test_sampler_refreshes_in_background_and_readers_do_not_block():
+    sampled = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def runner(argv):
+        calls.append(argv)
+        if len(calls) == 2:
+            sampled.set()
+            release.wait(2)
+        return f"a|{len(calls)}%|2%|3MiB / 1GiB\n"
+
+    cache = DockerStatsCache(runner=runner, ttl=0.5)
+    assert cache.refresh()
+    assert cache.start_sampler()
+    assert not cache.start_sampler()
+    try:
+        assert sampled.wait(2)
+        # The sampler is stuck inside the slow refresh; readers still get
+        # the previous snapshot immediately.
+        started = time.monotonic()
+        record = cache.get()[0]
+        assert time.monotonic() - started < 0.2
+        assert record["sample_seq"] == 1 and record["cpu_percent"] == 1.0
+        release.set()
+        deadline = time.monotonic() + 2
+        while cache.get()[0]["sample_seq"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.get()[0]["sample_seq"] >= 2
+    finally:
+        release.set()
+        cache.stop_sampler(timeout=2)
+    assert not cache.sampler_running()
+
+
+def test_sampler_is_opt_in_through_environment(monkeypatch):
+    monkeypatch.setattr("runtime_stats.subprocess.check_output", lambda argv, **kwargs: "")
+    monkeypatch.setenv("BLOBEVM_DOCKER_STATS_BACKEND", "cli")
+    monkeypatch.delenv("BLOBEVM_DOCKER_STATS_SAMPLER", raising=False)
+    get_docker_stats.cache_clear()
+    assert not start_docker_stats_sampler()
+    monkeypatch.setenv("BLOBEVM_DOCKER_STATS_SAMPLER", "1")
+    try:
+        assert start_docker_stats_sampler()
+    finally:
+        get_docker_stats.cache_clear()
+
+
+ENGINE_STATS = {
+    "cpu_stats": {
+        "cpu_usage": {"total_usage": 3_000_000},
+        "system_cpu_usage": 40_000_000,
+        "online_cpus": 4,
+    },
+    "precpu_stats": {
+        "cpu_usage": {"total_usage": 2_000_000},
+        "system_cpu_usage": 20_000_000,
+    },
+    "memory_stats": {
+        "usage": 140 * 1024 * 1024,
+        "limit": 1024 * 1024 * 1024,
+        "stats": {"inactive_file": 12 * 1024 * 1024},
+    },
+    "networks": {"eth0": {"rx_bytes": 100, "tx_bytes": 40}, "eth1": {"rx_bytes": 1, "tx_bytes": 2}},
+    "blkio_stats": {"io_service_bytes_recursive": [
+        {"major": 8, "minor": 0, "op": "read", "value": 4096},
+        {"major": 8, "minor": 0, "op": "write", "value": 512},
+    ]},
+    "pids_stats": {"current": 31},
+}
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def engine_socket(tmp_path):
+    seen = {"paths": [], "connections": 0, "stats": [ENGINE_STATS]}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            seen["connections"] += 1
+
+        def do_GET(self):
+            seen["paths"].append(self.path)
+            if self.path == "/containers/json":
+                body = [{"Id": "abc123", "Names": ["/blobevm_a"]}]
+            elif self.path == "/containers/abc123/stats?stream=false&one-shot=true":
+                body = seen["stats"].pop(0) if len(seen["stats"]) > 1 else seen["stats"][0]
+            else:
+                self.send_error(404)
+                return
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    path = str(tmp_path / "docker.sock")
+    server = _UnixServer(path, Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path, seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_engine_backend_emits_typed_records(engine_socket):
+    path, seen = engine_socket
+    calls = []
+    client = DockerEngineClient(socket_path=path, max_workers=1)
+    cache = DockerStatsCache(
+        runner=lambda argv: calls.append(argv) or "",
+        clock=FakeClock(), ttl=2, engine=client,
+    )
+
+    assert cache.get() == [typed(
+        "blobevm_a", 20.0, 12.5, 128 * MIB, net_rx=101, net_tx=42,
+        block_read=4096, block_write=512, pids=31,
+    )]
+    assert calls == []
+    assert seen["paths"] == ["/containers/json", "/containers/abc123/stats?stream=false&one-shot=true"]
+
+
+def _one_shot(total_usage, system_cpu_usage):
+    return dict(ENGINE_STATS, precpu_stats={},
+                cpu_stats={"cpu_usage": {"total_usage": total_usage}, "system_cpu_usage": system_cpu_usage, "online_cpus": 4})
+
+
+def test_engine_one_shot_reads_compute_cpu_from_the_previous_refresh(engine_socket):
+    path, seen = engine_socket
+    seen["stats"] = [_one_shot(1_000_000, 10_000_000), _one_shot(2_000_000, 20_000_000), _one_shot(3_000_000, 40_000_000)]
+    client = DockerEngineClient(socket_path=path, max_workers=1, prime_interval=0.01)
+
+    # First sight primes a baseline with a second one-shot read.
+    assert client.container_stats()[0]["cpu_percent"] == 40.0
+    assert client.container_stats()[0]["cpu_percent"] == 20.0
+    assert seen["paths"].count("/containers/abc123/stats?stream=false&one-shot=true") == 3
+
+
+def test_engine_client_reuses_its_connection(engine_socket):
+    path, seen = engine_socket
+    client = DockerEngineClient(socket_path=path)
+    for _ in range(3):
+        assert client.get_json("/containers/json")[0]["Id"] == "abc123"
+    assert seen["connections"] == 1
+
+
+def test_missing_engine_socket_falls_back_to_cli(tmp_path):
+    calls = []
+
+    def runner(argv):
+        calls.append(argv)
+        return "a|1%|2%|3MiB / 1GiB\n"
+
+    cache = DockerStatsCache(
+        runner=runner, clock=FakeClock(), ttl=2,
+        engine=DockerEngineClient(socket_path=str(tmp_path / "missing.sock")),
+    )
+    assert cache.get()[0]["name"] == "a"
+    assert calls == [list(DOCKER_STATS_COMMAND)]
+    assert cache.last_error is None
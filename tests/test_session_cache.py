@@ -0,0 +1,58 @@
+import importlib.util
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from session_cache import VerifiedTokenCache
+
+
+def test_entries_expire_with_the_token_and_are_keyed_by_secret():
+    now = [1000.0]
+    cache = VerifiedTokenCache(max_age=60, clock=lambda: now[0])
+    cache.put("portal", "s1", "tok", 1010, {"username": "a"}, cache.generation())
+    assert cache.get("portal", "s1", "tok") == {"username": "a"}
+    assert cache.get("portal", "s2", "tok") is None
+    now[0] = 1010
+    assert cache.get("portal", "s1", "tok") is None
+
+    generation = cache.generation()
+    cache.invalidate()
+    cache.put("portal", "s1", "tok", 5000, {"username": "a"}, generation)
+    assert cache.get("portal", "s1", "tok") is None
+
+
+def test_verified_sessions_skip_crypto_and_db_until_the_user_changes(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_USER_SECRET", "portal-secret")
+    monkeypatch.setenv("DASH_V2_SECRET", "dash-secret")
+    spec = importlib.util.spec_from_file_location("session_cache_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "SESSION_TOKENS", VerifiedTokenCache(max_age=60))
+    monkeypatch.setattr(module, "_validate_known_vm_names", lambda names: None)
+    monkeypatch.setattr(module, "_hash_user_password", lambda password, salt=None: "pbkdf2_sha256$1$salt$fast")
+    module._create_user("viewer", "long-enough-password", assigned_vms=["alpha"])
+    portal_token = module._create_portal_token("viewer", False)
+    dashboard_token = module._sign_v2_token(f"{int(time.time()) + 3600}:nonce")
+
+    lookups, macs = [], []
+    real_lookup, real_hmac_new = module._get_user_by_username, module.hmac.new
+    monkeypatch.setattr(module, "_get_user_by_username", lambda name: lookups.append(name) or real_lookup(name))
+    monkeypatch.setattr(module.hmac, "new", lambda *args, **kwargs: macs.append(1) or real_hmac_new(*args, **kwargs))
+
+    for _ in range(10):
+        assert module._verify_portal_token(portal_token)["assignedVms"] == ["alpha"]
+        assert module._verify_v2_token(dashboard_token) is True
+    assert len(lookups) == 1 and len(macs) == 2
+    assert module._verify_v2_token(dashboard_token + "x") is False
+
+    module._update_user("viewer", disabled=True)
+    assert module._verify_portal_token(portal_token) is None
+    module._update_user("viewer", disabled=False, assigned_vms=[])
+    assert module._verify_portal_token(portal_token)["assignedVms"] == []
+    module._delete_user("viewer")
+    assert module._verify_portal_token(portal_token) is None
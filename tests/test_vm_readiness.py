@@ -0,0 +1,124 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dashboard"))
+
+from vm_readiness import ReadinessWaiter
+
+
+def test_container_event_cuts_the_backoff_short_and_boot_time_is_recorded():
+    waiter = ReadinessWaiter(initial_delay=30, max_delay=30)
+    state = {"up": False}
+    started = waiter.now()
+
+    def come_up():
+        state["up"] = True
+        waiter.notify("alpha")
+
+    threading.Timer(0.05, come_up).start()
+    began = time.monotonic()
+    result = waiter.wait("alpha", lambda: (state["up"], "probe"), timeout=10, started_at=started, source="start")
+
+    assert result["ready"] is True and result["probes"] == 2
+    assert time.monotonic() - began < 5
+    assert waiter.boot_time("alpha")["source"] == "start"
+    assert waiter.boot_time("alpha")["seconds"] == result["seconds"]
+
+
+def test_backoff_probes_until_the_deadline():
+    waiter = ReadinessWaiter(initial_delay=0.01, max_delay=0.04)
+    result = waiter.wait("beta", lambda: (False, {"running": False}), timeout=0.2)
+
+    assert result["ready"] is False and result["detail"] == {"running": False}
+    assert 3 <= result["probes"] < 20
+    assert waiter.boot_time("beta") is None
+    assert waiter.wait("beta", lambda: (False, None), timeout=0)["probes"] == 1
+
+
+def test_recovery_returns_when_the_vm_serves_instead_of_sleeping(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("vm_readiness_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "VM_READINESS", ReadinessWaiter(initial_delay=0.01, max_delay=0.02))
+
+    class Host:
+        host_id = "local"
+
+        def run_manager(self, *args, **kwargs):
+            return subprocess.CompletedProcess(args, 0, "", "")
+
+    status = {"running": False, "healthy": False, "state": "exited"}
+    probes = []
+
+    def probe(name):
+        probes.append(name)
+        if len(probes) == 3:
+            status.update(running=True, healthy=True, state="running")
+        return status["running"], dict(status)
+
+    events = []
+    monkeypatch.setattr(module, "_vm_ready_probe", probe)
+    monkeypatch.setattr(module, "_vm_status_payload", lambda name: dict(status))
+    monkeypatch.setattr(module.EVENT_BUS, "publish", lambda kind, data: events.append((kind, data)))
+    began = time.monotonic()
+    result = module._recover_vm("alpha", aggressive=False, host=Host())
+
+    assert time.monotonic() - began < 1.0
+    assert result["recovered"] is True and result["message"] == "VM recovered via start"
+    assert result["bootSeconds"] is not None and len(probes) == 3
+    assert module.VM_READINESS.boot_time("alpha")["source"] == "recover:start"
+    assert ("vm", {"name": "alpha", "action": "ready", "exists": True, "running": True, "state": "running",
+                   "health": "", "bootSeconds": result["bootSeconds"]}) in events
+
+
+def test_probe_needs_a_serving_response_and_check_waits_briefly(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("vm_readiness_check_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+    codes = {"http://blobevm_alpha:3000/vm/alpha/": 404, "https://dash.example/vm/alpha/": 200}
+    monkeypatch.setattr(module, "_docker_inspect_vms", lambda names: {"alpha": ({}, None)})
+    monkeypatch.setattr(module, "_vm_status_from_inspect", lambda name, info, err: {"running": True, "healthy": True})
+    monkeypatch.setattr(module, "_vm_path_prefix", lambda name: f"/vm/{name}")
+    monkeypatch.setattr(module.socket, "getaddrinfo", lambda *args: [])
+    monkeypatch.setattr(module, "_http_check", lambda url, timeout=8.0: codes.get(url, 0))
+
+    assert module._vm_ready_probe("alpha")[0] is False
+    codes["http://blobevm_alpha:3000/vm/alpha/"] = 200
+    codes["https://dash.example/vm/alpha/"] = 404
+    ready, status = module._vm_ready_probe("alpha", url="https://dash.example/vm/alpha/")
+    assert ready is False and status["urlCode"] == 404
+
+    waits = []
+
+    def fake_wait(name, started_at=None, source="", timeout=None, url=""):
+        waits.append((timeout, url))
+        return {"ready": True, "seconds": 1.5, "probes": 2, "detail": {"urlCode": 200}}
+
+    class Host:
+        host_id = "local"
+
+        def run_manager(self, *args, **kwargs):
+            return subprocess.CompletedProcess(args, 0, "", "")
+
+    monkeypatch.setattr(module, "_wait_vm_ready", fake_wait)
+    monkeypatch.setattr(module, "_vm_host", lambda *args, **kwargs: Host())
+    monkeypatch.setattr(module, "_build_vm_url", lambda name: "https://dash.example/vm/alpha/")
+    monkeypatch.setattr(module, "_docker", lambda *args: subprocess.CompletedProcess(args, 0, "", ""))
+    codes["https://dash.example/vm/alpha/"] = 502
+    body = module.app.test_client().post("/dashboard/api/check/alpha").get_json()
+
+    assert body == {"ok": True, "code": 200, "url": "https://dash.example/vm/alpha/", "fixed": True, "bootSeconds": 1.5}
+    assert waits == [(module.CHECK_READY_TIMEOUT, "https://dash.example/vm/alpha/")]
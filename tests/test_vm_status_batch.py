@@ -0,0 +1,75 @@
+import importlib.util
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+
+def _inspect(name, running=True, port="20001", exit_code=0):
+    return {
+        "Name": f"/blobevm_{name}",
+        "State": {"Running": running, "Status": "running" if running else "exited", "ExitCode": exit_code},
+        "NetworkSettings": {"Ports": {"3000/tcp": [{"HostIp": "0.0.0.0", "HostPort": port}] if running else None}},
+    }
+
+
+@pytest.fixture
+def status_app(monkeypatch, tmp_path):
+    dashboard_dir = os.path.join(os.path.dirname(__file__), "..", "dashboard")
+    if dashboard_dir not in sys.path:
+        sys.path.insert(0, dashboard_dir)
+    monkeypatch.setenv("BLOBEDASH_STATE", str(tmp_path))
+    monkeypatch.setenv("BLOBEVM_ALLOW_INSECURE_DASHBOARD", "1")
+    spec = importlib.util.spec_from_file_location("vm_status_batch_test_app", os.path.join(dashboard_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+    calls = {"docker": [], "optimizer": 0}
+
+    def fake_docker(*args):
+        calls["docker"].append(args)
+        assert args[0] == "inspect", "per-VM docker port must not run"
+        docs = [_inspect("alpha"), _inspect("beta", running=False, exit_code=137)]
+        return SimpleNamespace(returncode=1, stdout=json.dumps(docs),
+                               stderr="Error: No such object: blobevm_gone\n")
+
+    def fake_status():
+        calls["optimizer"] += 1
+        return {"stats": {"vmStates": [{"name": "alpha", "recoveryState": "watching", "profile": "gaming"}]}}
+
+    monkeypatch.setattr(module, "_docker", fake_docker)
+    monkeypatch.setattr(module.dash_optimizer, "status", fake_status)
+    monkeypatch.setattr(module.dash_optimizer, "get_vm_notifications", lambda name: [])
+    return module, calls
+
+
+def test_batch_uses_one_inspect_and_one_optimizer_snapshot(status_app):
+    module, calls = status_app
+
+    payloads = module._vm_status_payloads(["alpha", "beta", "gone", "alpha"])
+
+    assert list(payloads) == ["alpha", "beta", "gone"]
+    assert calls["docker"] == [("inspect", "blobevm_alpha", "blobevm_beta", "blobevm_gone")]
+    assert calls["optimizer"] == 1
+    assert payloads["alpha"]["running"] and payloads["alpha"]["port"] == "20001"
+    assert payloads["alpha"]["recoveryState"] == "watching" and payloads["alpha"]["profile"] == "gaming"
+    assert payloads["beta"]["crashed"] and payloads["beta"]["port"] == ""
+    assert payloads["gone"]["exists"] is False
+    assert payloads["gone"]["detail"] == "Error: No such object: blobevm_gone"
+
+
+def test_vms_status_endpoint_returns_payloads_keyed_by_name(status_app, monkeypatch):
+    module, calls = status_app
+    monkeypatch.setattr(module, "manager_json_list", lambda host_id=None: [{"name": "beta"}, {"name": "alpha"}])
+    client = module.app.test_client()
+
+    body = client.get("/Dashboard/api/vms/status?names=alpha,beta").get_json()
+    assert body["ok"] is True and set(body["vms"]) == {"alpha", "beta"}
+    assert body["vms"]["beta"]["status"] == "exited"
+
+    everything = client.get("/dashboard/api/vms/status").get_json()
+    assert list(everything["vms"]) == ["alpha", "beta"]
+    assert len(calls["docker"]) == 2 and calls["optimizer"] == 2